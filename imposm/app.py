@@ -42,6 +42,9 @@ import imposm.version
 from imposm.writer import ImposmWriter
 from imposm.db.config import DB
 from imposm.cache import OSMCache
+from imposm.cache.osm import COMPACT_FRAGMENTATION, cache_names
+from imposm.cache.tc import available_compression_codecs
+from imposm.cache.report import cache_file_stats, format_file_stats
 from imposm.reader import ImposmReader
 from imposm.mapping import TagMapper
 
@@ -63,6 +66,27 @@ def setup_logging():
 
 __version__ = imposm.version.__version__
 
+def parse_cache_compression(value):
+    """
+    Parse --cache-compression option into OSMCache tuning dict.
+
+    >>> sorted(parse_cache_compression('none').keys())
+    ['coords', 'nodes', 'relations', 'ways']
+    >>> sorted(parse_cache_compression('coords=none,ways=tcbs').items())
+    [('coords', {'compression': 'none'}), ('ways', {'compression': 'tcbs'})]
+    """
+    if '=' not in value:
+        value = ','.join('%s=%s' % (name, value) for name in cache_names)
+    tuning = {}
+    for part in value.split(','):
+        name, _, compression = part.partition('=')
+        if name not in cache_names:
+            raise ValueError('unknown cache %r' % name)
+        if compression not in available_compression_codecs():
+            raise ValueError('unsupported compression %r' % compression)
+        tuning[name] = {'compression': compression}
+    return tuning
+
 def main(argv=None):
     setproctitle('imposm: main')
     setup_logging()
@@ -90,6 +114,40 @@ def main(argv=None):
         action='store_true')
     parser.add_option('--cache-dir', dest='cache_dir', default='.',
         help="path where node/ways/relations should be cached [current working dir]")
+    parser.add_option('--coords-cache', dest='coords_cache', default='delta',
+        type='choice', choices=['delta', 'flat', 'sorted'],
+        help="coordinates cache type: delta (compact), flat (fast, "
+        "for planet imports) or sorted (for extracts) [delta]")
+    parser.add_option('--ways-cache', dest='ways_cache', default='btree',
+        type='choice', choices=['btree', 'hash'],
+        help="ways cache type: btree or hash (faster lookups for relation "
+        "building) [btree]")
+    parser.add_option('--coords-shards', dest='coords_shards',
+        type='int', default=1, metavar='N',
+        help="split the coords cache into N files, each written by its "
+        "own process [1]")
+    parser.add_option('--ways-shards', dest='ways_shards',
+        type='int', default=1, metavar='N',
+        help="split the ways cache into N files, each written by its "
+        "own process [1]")
+    parser.add_option('--two-pass', dest='two_pass', default=False,
+        action='store_true', help="read each input twice and only cache the "
+        "coords and untagged ways that are needed for the import")
+    parser.add_option('--coords-cache-size', dest='coords_cache_size',
+        type='int', default=None, metavar='MB',
+        help="memory for cached coords buckets of each process (delta only) [32]")
+    parser.add_option('--cache-backend', dest='cache_backend', default='tc',
+        type='choice', choices=['tc', 'memory'],
+        help="tc (Tokyo Cabinet cache files) or memory (no cache files, "
+        "requires --read and --write) [tc]")
+    parser.add_option('--cache-memory', dest='cache_memory',
+        type='int', default=None, metavar='MB',
+        help="memory for the caches of all processes, split across all "
+        "cache files [Tokyo Cabinet defaults]")
+    parser.add_option('--cache-compression', dest='cache_compression',
+        metavar='none|deflate|bzip2|tcbs|lz4',
+        help="compression of new cache files, for all caches or for each "
+        "cache (e.g. coords=none,ways=tcbs) [deflate]")
     
     
     parser.add_option('--table-prefix',
@@ -110,6 +168,17 @@ def main(argv=None):
         action='store_true')
     parser.add_option('--optimize', dest='optimize', default=False,
         action='store_true')
+    parser.add_option('--cache-stats', dest='cache_stats', default=False,
+        action='store_true', help='show statistics of the cache files')
+    parser.add_option('--compact-cache', dest='compact_cache', default=False,
+        action='store_true', help='rebuild the cache files in key order (runs '
+        'automatically for caches with a lot of merged records)')
+    parser.add_option('--denormalize-ways', dest='denormalize_ways', default=False,
+        action='store_true', help='store the coordinates of all ways in an '
+        'extra cache after reading, for faster writing')
+    parser.add_option('--warmup-cache', dest='warmup_cache', default=False,
+        action='store_true', help='read the coords and ways caches into '
+        'memory before writing (up to half of the available memory)')
     parser.add_option('--deploy-production-tables', dest='deploy_tables', default=False,
         action='store_true', help='remove backup tables, move production tables '
         'to backup tables and move import tables to production tables')
@@ -176,9 +245,55 @@ def main(argv=None):
     
     imposm_timer = imposm.util.Timer('imposm', logger)
     
-    if options.read:
+    if options.cache_backend == 'memory' and not (options.read and options.write):
+        parser.error('--cache-backend=memory requires --read and --write')
+    if options.coords_shards < 1 or options.ways_shards < 1:
+        parser.error('--coords-shards and --ways-shards need to be 1 or more')
+    if options.cache_backend == 'memory' and (options.coords_shards > 1
+        or options.ways_shards > 1):
+        parser.error('--cache-backend=memory does not support sharded caches')
+    if options.cache_backend == 'memory' and options.cache_stats:
+        parser.error('--cache-stats requires cache files')
+    if options.cache_backend == 'memory' and options.denormalize_ways:
+        parser.error('--denormalize-ways requires cache files')
+    if options.cache_backend == 'memory' and options.compact_cache:
+        parser.error('--compact-cache requires cache files')
+    if options.two_pass and options.merge_cache:
+        parser.error('--two-pass does not support --merge-cache')
+
+    cache_tuning = {}
+    if options.cache_compression:
+        try:
+            cache_tuning = parse_cache_compression(options.cache_compression)
+        except ValueError, ex:
+            parser.error('--cache-compression: %s' % ex)
+
+    coords_cache_size = cache_memory = None
+    if options.coords_cache_size:
+        coords_cache_size = options.coords_cache_size * 1024 * 1024
+    if options.cache_memory:
+        cache_memory = options.cache_memory * 1024 * 1024
+
+    cache = OSMCache(options.cache_dir, coords_type=options.coords_cache,
+        coords_cache_size=coords_cache_size, tuning=cache_tuning,
+        cache_memory=cache_memory, processes=options.concurrency,
+        backend=options.cache_backend, ways_type=options.ways_cache,
+        coords_shards=options.coords_shards, ways_shards=options.ways_shards)
+    
+    read_inputs = tag_filter = None
+    if options.read and args and options.cache_backend == 'tc':
+        read_inputs = [imposm.util.file_fingerprint(arg) for arg in args]
+        tag_filter = tag_mapping.tag_filter_signature()
+        if (not options.merge_cache and not options.overwrite_cache
+            and cache.manifest_matches(read_inputs, tag_filter)):
+            logger.message('## cache files are up to date, skipping --read')
+            options.read = False
+
+    if options.read and options.cache_backend == 'tc':
         if not options.merge_cache:
             cache_files = glob.glob(os.path.join(options.cache_dir, 'imposm_*.cache'))
+            # ids files of the hash ways caches
+            cache_files += glob.glob(os.path.join(options.cache_dir, 'imposm_*.cache.ids'))
             if cache_files:
                 if not options.overwrite_cache:
                     print (
@@ -190,20 +305,58 @@ def main(argv=None):
                 for cache_file in cache_files:
                     os.unlink(cache_file)
     
-    cache = OSMCache(options.cache_dir)
-    
     if options.read:
         read_timer = imposm.util.Timer('reading', logger)
         
         if args:
             reader = ImposmReader(tag_mapping, cache=cache, merge=options.merge_cache,
-                pool_size=options.concurrency, logger=logger)
+                pool_size=options.concurrency, logger=logger, two_pass=options.two_pass)
             reader.estimated_coords = imposm.util.estimate_records(args)
+            manifest = None
+            if read_inputs is not None:
+                manifest = cache.read_manifest()
+                if not options.merge_cache:
+                    reader.estimated_records = cache.manifest_estimates(read_inputs)
+                # the caches only match the manifest after a complete read
+                cache.remove_manifest()
+            # the way coords would not match the new ways and coords
+            cache.remove_way_coords()
             for arg in args:
                 logger.message('## reading %s' % arg)
                 reader.read(arg)
+            if read_inputs is not None:
+                cache.write_manifest(read_inputs, tag_filter, reader.records,
+                    merge=options.merge_cache, previous=manifest)
         read_timer.stop()
 
+    compact_names = None
+    if options.compact_cache:
+        compact_names = list(cache_names)
+    elif options.cache_backend == 'tc' and (options.read or options.write):
+        compact_names = [name for name, fragmentation in cache.fragmentation().iteritems()
+            if fragmentation >= COMPACT_FRAGMENTATION]
+    if compact_names:
+        compact_timer = imposm.util.Timer('compacting', logger)
+        logger.message('## compacting %s cache' % ', '.join(sorted(compact_names)))
+        for fname, before, after in cache.compact(compact_names):
+            logger.message('%s: %dMB -> %dMB' % (os.path.basename(fname),
+                before // 1024 // 1024, after // 1024 // 1024))
+        compact_timer.stop()
+
+    if options.denormalize_ways:
+        denormalize_timer = imposm.util.Timer('denormalizing ways', logger)
+        logger.message('## denormalizing ways')
+        stored, missing = cache.denormalize_way_coords()
+        logger.message('stored coords of %d ways, %d ways with missing coords'
+            % (stored, missing))
+        denormalize_timer.stop()
+
+    if options.cache_stats:
+        logger.message('## cache statistics')
+        for fname, stats in cache_file_stats(cache):
+            for line in format_file_stats(fname, stats):
+                logger.message(line)
+
     if options.write:
         db = DB(db_conf)
         write_timer = imposm.util.Timer('writing', logger)
@@ -222,6 +375,8 @@ def main(argv=None):
         writer = ImposmWriter(tag_mapping, db, cache=cache, 
             pool_size=options.concurrency, logger=logger,
             dry_run=options.dry_run)
+        if options.warmup_cache:
+            writer.warmup()
         writer.relations()
         writer.ways()
         writer.nodes()
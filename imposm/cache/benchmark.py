@@ -0,0 +1,119 @@
+# Copyright 2011 Omniscale (http://omniscale.com)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Synthetic benchmark of the ways caches (B+ tree and hash database).
+
+Writes the same random ways into a `WayDB` and a `HashWayDB` and
+measures random `get` lookups, like the relation builder does them.
+Runs without an OSM file or import::
+
+    python -m imposm.cache.benchmark [number of ways] [number of gets]
+"""
+
+import os
+import sys
+import time
+import logging
+import random
+import shutil
+import tempfile
+
+from imposm.cache.tc import WayDB, HashWayDB, TagDictionary
+from imposm.cache.report import disk_usage
+
+__all__ = ['way_cache_benchmark', 'format_benchmark_results']
+
+log = logging.getLogger(__name__)
+
+way_caches = (('btree', WayDB), ('hash', HashWayDB))
+
+def _synthetic_ways(num_ways, seed):
+    rnd = random.Random(seed)
+    values = ('residential', 'service', 'footway', 'track', 'primary')
+    osmid = 0
+    for _ in xrange(num_ways):
+        osmid += rnd.randint(1, 10)
+        ref = rnd.randint(1, 2**32)
+        refs = [ref + i * rnd.randint(1, 20) for i in xrange(rnd.randint(2, 30))]
+        tags = {'highway': rnd.choice(values)}
+        if rnd.random() < 0.3:
+            tags['name'] = 'Street %d' % rnd.randint(1, 10000)
+        yield osmid, tags, refs
+
+def way_cache_benchmark(num_ways=100000, num_gets=100000, seed=42,
+    compression='none', cache_dir=None):
+    """
+    Return the results for each ways cache type as a dict with
+    ``put_usec`` and ``get_usec`` (average time in microseconds) and the
+    allocated ``disk_bytes``.
+    """
+    tmp_dir = tempfile.mkdtemp(dir=cache_dir)
+    tag_dict = TagDictionary(['highway', 'name'] +
+        ['residential', 'service', 'footway', 'track', 'primary'])
+    results = {}
+    try:
+        ids = [osmid for osmid, _, _ in _synthetic_ways(num_ways, seed)]
+        rnd = random.Random(seed)
+        sample = [rnd.choice(ids) for _ in xrange(num_gets)]
+        for name, cache_class in way_caches:
+            fname = os.path.join(tmp_dir, 'ways_%s.cache' % name)
+            cache = cache_class(fname, 'w', estimated_records=num_ways,
+                compression=compression, tag_dict=tag_dict)
+            start = time.time()
+            for osmid, tags, refs in _synthetic_ways(num_ways, seed):
+                cache.put(osmid, tags, refs)
+            put_time = time.time() - start
+            cache.close()
+
+            cache = cache_class(fname, 'r', tag_dict=tag_dict)
+            start = time.time()
+            for osmid in sample:
+                cache.get(osmid)
+            get_time = time.time() - start
+            cache.close()
+
+            results[name] = {
+                'put_usec': put_time * 1e6 / num_ways if num_ways else 0.0,
+                'get_usec': get_time * 1e6 / num_gets if num_gets else 0.0,
+                'disk_bytes': disk_usage(fname),
+            }
+    finally:
+        shutil.rmtree(tmp_dir)
+    return results
+
+def format_benchmark_results(num_ways, num_gets, results):
+    """
+    Return the results of `way_cache_benchmark` as list of lines.
+    """
+    lines = ['%d ways, %d random gets' % (num_ways, num_gets)]
+    for name, _ in way_caches:
+        result = results[name]
+        lines.append('%-6s put: %7.2f usec  get: %7.2f usec  disk: %.1f MB' % (
+            name, result['put_usec'], result['get_usec'],
+            result['disk_bytes'] / 1024.0 / 1024.0))
+    return lines
+
+def main(args=None):
+    if args is None:
+        args = sys.argv[1:]
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    num_ways = int(args[0]) if len(args) > 0 else 100000
+    num_gets = int(args[1]) if len(args) > 1 else num_ways
+    results = way_cache_benchmark(num_ways, num_gets)
+    for line in format_benchmark_results(num_ways, num_gets, results):
+        log.info(line)
+
+if __name__ == '__main__':
+    main()
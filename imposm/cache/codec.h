@@ -0,0 +1,63 @@
+/*
+ * External compression codecs for Tokyo Cabinet (BDBTEXCODEC).
+ *
+ * LZ4 is only available if imposm was built with IMPOSM_WITH_LZ4
+ * (setup.py defines it if liblz4 is found).
+ *
+ * The encoded data starts with the uncompressed size as a 32 bit integer.
+ */
+#include <stdlib.h>
+#include <string.h>
+#include <stdint.h>
+
+#ifdef IMPOSM_WITH_LZ4
+#include <lz4.h>
+
+#define IMPOSM_HAS_LZ4 1
+
+static void *imposm_lz4_encode(const void *ptr, int size, int *sp, void *op) {
+    int bound = LZ4_compressBound(size);
+    char *buf = malloc(sizeof(int32_t) + bound + 1);
+    int n;
+    if (!buf) return NULL;
+    memcpy(buf, &size, sizeof(int32_t));
+    n = LZ4_compress_default(ptr, buf + sizeof(int32_t), size, bound);
+    if (n <= 0 && size > 0) {
+        free(buf);
+        return NULL;
+    }
+    *sp = sizeof(int32_t) + n;
+    return buf;
+}
+
+static void *imposm_lz4_decode(const void *ptr, int size, int *sp, void *op) {
+    int32_t orig_size;
+    char *buf;
+    if (size < (int)sizeof(int32_t)) return NULL;
+    memcpy(&orig_size, ptr, sizeof(int32_t));
+    if (orig_size < 0) return NULL;
+    buf = malloc(orig_size + 1);
+    if (!buf) return NULL;
+    if (LZ4_decompress_safe((const char *)ptr + sizeof(int32_t), buf,
+            size - sizeof(int32_t), orig_size) != orig_size) {
+        free(buf);
+        return NULL;
+    }
+    buf[orig_size] = '\0';
+    *sp = orig_size;
+    return buf;
+}
+
+#else
+
+#define IMPOSM_HAS_LZ4 0
+
+static void *imposm_lz4_encode(const void *ptr, int size, int *sp, void *op) {
+    return NULL;
+}
+
+static void *imposm_lz4_decode(const void *ptr, int size, int *sp, void *op) {
+    return NULL;
+}
+
+#endif
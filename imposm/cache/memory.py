@@ -0,0 +1,285 @@
+# Copyright 2011 Omniscale (http://omniscale.com)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+In-memory cache backend.
+
+The caches implement the same interface as the Tokyo Cabinet caches
+(put, put_marshaled, put_many, get, get_coords, sorted iteration,
+``__contains__`` and ``__len__``), but they only live in the memory of the
+process that created them. All writers need to run as threads of the main
+process. The importer processes are forked after the caches are filled and
+share the cached data with the main process (copy-on-write).
+"""
+
+import marshal
+from array import array
+from bisect import bisect_left
+
+from imposm.base import Node, Way, Relation
+
+__all__ = [
+    'CoordsCache', 'NodesCache', 'WaysCache', 'RelationsCache', 'CoordList',
+]
+
+COORD_FACTOR = 11930464.7083 # ((2<<31)-1)/360.0
+
+def _coord_to_uint32(x):
+    # rounded like the Tokyo Cabinet caches
+    return int((x + 180.0) * COORD_FACTOR + 0.5)
+
+def _uint32_to_coord(x):
+    return (x / COORD_FACTOR) - 180.0
+
+class CoordList(list):
+    """
+    List with the (x, y) tuples of some refs. Compatible to the
+    ``CoordBuffer`` of the Tokyo Cabinet caches: missing coords are
+    ``(0.0, 0.0)``, ``missing`` is the number of missing coords and
+    ``mask`` a string with a '\\x01' for each found and a '\\x00' for
+    each missing coord.
+    """
+    def __init__(self, coords=(), found=None):
+        list.__init__(self, coords)
+        if found is None:
+            found = '\x01' * len(self)
+        self.mask = found
+        self.missing = found.count('\x00')
+
+    def __getitem__(self, idx):
+        if isinstance(idx, slice):
+            indices = range(*idx.indices(len(self)))
+            return CoordList([list.__getitem__(self, i) for i in indices],
+                ''.join(self.mask[i] for i in indices))
+        return list.__getitem__(self, idx)
+
+    def __getslice__(self, start, stop):
+        return self.__getitem__(slice(start, stop))
+
+    def __add__(self, other):
+        if not isinstance(other, CoordList):
+            return NotImplemented
+        return CoordList(list.__add__(self, other), self.mask + other.mask)
+
+    def tolist(self):
+        return list(self)
+
+class CoordsCache(object):
+    """
+    Coordinates in three arrays with the ids and the fixed-point
+    lons and lats (16 bytes for each node).
+
+    The arrays are sorted by id on `close` or with the first lookup.
+    """
+    def __init__(self, filename=None, mode='w', estimated_records=0, **kw):
+        self.ids = array('l')
+        self.lons = array('I')
+        self.lats = array('I')
+        self._sorted = True
+
+    def put(self, osmid, lon, lat):
+        if self._sorted and self.ids and osmid <= self.ids[-1]:
+            self._sorted = False
+        self.ids.append(osmid)
+        self.lons.append(_coord_to_uint32(lon))
+        self.lats.append(_coord_to_uint32(lat))
+        return True
+
+    put_marshaled = put
+
+    def put_many(self, coords, marshaled=False):
+        for osmid, lon, lat in coords:
+            self.put(osmid, lon, lat)
+        return len(coords)
+
+    def _sort(self):
+        """
+        Sort all arrays by id. The last put of an id wins.
+        """
+        ids, lons, lats = array('l'), array('I'), array('I')
+        order = sorted(xrange(len(self.ids)), key=self.ids.__getitem__)
+        for n, i in enumerate(order):
+            if n + 1 < len(order) and self.ids[order[n + 1]] == self.ids[i]:
+                continue
+            ids.append(self.ids[i])
+            lons.append(self.lons[i])
+            lats.append(self.lats[i])
+        self.ids, self.lons, self.lats = ids, lons, lats
+        self._sorted = True
+
+    def _index(self, osmid):
+        if not self._sorted:
+            self._sort()
+        i = bisect_left(self.ids, osmid)
+        if i < len(self.ids) and self.ids[i] == osmid:
+            return i
+        return None
+
+    def get(self, osmid):
+        i = self._index(osmid)
+        if i is None:
+            return None
+        return _uint32_to_coord(self.lons[i]), _uint32_to_coord(self.lats[i])
+
+    def get_coords(self, refs):
+        coords = []
+        for ref in refs:
+            coord = self.get(ref)
+            if coord is None:
+                return None
+            coords.append(coord)
+        return coords
+
+    def get_coords_many(self, refs):
+        """
+        Return a CoordList with the coordinates of all refs.
+        """
+        coords = []
+        found = []
+        for ref in refs:
+            coord = self.get(ref)
+            if coord is None:
+                coords.append((0.0, 0.0))
+                found.append('\x00')
+            else:
+                coords.append(coord)
+                found.append('\x01')
+        return CoordList(coords, ''.join(found))
+
+    def get_coords_batch(self, refs_list):
+        """
+        Return a CoordList for each list of refs.
+        """
+        return [self.get_coords_many(refs) for refs in refs_list]
+
+    def __iter__(self):
+        if not self._sorted:
+            self._sort()
+        for i, osmid in enumerate(self.ids):
+            yield osmid, (_uint32_to_coord(self.lons[i]), _uint32_to_coord(self.lats[i]))
+
+    def __contains__(self, osmid):
+        return self._index(osmid) is not None
+
+    def __len__(self):
+        if not self._sorted:
+            self._sort()
+        return len(self.ids)
+
+    def close(self):
+        # sort before the importer processes are forked
+        if not self._sorted:
+            self._sort()
+
+class _RecordsCache(object):
+    """
+    Tags and refs/coord of each element as marshal data, packed into one
+    buffer. The ids are stored in an array with the offset of each record
+    in the buffer (16 bytes for each element in addition to the marshal
+    data, instead of a Python string and a dict entry for each element).
+
+    The records are sorted by id on `close` or with the first lookup.
+    """
+    elem_class = None
+
+    def __init__(self, filename=None, mode='w', estimated_records=0, **kw):
+        self.ids = array('l')
+        # offset of each record in data, the last entry is the end of data
+        self.offsets = array('L', [0])
+        self.data = bytearray()
+        self._sorted = True
+
+    def put(self, osmid, tags, data):
+        return self.put_marshaled(osmid, marshal.dumps((tags, data), 2))
+
+    def put_marshaled(self, osmid, data):
+        if self._sorted and self.ids and osmid <= self.ids[-1]:
+            self._sorted = False
+        self.ids.append(osmid)
+        self.data.extend(data)
+        self.offsets.append(len(self.data))
+        return True
+
+    def put_many(self, items, marshaled=False):
+        if marshaled:
+            for osmid, data in items:
+                self.put_marshaled(osmid, data)
+        else:
+            for osmid, tags, data in items:
+                self.put(osmid, tags, data)
+        return len(items)
+
+    def _sort(self):
+        """
+        Sort the ids and the packed records by id. The last put of an
+        id wins.
+        """
+        ids, offsets, data = array('l'), array('L', [0]), bytearray()
+        order = sorted(xrange(len(self.ids)), key=self.ids.__getitem__)
+        for n, i in enumerate(order):
+            if n + 1 < len(order) and self.ids[order[n + 1]] == self.ids[i]:
+                continue
+            ids.append(self.ids[i])
+            data.extend(buffer(self.data, self.offsets[i],
+                self.offsets[i + 1] - self.offsets[i]))
+            offsets.append(len(data))
+        self.ids, self.offsets, self.data = ids, offsets, data
+        self._sorted = True
+
+    def _index(self, osmid):
+        if not self._sorted:
+            self._sort()
+        i = bisect_left(self.ids, osmid)
+        if i < len(self.ids) and self.ids[i] == osmid:
+            return i
+        return None
+
+    def _record(self, i):
+        tags, data = marshal.loads(
+            buffer(self.data, self.offsets[i], self.offsets[i + 1] - self.offsets[i]))
+        return self.elem_class(self.ids[i], tags, data)
+
+    def get(self, osmid):
+        i = self._index(osmid)
+        if i is None:
+            return None
+        return self._record(i)
+
+    def __iter__(self):
+        if not self._sorted:
+            self._sort()
+        for i in xrange(len(self.ids)):
+            yield self._record(i)
+
+    def __contains__(self, osmid):
+        return self._index(osmid) is not None
+
+    def __len__(self):
+        if not self._sorted:
+            self._sort()
+        return len(self.ids)
+
+    def close(self):
+        # sort before the importer processes are forked
+        if not self._sorted:
+            self._sort()
+
+class NodesCache(_RecordsCache):
+    elem_class = Node
+
+class WaysCache(_RecordsCache):
+    elem_class = Way
+
+class RelationsCache(_RecordsCache):
+    elem_class = Relation
@@ -13,53 +13,650 @@
 # limitations under the License.
 
 import os
+import glob
+import threading
 
-from . tc import DeltaCoordsDB, NodeDB, WayDB, InsertedWayDB, RelationDB
+try:
+    import json
+except ImportError:
+    # Python 2.5, caches are read without manifest
+    json = None
+
+from . tc import DeltaCoordsDB, FlatCoordsDB, SortedCoordsDB, NodeDB, WayDB, RelationDB
+from . tc import TagDictionary, HashWayDB, IdBitmap, IdBitmapBuilder
+from . tc import ShardedDB, ShardedCoordsDB, WayCoordsDB, denormalize_way_coords
+from . import memory
+
+# names of the caches, in the order they are written
+cache_names = ('coords', 'nodes', 'ways', 'relations')
+
+coords_types = {
+    'delta': ('coords', DeltaCoordsDB),
+    'flat': ('coords_flat', FlatCoordsDB),
+    'sorted': ('coords_sorted', SortedCoordsDB),
+}
+
+ways_types = {
+    'btree': ('ways', WayDB),
+    'hash': ('ways_hash', HashWayDB),
+}
+
+# cache classes of each backend, the coords and ways classes of the
+# tc backend depend on the coords_type and ways_type
+cache_backends = {
+    'tc': {
+        'nodes': NodeDB,
+        'relations': RelationDB,
+    },
+    'memory': {
+        'coords': memory.CoordsCache,
+        'nodes': memory.NodesCache,
+        'ways': memory.WaysCache,
+        'relations': memory.RelationsCache,
+    },
+}
+
+# frequent strings that are not part of the mapping (e.g. member roles)
+common_tag_strings = set(['inner', 'outer', 'yes', 'no'])
+
+# share of the --cache-memory budget and the average size of the
+# (uncompressed) records in bytes for each cache
+cache_memory_shares = {
+    'coords': (0.55, 450),
+    'ways': (0.3, 100),
+    'nodes': (0.1, 60),
+    'relations': (0.05, 300),
+}
+# caches with random lookups from all importer processes, the other
+# caches are only iterated by the main process
+random_access_caches = set(['coords', 'ways'])
+# memory of a cached record in addition to the record itself
+CACHED_RECORD_OVERHEAD = 48
+# memory of a cached non-leaf page (256 records)
+CACHED_NODE_PAGE_SIZE = 4096
+
+MANIFEST_VERSION = 1
+# share of out-of-order records (added by --merge-cache) of a cache
+# that needs a compaction, see `OSMCache.fragmentation`
+COMPACT_FRAGMENTATION = 0.3
 
 class OSMCache(object):
-    def __init__(self, path, suffix='imposm_', prefix='.cache'):
+    def __init__(self, path, suffix='imposm_', prefix='.cache', coords_type='delta',
+        coords_cache_size=None, tuning=None, cache_memory=None, processes=1,
+        backend='tc', ways_type='btree', coords_shards=1, ways_shards=1):
+        """
+        :param backend: ``tc`` for Tokyo Cabinet cache files or ``memory``
+            for in-memory caches (see `imposm.cache.memory`)
+        :param tuning: dict with the BDB options (compression, lmemb,
+            nmemb) for each cache (coords, nodes, ways, relations),
+            e.g. ``{'coords': {'compression': 'none'}}``
+        :param cache_memory: memory in bytes for the caches of all
+            processes, see `memory_options`
+        :param processes: number of importer processes
+        :param coords_shards: number of files for the coords cache,
+            see `ShardedDB`
+        :param ways_shards: number of files for the ways cache
+        """
         self.path = path
         self.suffix = suffix
         self.prefix = prefix
-        self.coords_fname = os.path.join(path, suffix + 'coords' + prefix) 
+        self.backend = backend
+        self.classes = dict(cache_backends[backend])
+        if backend == 'tc':
+            coords_name, self.classes['coords'] = coords_types[coords_type]
+            ways_name, self.classes['ways'] = ways_types[ways_type]
+        else:
+            coords_name, ways_name = 'coords', 'ways'
+        self.coords_class = self.classes['coords']
+        self.shards = {'coords': 1, 'ways': 1}
+        if backend == 'tc':
+            # in-memory caches are filled by threads, sharding won't help
+            self.shards = {'coords': coords_shards, 'ways': ways_shards}
+        self.tuning = tuning or {}
+        self.cache_memory = cache_memory
+        self.processes = processes
+        self.coords_options = {}
+        if self.coords_class is DeltaCoordsDB:
+            if coords_cache_size:
+                self.coords_options['cache_size'] = coords_cache_size
+            self.coords_options.update(self.tuning.get('coords', {}))
+        self.coords_fname = os.path.join(path, suffix + coords_name + prefix) 
         self.nodes_fname = os.path.join(path, suffix + 'nodes' + prefix) 
-        self.ways_fname = os.path.join(path, suffix + 'ways' + prefix) 
+        self.ways_fname = os.path.join(path, suffix + ways_name + prefix)
+        self.way_coords_fname = os.path.join(path, suffix + 'way_coords' + prefix)
+        self.untagged_ways_fname = os.path.join(path, suffix + 'untagged_ways' + prefix)
+        self.referenced_nodes_fname = os.path.join(path, suffix + 'referenced_nodes' + prefix)
         self.inserted_ways_fname = os.path.join(path, suffix + 'inserted_ways' + prefix) 
         self.relations_fname = os.path.join(path, suffix + 'relations' + prefix) 
+        self.tag_dict_fname = os.path.join(path, suffix + 'tags' + prefix)
+        self.manifest_fname = os.path.join(path, suffix + 'manifest.json')
+        self.coords_type = coords_type
+        self.ways_type = ways_type
         self.caches = {}
+        self.memory_caches = {}
+        self._tag_dict = None
+
+    @property
+    def in_memory(self):
+        """
+        True if the caches only exist in the memory of this process.
+        Cache writers need to run as threads of this process and the
+        readers need to be forked from this process.
+        """
+        return self.backend == 'memory'
 
     def close_all(self):
         for mode_, cache in self.caches.values():
             cache.close()
         self.caches = {}
 
-    def coords_cache(self, mode='r', estimated_records=None):
-        return self._x_cache(self.coords_fname, DeltaCoordsDB, mode, estimated_records)
+    def stats(self):
+        """
+        Return list with (filename, stats) for all open caches with statistics.
+        """
+        result = []
+        for fname, (mode_, cache) in self.caches.iteritems():
+            if isinstance(cache, ShardedDB):
+                caches = zip(self.shard_fnames(fname, len(cache.dbs)), cache.dbs)
+            else:
+                caches = [(fname, cache)]
+            for fname, cache in caches:
+                if hasattr(cache, 'stats'):
+                    result.append((fname, cache.stats()))
+        return result
+
+    def tag_dictionary(self):
+        """
+        Return the TagDictionary of the cache files. The dictionary is
+        empty for caches without a dictionary file.
+        """
+        if self._tag_dict is None:
+            self._tag_dict = TagDictionary()
+            if os.path.exists(self.tag_dict_fname):
+                self._tag_dict.load(self.tag_dict_fname)
+        return self._tag_dict
+
+    def update_tag_dictionary(self, strings):
+        """
+        Add strings to the TagDictionary and store it with the cache files.
+        Existing codes are not changed, so this works for merged caches.
+        """
+        if self.in_memory:
+            # in-memory caches store the tags as they are
+            return
+        tag_dict = self.tag_dictionary()
+        for s in sorted(set(strings) | common_tag_strings):
+            tag_dict.add(s)
+        tag_dict.save(self.tag_dict_fname)
+
+    def cache_fnames(self):
+        """
+        Return the file names of all caches (with all shards).
+        """
+        fnames = []
+        for name in cache_names:
+            fname = getattr(self, name + '_fname')
+            fnames.extend(self.shard_fnames(fname, self.shards.get(name, 1)))
+        fnames.append(self.tag_dict_fname)
+        return fnames
+
+    def warmup_fnames(self):
+        """
+        Return the existing files of the caches with random lookups
+        during the import (coords and ways), the most important first.
+        The coords cache is only needed for a few ways if the way coords
+        cache exists.
+        """
+        fnames = []
+        names = ('coords', 'ways')
+        if os.path.exists(self.way_coords_fname):
+            fnames.append(self.way_coords_fname)
+            names = ('ways', 'coords')
+        for name in names:
+            fname = getattr(self, name + '_fname')
+            for shard_fname in self.shard_fnames(fname, self.shards[name]):
+                if os.path.exists(shard_fname):
+                    fnames.append(shard_fname)
+        return fnames
+
+    def _manifest_options(self):
+        # caches with other options are not compatible
+        return {
+            'coords_type': self.coords_type,
+            'ways_type': self.ways_type,
+            'shards': self.shards,
+            'compression': dict((name, self.tuning.get(name, {}).get('compression'))
+                for name in cache_names),
+        }
+
+    def read_manifest(self):
+        """
+        Return the manifest of the cache files or None.
+        """
+        if json is None or self.in_memory or not os.path.exists(self.manifest_fname):
+            return None
+        try:
+            f = open(self.manifest_fname)
+            try:
+                manifest = json.load(f)
+            finally:
+                f.close()
+        except ValueError:
+            return None
+        if manifest.get('version') != MANIFEST_VERSION:
+            return None
+        return manifest
+
+    def write_manifest(self, inputs, tag_filter, records, merge=False, previous=None):
+        """
+        Store the manifest of the cache files after a complete read.
+
+        :param inputs: `imposm.util.file_fingerprint` of all input files
+        :param tag_filter: `TagMapper.tag_filter_signature` of the mapping
+        :param records: number of records in each cache
+        :param merge: True if the inputs were merged into existing caches
+            (--merge-cache)
+        :param previous: manifest of the caches before the merge,
+            no manifest is written for merged caches without manifest
+        """
+        if json is None or self.in_memory:
+            return
+        # records that were written in order, by a new read or a compaction
+        compacted_records = records
+        if merge:
+            if not self._manifest_compatible(previous, tag_filter):
+                return
+            inputs = previous['inputs'] + list(inputs)
+            records = dict(records)
+            for name, count in previous['records'].iteritems():
+                records[name] = records.get(name, 0) + count
+            compacted_records = previous.get('compacted_records', previous['records'])
+        manifest = {
+            'version': MANIFEST_VERSION,
+            'inputs': list(inputs),
+            'tag_filter': tag_filter,
+            'options': self._manifest_options(),
+            'records': records,
+            'compacted_records': compacted_records,
+        }
+        self._save_manifest(manifest)
+
+    def _save_manifest(self, manifest):
+        """
+        Store the manifest with the current sizes of the cache files.
+        """
+        files = {}
+        for fname in self.cache_fnames():
+            if os.path.exists(fname):
+                files[os.path.basename(fname)] = os.path.getsize(fname)
+        manifest['files'] = files
+        tmp_fname = self.manifest_fname + '.tmp'
+        f = open(tmp_fname, 'w')
+        try:
+            json.dump(manifest, f, indent=2, sort_keys=True)
+        finally:
+            f.close()
+        os.rename(tmp_fname, self.manifest_fname)
+
+    def remove_manifest(self):
+        if os.path.exists(self.manifest_fname):
+            os.unlink(self.manifest_fname)
+
+    def _manifest_compatible(self, manifest, tag_filter):
+        return (manifest is not None
+            and manifest['tag_filter'] == tag_filter
+            and manifest['options'] == self._manifest_options())
+
+    def manifest_matches(self, inputs, tag_filter):
+        """
+        Return True if the cache files were read from the same inputs
+        with the same mapping and options and if they were not modified.
+        """
+        manifest = self.read_manifest()
+        if not self._manifest_compatible(manifest, tag_filter):
+            return False
+        if manifest['inputs'] != list(inputs):
+            return False
+        for fname in self.cache_fnames():
+            size = manifest['files'].get(os.path.basename(fname))
+            if size is None:
+                continue
+            if not os.path.exists(fname) or os.path.getsize(fname) != size:
+                return False
+        return bool(manifest['files'])
+
+    def manifest_estimates(self, inputs):
+        """
+        Return the estimated records of each cache for the inputs, based
+        on the real record counts of the manifest and the input sizes.
+        Returns None without manifest.
+        """
+        manifest = self.read_manifest()
+        if manifest is None:
+            return None
+        manifest_size = sum(i['size'] for i in manifest['inputs'])
+        size = sum(i['size'] for i in inputs)
+        if not manifest_size:
+            return None
+        scale = float(size) / manifest_size
+        return dict((str(name), int(count * scale))
+            for name, count in manifest['records'].iteritems())
+
+    def fragmentation(self):
+        """
+        Return the share of the records of each cache that were added by
+        ``--merge-cache`` runs after the cache was built or compacted.
+        These records were not inserted in key order and leave half-filled
+        pages behind. Returns an empty dict without manifest.
+        """
+        manifest = self.read_manifest()
+        if manifest is None:
+            return {}
+        compacted_records = manifest.get('compacted_records', manifest['records'])
+        result = {}
+        for name, count in manifest['records'].iteritems():
+            if count:
+                result[str(name)] = max(0.0,
+                    1.0 - float(compacted_records.get(name, 0)) / count)
+        return result
+
+    def compact(self, names=None):
+        """
+        Rebuild the files of the caches `names` (default: all) in key
+        order, see `imposm.cache.tc.BDB.optimize`. All files and shards
+        are rebuilt in parallel threads, Tokyo Cabinet releases the GIL.
+        Flat and sorted coords caches are skipped, since they are always
+        compact.
+
+        Returns a list with the filename and the size before and after
+        the compaction of each file.
+        """
+        if self.in_memory:
+            return []
+        self.close_all()
+        if names is None:
+            names = cache_names
+        files = []
+        for name in names:
+            x_class = self.classes[name]
+            if not hasattr(x_class, 'optimize'):
+                continue
+            fname = getattr(self, name + '_fname')
+            for shard_fname in self.shard_fnames(fname, self.shards.get(name, 1)):
+                if os.path.exists(shard_fname):
+                    files.append((shard_fname, x_class, self.tuning.get(name, {})))
+
+        results = []
+        errors = []
+        def compact_file(fname, x_class, tuning):
+            try:
+                size = os.path.getsize(fname)
+                cache = x_class(fname, 'w', **tuning)
+                try:
+                    cache.optimize(lmemb=tuning.get('lmemb'), nmemb=tuning.get('nmemb'))
+                finally:
+                    cache.close()
+                results.append((fname, size, os.path.getsize(fname)))
+            except Exception, ex:
+                errors.append(ex)
+        workers = [threading.Thread(target=compact_file, args=args) for args in files]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+        if errors:
+            raise errors[0]
+
+        manifest = self.read_manifest()
+        if manifest is not None:
+            compacted_records = manifest.get('compacted_records', manifest['records'])
+            for name in names:
+                if name in manifest['records']:
+                    compacted_records[name] = manifest['records'][name]
+            manifest['compacted_records'] = compacted_records
+            self._save_manifest(manifest)
+        return sorted(results)
+
+    def _memory_shares(self):
+        """
+        Return the share of the `cache_memory` budget of each cache.
+        """
+        shares = dict((name, share) for name, (share, record_size_)
+            in cache_memory_shares.iteritems())
+        if self.coords_class is not DeltaCoordsDB:
+            # flat and sorted coords only use the page cache of the OS,
+            # the other caches get their share
+            coords_share = shares.pop('coords')
+            for name in shares:
+                shares[name] /= 1.0 - coords_share
+        return shares
 
-    def nodes_cache(self, mode='r', estimated_records=None):
-        return self._x_cache(self.nodes_fname, NodeDB, mode, estimated_records)
+    def memory_options(self, name, mode):
+        """
+        Return the cache options for the cache `name` (coords, nodes, ways
+        or relations) from the `cache_memory` budget.
 
-    def ways_cache(self, mode='r', estimated_records=None):
-        return self._x_cache(self.ways_fname, WayDB, mode, estimated_records)
+        Each cache gets a share of the budget by the size of the cache and
+        how it is accessed. Half of the share is used for the memory mapped
+        file, which is shared by all processes. The other half is split
+        across all processes that read the cache. Each process uses it for
+        the cached pages (or the buckets of the delta coords cache).
+        """
+        if not self.cache_memory or self.in_memory:
+            return {}
+        shares = self._memory_shares()
+        if name not in shares:
+            return {}
+        record_size = cache_memory_shares[name][1]
+        share = int(self.cache_memory * shares[name]) // self.shards.get(name, 1)
+        processes = 1
+        if mode == 'r' and name in random_access_caches:
+            processes = self.processes + 1
+        process_share = share // 2 // processes
 
-    def inserted_ways_cache(self, mode='r', estimated_records=None):
-        return self._x_cache(self.inserted_ways_fname, InsertedWayDB, mode, estimated_records)
+        options = {'xmsiz': share // 2}
+        if name == 'coords':
+            options['cache_size'] = process_share
+        elif name == 'ways' and self.classes['ways'] is HashWayDB:
+            options['rcnum'] = max(64, process_share //
+                (record_size + CACHED_RECORD_OVERHEAD))
+        else:
+            lmemb = self.tuning.get(name, {}).get('lmemb') or 128
+            page_size = lmemb * (record_size + CACHED_RECORD_OVERHEAD)
+            options['lcnum'] = max(64, int(process_share * 0.8) // page_size)
+            options['ncnum'] = max(64, int(process_share * 0.2) // CACHED_NODE_PAGE_SIZE)
+        return options
+
+    def coords_cache(self, mode='r', estimated_records=None, bulk=False, shard=None):
+        """
+        :param shard: return only this shard of a sharded coords cache
+            (for the writer of the shard)
+        """
+        options = self.memory_options('coords', mode)
+        options.update(self.coords_options)
+        if bulk and self.coords_class is DeltaCoordsDB:
+            # flat and sorted caches are already optimized for sorted input
+            options['bulk'] = True
+        return self._sharded_cache('coords', self.coords_fname, self.coords_class, mode,
+            estimated_records, shard, **options)
+
+    def nodes_cache(self, mode='r', estimated_records=None, bulk=False):
+        return self._x_cache(self.nodes_fname, self.classes['nodes'], mode, estimated_records,
+            bulk=bulk, tag_dict=self.tag_dictionary(), **self._options('nodes', mode))
+
+    def ways_cache(self, mode='r', estimated_records=None, bulk=False, shard=None):
+        return self._sharded_cache('ways', self.ways_fname, self.classes['ways'], mode,
+            estimated_records, shard, bulk=bulk, tag_dict=self.tag_dictionary(),
+            **self._options('ways', mode))
+
+    def untagged_ways_cache(self, mode='r', estimated_records=None, bulk=False, shard=None):
+        """
+        Temporary cache for the untagged ways of a two-pass read (see
+        `imposm.reader.ImposmReader`). Same type and shards as the ways
+        cache.
+        """
+        return self._sharded_cache('ways', self.untagged_ways_fname, self.classes['ways'],
+            mode, estimated_records, shard, bulk=bulk, tag_dict=self.tag_dictionary(),
+            **self._options('ways', mode))
+
+    def remove_untagged_ways(self):
+        fnames = self.shard_fnames(self.untagged_ways_fname, self.shards['ways'])
+        for fname in set([self.untagged_ways_fname] + fnames):
+            self.memory_caches.pop(fname, None)
+            if fname in self.caches:
+                mode_, cache = self.caches.pop(fname)
+                cache.close()
+            # with the ids file of hash databases
+            for remove_fname in (fname, fname + '.ids'):
+                if os.path.exists(remove_fname):
+                    os.unlink(remove_fname)
+
+    def way_coords_cache(self, mode='r', estimated_records=None):
+        """
+        Return the `WayCoordsDB` with the coordinates of all ways, or
+        None if the ways were not denormalized (see
+        `denormalize_way_coords`).
+        """
+        if self.in_memory:
+            return None
+        if mode == 'r' and not os.path.exists(self.way_coords_fname):
+            return None
+        return self._x_cache(self.way_coords_fname, WayCoordsDB, mode, estimated_records,
+            bulk=mode == 'w', **self.tuning.get('ways', {}))
+
+    def denormalize_way_coords(self):
+        """
+        Store the coordinates of all ways in the way coords cache, so
+        that the importer can build the way geometries without random
+        lookups in the coords cache. The coords cache is read in node id
+        order, see `imposm.cache.tc.denormalize_way_coords`.
+
+        Returns the number of stored ways and of ways with missing coords.
+        """
+        self.remove_way_coords()
+        ways_cache = self.ways_cache(mode='r')
+        coords_cache = self.coords_cache(mode='r')
+        way_coords = self.way_coords_cache(mode='w', estimated_records=len(ways_cache))
+        try:
+            return denormalize_way_coords(ways_cache, coords_cache, way_coords)
+        finally:
+            self.close_all()
+
+    def remove_way_coords(self):
+        """
+        Remove the way coords cache. Needs to be called before the ways
+        or coords caches are modified.
+        """
+        if self.way_coords_fname in self.caches:
+            mode_, cache = self.caches.pop(self.way_coords_fname)
+            cache.close()
+        if os.path.exists(self.way_coords_fname):
+            os.unlink(self.way_coords_fname)
+
+    def inserted_ways_bitmap(self):
+        """
+        Return the `IdBitmap` with the ways that were inserted as part
+        of a relation. Empty until `merge_inserted_ways` was called.
+        """
+        return IdBitmap(self.inserted_ways_fname)
+
+    def write_inserted_ways(self, inserted_ways):
+        """
+        Write the `IdBitmapBuilder` with the inserted ways of this
+        process. The bitmaps of all processes are merged with
+        `merge_inserted_ways`. Used for all backends, since the
+        importer processes can't modify the caches of the main process.
+        """
+        inserted_ways.write('%s.%d' % (self.inserted_ways_fname, os.getpid()))
+
+    def _inserted_ways_parts(self):
+        return [fname for fname in glob.glob(self.inserted_ways_fname + '.*')
+            if fname.rsplit('.', 1)[1].isdigit()]
+
+    def merge_inserted_ways(self, processes=None):
+        """
+        Merge the inserted ways of all processes into a single bitmap.
+
+        :param processes: number of importer processes, raises an
+            IOError if the file of a process is missing
+        """
+        parts = self._inserted_ways_parts()
+        if processes is not None and len(parts) != processes:
+            raise IOError('found inserted ways of %d importer processes, expected %d'
+                % (len(parts), processes))
+        inserted_ways = IdBitmapBuilder()
+        for fname in parts:
+            part = IdBitmap(fname)
+            inserted_ways.update(part)
+            part.close()
+            os.unlink(fname)
+        inserted_ways.write(self.inserted_ways_fname)
 
     def remove_inserted_way_cache(self):
-        if os.path.exists(self.inserted_ways_fname):
-            os.unlink(self.inserted_ways_fname)
+        for fname in self._inserted_ways_parts() + [self.inserted_ways_fname]:
+            if os.path.exists(fname):
+                os.unlink(fname)
+
+    def relations_cache(self, mode='r', estimated_records=None, bulk=False):
+        return self._x_cache(self.relations_fname, self.classes['relations'], mode, estimated_records,
+            bulk=bulk, tag_dict=self.tag_dictionary(), **self._options('relations', mode))
+
+    def _options(self, name, mode):
+        options = self.memory_options(name, mode)
+        options.update(self.tuning.get(name, {}))
+        return options
+
+    def shard_fnames(self, fname, shards):
+        """
+        Return the file names of all shards of the cache `fname`.
+        """
+        if shards == 1:
+            return [fname]
+        base = fname[:len(fname) - len(self.prefix)]
+        return ['%s-%dof%d%s' % (base, i + 1, shards, self.prefix)
+            for i in range(shards)]
+
+    def _sharded_cache(self, name, x, x_class, mode, estimated_records=None, shard=None, **kw):
+        shards = self.shards[name]
+        if shards == 1:
+            return self._x_cache(x, x_class, mode, estimated_records, **kw)
+        fnames = self.shard_fnames(x, shards)
+        if estimated_records:
+            estimated_records //= shards
+        if shard is not None:
+            return self._x_cache(fnames[shard], x_class, mode, estimated_records, **kw)
+
+        if x in self.caches:
+            current_mode, cache = self.caches[x]
+            if current_mode == mode:
+                return cache
+            else:
+                cache.close()
+        dbs = [x_class(fname, mode, estimated_records=estimated_records, **kw)
+            for fname in fnames]
+        if name == 'coords':
+            cache = ShardedCoordsDB(dbs)
+        else:
+            cache = ShardedDB(dbs)
+        self.caches[x] = mode, cache
 
-    def relations_cache(self, mode='r', estimated_records=None):
-        return self._x_cache(self.relations_fname, RelationDB, mode, estimated_records)
+        return cache
 
-    def _x_cache(self, x, x_class, mode, estimated_records=None):
+    def _x_cache(self, x, x_class, mode, estimated_records=None, **kw):
+        if self.in_memory:
+            # in-memory caches are kept open for all modes and after close
+            if x not in self.memory_caches:
+                self.memory_caches[x] = x_class(x, mode)
+            cache = self.memory_caches[x]
+            self.caches[x] = mode, cache
+            return cache
         if x in self.caches:
             current_mode, cache = self.caches[x]
             if current_mode == mode:
                 return cache
             else:
                 cache.close()
-        cache = x_class(x, mode, estimated_records=estimated_records)
+        cache = x_class(x, mode, estimated_records=estimated_records, **kw)
         self.caches[x] = mode, cache
 
         return cache
@@ -0,0 +1,104 @@
+# Copyright 2011 Omniscale (http://omniscale.com)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Statistics of existing cache files (``imposm --cache-stats``).
+"""
+
+import os
+import time
+import random
+
+from imposm.cache.osm import cache_names
+
+__all__ = ['cache_file_stats', 'format_file_stats']
+
+def disk_usage(fname):
+    """
+    Return the allocated bytes of a (possibly sparse) file.
+    """
+    st = os.stat(fname)
+    if hasattr(st, 'st_blocks'):
+        return st.st_blocks * 512
+    return st.st_size
+
+def file_stats(cache, fname, sample_size=1000):
+    """
+    Return the statistics of a single opened cache.
+
+    Scans all records and then reads a random sample of the records.
+    The file was just scanned, so the random reads measure the lookups
+    from the OS page cache. ``scan_usec`` and ``read_usec`` are the
+    average times for each record in microseconds.
+    """
+    start = time.time()
+    stats = cache.scan_stats(sample_size=sample_size)
+    scan_time = time.time() - start
+
+    sample = stats.pop('sample')
+    random.shuffle(sample)
+    start = time.time()
+    for osmid in sample:
+        cache.get(osmid)
+    read_time = time.time() - start
+
+    records = stats['records']
+    disk_bytes = disk_usage(fname)
+    stats['disk_bytes'] = disk_bytes
+    stats['bytes_per_record'] = float(disk_bytes) / records if records else 0.0
+    stats['compression_ratio'] = (
+        float(stats['data_bytes']) / disk_bytes if disk_bytes else 0.0)
+    stats['scan_usec'] = scan_time * 1e6 / records if records else 0.0
+    stats['read_usec'] = read_time * 1e6 / len(sample) if sample else 0.0
+    return stats
+
+def cache_file_stats(osm_cache, sample_size=1000):
+    """
+    Return a list with (filename, stats) for all existing cache files
+    of `osm_cache`, see `file_stats`.
+    """
+    result = []
+    for name in cache_names:
+        fname = getattr(osm_cache, name + '_fname')
+        shards = osm_cache.shards.get(name, 1)
+        open_cache = getattr(osm_cache, name + '_cache')
+        for shard, shard_fname in enumerate(osm_cache.shard_fnames(fname, shards)):
+            if not os.path.exists(shard_fname):
+                continue
+            if shards > 1:
+                cache = open_cache(mode='r', shard=shard)
+            else:
+                cache = open_cache(mode='r')
+            result.append((shard_fname, file_stats(cache, shard_fname, sample_size)))
+            osm_cache.close_all()
+    return result
+
+def format_file_stats(fname, stats):
+    """
+    Return the stats of a cache file as a list of lines.
+    """
+    lines = [
+        '%s: %d records, %.1fMB on disk, %.1f bytes/record' % (
+            os.path.basename(fname), stats['records'],
+            stats['disk_bytes'] / 1024.0 / 1024.0, stats['bytes_per_record']),
+        '  ids %d-%d, compression ratio %.2f' % (
+            stats['min_id'], stats['max_id'], stats['compression_ratio']),
+    ]
+    if 'buckets' in stats:
+        lines.append('  %d buckets, %.1f nodes/bucket (%.1f%% filled)' % (
+            stats['buckets'], float(stats['records']) / (stats['buckets'] or 1),
+            stats['bucket_fill'] * 100))
+    lines.append('  sequential scan %.2fus/record, random read %.2fus/record' % (
+        stats['scan_usec'], stats['read_usec']))
+    return lines
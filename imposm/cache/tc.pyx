@@ -1,8 +1,18 @@
 from imposm.base import Node, Way, Relation
-from libc.stdint cimport uint32_t, int64_t
+from libc.stdint cimport uint8_t, uint16_t, uint32_t, int64_t, uint64_t, INT64_MIN
+from libc.stdio cimport FILE, fopen, fclose, fread, fwrite, fseek, SEEK_SET
+from libc.stdlib cimport malloc, realloc, free, qsort
+from libc.string cimport memcmp, memcpy, memmove, memset
+import os
+import heapq
+import marshal
+
+cdef extern from "stdlib.h":
+    double drand48() nogil
 
 cdef extern from "Python.h":
     object PyString_FromStringAndSize(char *s, Py_ssize_t len)
+    object PyUnicode_DecodeUTF8(char *s, Py_ssize_t size, char *errors)
 
 cdef extern from "marshal.h":
     object PyMarshal_ReadObjectFromString(char *string, Py_ssize_t len)
@@ -10,6 +20,7 @@ cdef extern from "marshal.h":
 
 cdef extern from "tcutil.h":
     ctypedef int TCCMP()
+    ctypedef void *TCCODEC(void *ptr, int size, int *sp, void *op)
     cdef int tccmpint32()
     cdef int tccmpint64()
 
@@ -44,8 +55,10 @@ cdef extern from "tcbdb.h":
     bint tcbdbtune(TCBDB *db, int lmemb, int nmemb,
                    int bnum, int apow, int fpow, int opts)
     bint tcbdbsetcache(TCBDB *bdb, int lcnum, int ncnum)
+    bint tcbdbsetxmsiz(TCBDB *bdb, int64_t xmsiz)
 
     bint tcbdbsetcmpfunc(TCBDB *bdb, TCCMP cmp, void *cmpop)
+    bint tcbdbsetcodecfunc(TCBDB *bdb, TCCODEC enc, void *encop, TCCODEC dec, void *decop)
     bint tcbdbsetmutex(TCBDB *bdb)
 
     bint tcbdbopen(TCBDB *, char *, int)
@@ -55,6 +68,9 @@ cdef extern from "tcbdb.h":
     void *tcbdbget3(TCBDB *bdb, void *kbuf, int ksiz, int *sp) nogil
 
     long tcbdbrnum(TCBDB *bdb)
+    uint8_t tcbdbopts(TCBDB *bdb)
+    bint tcbdboptimize(TCBDB *bdb, int lmemb, int nmemb,
+                       int64_t bnum, int apow, int fpow, int opts) nogil
 
     BDBCUR *tcbdbcurnew(TCBDB *bdb)
     void tcbdbcurdel(BDBCUR *cur)
@@ -63,11 +79,91 @@ cdef extern from "tcbdb.h":
     void *tcbdbcurkey3(BDBCUR *cur, int *sp)
     void *tcbdbcurval3(BDBCUR *cur, int *sp)
 
+cdef extern from "tchdb.h":
+    ctypedef enum:
+        HDBOREADER = 1 << 0 # /* open as a reader */
+        HDBOWRITER = 1 << 1 # /* open as a writer */
+        HDBOCREAT = 1 << 2  # /* writer creating */
+        HDBONOLCK = 1 << 4  # /* open without locking */
+
+    ctypedef enum:
+        HDBTLARGE = 1 << 0,  # /* use 64-bit bucket array */
+        HDBTDEFLATE = 1 << 1 # /* compress each record with Deflate */
+        HDBTBZIP = 1 << 2,   # /* compress each record with BZIP2 */
+        HDBTTCBS = 1 << 3,   # /* compress each record with TCBS */
+        HDBTEXCODEC = 1 << 4 # /* compress each record with outer functions */
+
+    ctypedef void TCHDB
+
+    TCHDB *tchdbnew()
+    void tchdbdel(TCHDB *)
+    int tchdbecode(TCHDB *)
+
+    bint tchdbtune(TCHDB *hdb, int64_t bnum, int apow, int fpow, int opts)
+    bint tchdbsetcache(TCHDB *hdb, int rcnum)
+    bint tchdbsetxmsiz(TCHDB *hdb, int64_t xmsiz)
+    bint tchdbsetcodecfunc(TCHDB *hdb, TCCODEC enc, void *encop, TCCODEC dec, void *decop)
+
+    bint tchdbopen(TCHDB *, char *, int)
+    bint tchdbclose(TCHDB *)
+    bint tchdbput(TCHDB *, void *, int, void *, int)
+    void *tchdbget(TCHDB *, void *, int, int *)
+    int tchdbvsiz(TCHDB *, void *, int)
+    bint tchdbiterinit(TCHDB *)
+    void *tchdbiternext(TCHDB *, int *)
+    uint64_t tchdbrnum(TCHDB *)
+    uint8_t tchdbopts(TCHDB *hdb)
+    bint tchdboptimize(TCHDB *hdb, int64_t bnum, int apow, int fpow, int opts) nogil
+
+cdef extern from "codec.h":
+    bint IMPOSM_HAS_LZ4
+    void *imposm_lz4_encode(void *ptr, int size, int *sp, void *op)
+    void *imposm_lz4_decode(void *ptr, int size, int *sp, void *op)
+
+cdef extern from "sys/types.h":
+    ctypedef long off_t
+
+cdef extern from "fcntl.h":
+    int O_RDONLY
+    int O_RDWR
+    int O_CREAT
+    int c_open "open" (char *pathname, int flags, int mode)
+
+cdef extern from "unistd.h":
+    int c_close "close" (int fd)
+    int ftruncate(int fd, off_t length)
+    ssize_t c_read "read" (int fd, void *buf, size_t count) nogil
+    off_t lseek(int fd, off_t offset, int whence) nogil
+    int SEEK_DATA
+    int SEEK_HOLE
+    long sysconf(int name)
+    int _SC_PAGESIZE
+
+cdef extern from "errno.h":
+    int errno
+    int ENXIO
+
+cdef extern from "sys/stat.h":
+    cdef struct stat:
+        off_t st_size
+    int fstat(int fd, stat *buf)
+
+cdef extern from "sys/mman.h":
+    int PROT_READ
+    int PROT_WRITE
+    int MAP_SHARED
+    void *MAP_FAILED
+    void *mmap(void *addr, size_t length, int prot, int flags, int fd, off_t offset)
+    int munmap(void *addr, size_t length)
+    int mincore(void *addr, size_t length, unsigned char *vec)
+
 
 DEF COORD_FACTOR = 11930464.7083 # ((2<<31)-1)/360.0
 
 cdef uint32_t _coord_to_uint32(double x) nogil:
-    return <uint32_t>((x + 180.0) * COORD_FACTOR)
+    # rounded, so fixed-point values (e.g. from the coords caches) are
+    # stored again without any loss
+    return <uint32_t>((x + 180.0) * COORD_FACTOR + 0.5)
 
 cdef double _uint32_to_coord(uint32_t x) nogil:
     return <double>((x / COORD_FACTOR) - 180.0)
@@ -82,37 +178,359 @@ cdef inline coord coord_struct(double x, double y) nogil:
     p.y = _coord_to_uint32(y)
     return p
 
+cdef class CoordBuffer:
+    """
+    Coordinates for a list of refs as one contiguous array of fixed-point
+    coords, the same structs as in the coords caches.
+
+    ``missing`` is the number of refs without coordinates and ``mask``
+    is a string with a '\\x01' for each found ref and '\\x00' for each
+    missing ref.
+
+    Supports the array interface, so Shapely can build geometries
+    from it without creating Python tuples for each coordinate. The
+    coords are converted to doubles (x0, y0, x1, y1, ...) only once,
+    with the first access of the array interface.
+
+    Slices and the concatenation of two buffers are new CoordBuffers,
+    e.g. to merge the coords of ways to rings.
+    """
+    cdef coord *points
+    cdef double *coords # NULL till the first conversion
+    cdef char *found
+    cdef Py_ssize_t size
+    cdef readonly Py_ssize_t missing
+
+    def __cinit__(self):
+        self.points = NULL
+        self.coords = NULL
+        self.found = NULL
+        self.size = 0
+        self.missing = 0
+
+    def __dealloc__(self):
+        free(self.points)
+        free(self.coords)
+        free(self.found)
+
+    cdef inline void _set(self, Py_ssize_t i, coord p) nogil:
+        self.points[i] = p
+        self.found[i] = 1
+
+    cdef inline void _unset(self, Py_ssize_t i) nogil:
+        self.points[i].x = 0
+        self.points[i].y = 0
+        self.found[i] = 0
+        self.missing += 1
+
+    cdef inline void _copy(self, Py_ssize_t i, CoordBuffer other, Py_ssize_t j) nogil:
+        """
+        Copy coord j of other to i, without updating ``missing``.
+        """
+        self.points[i] = other.points[j]
+        self.found[i] = other.found[j]
+
+    cdef double *_doubles(self) except NULL:
+        """
+        Return the coords as doubles, missing coords are 0.0.
+        """
+        cdef Py_ssize_t i
+        if self.coords:
+            return self.coords
+        self.coords = <double *>malloc(self.size * 2 * sizeof(double) + 1)
+        if not self.coords:
+            raise MemoryError()
+        for i in range(self.size):
+            if self.found[i]:
+                self.coords[i*2] = _uint32_to_coord(self.points[i].x)
+                self.coords[i*2+1] = _uint32_to_coord(self.points[i].y)
+            else:
+                self.coords[i*2] = 0.0
+                self.coords[i*2+1] = 0.0
+        return self.coords
+
+    cdef inline object _coord(self, Py_ssize_t i):
+        if not self.found[i]:
+            return 0.0, 0.0
+        return _uint32_to_coord(self.points[i].x), _uint32_to_coord(self.points[i].y)
+
+    def __len__(self):
+        return self.size
+
+    def __getitem__(self, idx):
+        cdef Py_ssize_t i, n = 0
+        cdef CoordBuffer buf
+        if isinstance(idx, slice):
+            indices = range(*idx.indices(self.size))
+            buf = _coord_buffer(len(indices))
+            for i in indices:
+                buf._copy(n, self, i)
+                if not self.found[i]:
+                    buf.missing += 1
+                n += 1
+            return buf
+        i = idx
+        if i < 0:
+            i += self.size
+        if i < 0 or i >= self.size:
+            raise IndexError('coord index out of range')
+        return self._coord(i)
+
+    def __iter__(self):
+        return iter(self.tolist())
+
+    def __add__(a, b):
+        if not isinstance(a, CoordBuffer) or not isinstance(b, CoordBuffer):
+            return NotImplemented
+        return _concat_coord_buffers(a, b)
+
+    def tolist(self):
+        """
+        Return coordinates as list of (x, y) tuples.
+        """
+        cdef Py_ssize_t i
+        return [self._coord(i) for i in range(self.size)]
+
+    property mask:
+        def __get__(self):
+            return PyString_FromStringAndSize(self.found, self.size)
+
+    property __array_interface__:
+        def __get__(self):
+            return {
+                'version': 3,
+                'shape': (self.size, 2),
+                'typestr': '<f8',
+                'data': (<Py_ssize_t>self._doubles(), False),
+            }
+
+    def __repr__(self):
+        return 'CoordBuffer(%r)' % (self.tolist(), )
+
+cdef CoordBuffer _coord_buffer(Py_ssize_t size):
+    cdef CoordBuffer buf = CoordBuffer()
+    buf.points = <coord *>malloc(size * sizeof(coord) + 1)
+    buf.found = <char *>malloc(size + 1)
+    if not buf.points or not buf.found:
+        raise MemoryError()
+    buf.size = size
+    return buf
+
+cdef CoordBuffer _concat_coord_buffers(CoordBuffer a, CoordBuffer b):
+    cdef CoordBuffer buf = _coord_buffer(a.size + b.size)
+    memcpy(buf.points, a.points, a.size * sizeof(coord))
+    memcpy(buf.points + a.size, b.points, b.size * sizeof(coord))
+    memcpy(buf.found, a.found, a.size)
+    memcpy(buf.found + a.size, b.found, b.size)
+    buf.missing = a.missing + b.missing
+    return buf
+
+cdef int64_t *_int64_array(refs, Py_ssize_t *size) except NULL:
+    """
+    Copy refs into a new malloced int64 array.
+    """
+    cdef Py_ssize_t i
+    cdef int64_t *ids
+    size[0] = len(refs)
+    ids = <int64_t *>malloc(size[0] * sizeof(int64_t) + 1)
+    if not ids:
+        raise MemoryError()
+    for i in range(size[0]):
+        ids[i] = refs[i]
+    return ids
+
+ctypedef bint (*coord_get_func)(void *db, int64_t osmid, coord *p) nogil
+
+cdef CoordBuffer _get_coords_ids(void *db, coord_get_func get, int64_t *ids,
+    Py_ssize_t n):
+    """
+    Return a CoordBuffer with the coordinates of n ids.
+
+    `get` calls the ``_get`` method of the coords database `db` and
+    is called without the GIL.
+    """
+    cdef Py_ssize_t i
+    cdef coord p
+    cdef CoordBuffer buf = _coord_buffer(n)
+    with nogil:
+        for i in range(n):
+            if get(db, ids[i], &p):
+                buf._set(i, p)
+            else:
+                buf._unset(i)
+    return buf
+
+cdef CoordBuffer _get_coords_many(void *db, coord_get_func get, refs):
+    """
+    Return a CoordBuffer with the coordinates of all refs.
+    """
+    cdef Py_ssize_t n
+    cdef int64_t *ids = _int64_array(refs, &n)
+    try:
+        return _get_coords_ids(db, get, ids, n)
+    finally:
+        free(ids)
+
+cdef list _get_coords_batch(void *db, coord_get_func get, refs_list):
+    return [_get_coords_many(db, get, refs) for refs in refs_list]
+
+cdef _sample_add(list sample, Py_ssize_t sample_size, int64_t seen, int64_t osmid):
+    """
+    Add osmid to a random sample of up to sample_size ids (reservoir
+    sampling). `seen` is the number of ids before this id.
+    """
+    cdef int64_t i
+    if seen < sample_size:
+        sample.append(osmid)
+    elif sample_size:
+        i = <int64_t>(drand48() * (seen + 1))
+        if i < sample_size:
+            sample[i] = osmid
+
+cdef dict _scan_result(int64_t records, int64_t data_bytes, int64_t min_id,
+    int64_t max_id, list sample):
+    return {
+        'records': records,
+        'data_bytes': data_bytes,
+        'min_id': min_id,
+        'max_id': max_id,
+        'sample': sample,
+    }
+
 _modes = {
     'w': BDBOWRITER | BDBOCREAT,
     'r': BDBOREADER | BDBONOLCK,
 }
 
+compression_codecs = {
+    'none': 0,
+    'deflate': BDBTDEFLATE,
+    'bzip2': BDBTBZIP,
+    'tcbs': BDBTTCBS,
+    'lz4': BDBTEXCODEC,
+}
+
+_lz4_missing_message = '%s is lz4 compressed, but Imposm was built without lz4'
+
+def available_compression_codecs():
+    codecs = set(compression_codecs)
+    if not IMPOSM_HAS_LZ4:
+        codecs.remove('lz4')
+    return codecs
+
+ctypedef struct bulk_record:
+    int64_t osmid
+    Py_ssize_t seq # insertion order, the last put of an id wins
+    size_t offset # offset of the data in the bulk buffer
+    int size
+
+cdef int _cmp_bulk_record(const void *a, const void *b) nogil:
+    cdef bulk_record *x = <bulk_record *>a
+    cdef bulk_record *y = <bulk_record *>b
+    if x.osmid != y.osmid:
+        return (x.osmid > y.osmid) - (x.osmid < y.osmid)
+    return (x.seq > y.seq) - (x.seq < y.seq)
+
+cdef int _cmp_bulk_record_seq(const void *a, const void *b) nogil:
+    cdef bulk_record *x = <bulk_record *>a
+    cdef bulk_record *y = <bulk_record *>b
+    return (x.seq > y.seq) - (x.seq < y.seq)
+
+ctypedef struct put_record:
+    int64_t osmid
+    char *data
+    int size
+
+DEF BULK_BUFFER_SIZE = 16 * 1024 * 1024 # bytes of buffered data in bulk mode
+DEF OPTIMIZE_KEEP_OPTS = 0xff # UINT8_MAX, keep the compression options
+
 cdef class BDB:
+    """
+    B+ tree database with int64 keys.
+
+    :param compression: page compression (none, deflate, bzip2, tcbs or lz4)
+    :param lmemb: number of records in each leaf page
+    :param nmemb: number of records in each non-leaf page
+    :param bulk: build a new database from (mostly) sorted puts
+    :param lcnum: number of cached leaf pages
+    :param ncnum: number of cached non-leaf pages
+    :param xmsiz: size of the memory mapped part of the file in bytes
+
+    The tuning options only affect newly created databases, except
+    lz4 compression, which needs to be set for reading too. The cache
+    options apply to each open database.
+
+    In bulk mode all puts are collected in a buffer and written
+    sorted by id, so that Tokyo Cabinet only appends to the last leaf.
+    The pages are tuned twice as large, since Tokyo Cabinet splits
+    full pages in half. This tolerates the interleaved batches of the
+    parallel parser. It falls back to normal puts for ids lower than
+    the already written ids. The bulk mode is ignored for existing
+    (non-empty) databases.
+    """
     cdef TCBDB *db
     cdef object filename
     cdef int _opened
     cdef BDBCUR *_cur
-    def __cinit__(self, filename, mode='w', estimated_records=0):
+    cdef bint _bulk
+    cdef bulk_record *_bulk_recs
+    cdef bulk_record *_bulk_tmp # merge space for _bulk_index
+    cdef Py_ssize_t _bulk_len
+    cdef Py_ssize_t _bulk_cap
+    cdef Py_ssize_t _bulk_sorted # records at the front sorted by _bulk_index
+    cdef Py_ssize_t _bulk_seq
+    cdef char *_bulk_data
+    cdef size_t _bulk_data_len
+    cdef size_t _bulk_data_cap
+    cdef int64_t _bulk_last_id # highest written id
+    cdef int64_t _bulk_max_id # highest buffered or written id
+    def __cinit__(self, *args, **kw):
         self.db = tcbdbnew()
         self._opened = 0
+        self._bulk = 0
 
-    def __init__(self, filename, mode='w', estimated_records=0):
+    def __init__(self, filename, mode='w', estimated_records=0,
+        compression='deflate', lmemb=None, nmemb=None, bulk=False,
+        lcnum=None, ncnum=None, xmsiz=None):
         self.filename = filename
-        self._tune_db(estimated_records)
+        if compression not in available_compression_codecs():
+            raise ValueError('unsupported compression %r' % compression)
+        if IMPOSM_HAS_LZ4:
+            # existing lz4 caches need the codec, even if they are opened
+            # with another compression option
+            tcbdbsetcodecfunc(self.db, imposm_lz4_encode, NULL,
+                imposm_lz4_decode, NULL)
+        lmemb = lmemb or 128
+        nmemb = nmemb or -1
+        if bulk and mode == 'w' and not (
+            os.path.exists(filename) and os.path.getsize(filename)):
+            self._bulk = 1
+            self._bulk_last_id = self._bulk_max_id = INT64_MIN
+            # sorted puts leave half-filled pages behind
+            lmemb *= 2
+            nmemb = nmemb * 2 if nmemb > 0 else 512
+        self._tune_db(estimated_records, compression_codecs[compression],
+            lmemb, nmemb)
         tcbdbsetcmpfunc(self.db, tccmpint64, NULL)
+        if lcnum or ncnum:
+            tcbdbsetcache(self.db, lcnum or 0, ncnum or 0)
+        if xmsiz:
+            tcbdbsetxmsiz(self.db, xmsiz)
         if not tcbdbopen(self.db, filename, _modes[mode]):
             raise IOError(tcbdbecode(self.db))
         self._opened = 1
+        if tcbdbopts(self.db) & BDBTEXCODEC and not IMPOSM_HAS_LZ4:
+            tcbdbclose(self.db)
+            self._opened = 0
+            raise IOError(_lz4_missing_message % filename)
     
-    def _tune_db(self, estimated_records):
+    def _tune_db(self, estimated_records, codec, lmemb, nmemb):
         if estimated_records:
-            lmemb = 128 # default
-            nmemb = -1
             fpow = 13 # 2^13 = 8196
             bnum = int((estimated_records*3)/lmemb)
-            tcbdbtune(self.db, lmemb, nmemb, bnum, 5, fpow, BDBTLARGE | BDBTDEFLATE)
+            tcbdbtune(self.db, lmemb, nmemb, bnum, 5, fpow, BDBTLARGE | codec)
         else:
-            tcbdbtune(self.db, -1, -1, -1, 5, 13, BDBTLARGE | BDBTDEFLATE)
+            tcbdbtune(self.db, lmemb, nmemb, -1, 5, 13, BDBTLARGE | codec)
     
     def get(self, int64_t osmid):
         """
@@ -121,9 +539,9 @@ cdef class BDB:
         """
         cdef void *ret
         cdef int ret_size
-        ret = tcbdbget3(self.db, <char *>&osmid, sizeof(int64_t), &ret_size)
+        ret = self._get_raw(osmid, &ret_size)
         if not ret: return None
-        return self._obj(osmid, PyMarshal_ReadObjectFromString(<char *>ret, ret_size))
+        return self._obj(osmid, self._decode(<char *>ret, ret_size))
 
     def get_raw(self, int64_t osmid):
         """
@@ -132,7 +550,7 @@ cdef class BDB:
         """
         cdef void *ret
         cdef int ret_size
-        ret = tcbdbget3(self.db, <char *>&osmid, sizeof(int64_t), &ret_size)
+        ret = self._get_raw(osmid, &ret_size)
         if not ret: return None
         return PyString_FromStringAndSize(<char *>ret, ret_size)
 
@@ -140,7 +558,258 @@ cdef class BDB:
         return self.put_marshaled(osmid, PyMarshal_WriteObjectToString(data, 2))
 
     def put_marshaled(self, int64_t osmid, data):
-        return tcbdbput(self.db, <char *>&osmid, sizeof(int64_t), <char *>data, len(data))
+        return self._put_raw(osmid, <char *>data, len(data))
+
+    def put_many(self, items, marshaled=False):
+        """
+        Store a batch of ``(osmid, tags, data)`` tuples from the parser,
+        or of ``(osmid, marshaled_data)`` tuples if `marshaled` is True.
+        Returns the number of stored items.
+
+        All items are encoded before Tokyo Cabinet stores them without
+        the GIL.
+        """
+        if marshaled:
+            records = [self._encode_marshaled(item[1]) for item in items]
+        else:
+            records = [self._encode(item[1], item[2]) for item in items]
+        return self._put_batch(items, records)
+
+    def put_records(self, items):
+        """
+        Store a batch of ``(osmid, record)`` tuples with records that are
+        already encoded for this database (see `RecordEncoder`).
+        Returns the number of stored items.
+        """
+        return self._put_batch(items, [item[1] for item in items])
+
+    cdef Py_ssize_t _put_batch(self, items, list records) except -1:
+        cdef Py_ssize_t i, n = len(records)
+        cdef put_record *recs
+        if not n:
+            return 0
+        recs = <put_record *>malloc(n * sizeof(put_record))
+        if not recs:
+            raise MemoryError()
+        try:
+            for i in range(n):
+                data = records[i]
+                recs[i].osmid = items[i][0]
+                recs[i].data = <char *>data
+                recs[i].size = len(data)
+            self._put_records(recs, n)
+        finally:
+            free(recs)
+        return n
+
+    cdef object _encode(self, tags, data):
+        return PyMarshal_WriteObjectToString((tags, data), 2)
+
+    cdef object _encode_marshaled(self, data):
+        return data
+
+    cdef int _put_records(self, put_record *recs, Py_ssize_t n) except -1:
+        """
+        Store n raw records. In bulk mode they are only copied into the
+        bulk buffer, all other records are stored without the GIL.
+        """
+        cdef Py_ssize_t i = 0
+        cdef bint ok = 1
+        while i < n and self._bulk:
+            if not self._put_raw(recs[i].osmid, recs[i].data, recs[i].size):
+                raise IOError(tcbdbecode(self.db))
+            i += 1
+        if i == n:
+            return 0
+        with nogil:
+            while i < n:
+                if not tcbdbput(self.db, <char *>&recs[i].osmid, sizeof(int64_t),
+                    recs[i].data, recs[i].size):
+                    ok = 0
+                    break
+                i += 1
+        if not ok:
+            raise IOError(tcbdbecode(self.db))
+        return 0
+
+    cdef int _put_raw(self, int64_t osmid, void *data, int size) except -1:
+        """
+        Store the raw data for osmid.
+        Returns 1 on success and 0 if Tokyo Cabinet failed.
+        """
+        if self._bulk:
+            if osmid > self._bulk_last_id:
+                self._bulk_append(osmid, data, size)
+                if self._bulk_data_len >= BULK_BUFFER_SIZE:
+                    self._bulk_flush(0)
+                return 1
+            # out-of-order id, continue with normal puts
+            self._end_bulk()
+        return tcbdbput(self.db, <char *>&osmid, sizeof(int64_t), data, size)
+
+    cdef void *_get_raw(self, int64_t osmid, int *size) nogil:
+        """
+        Return the raw data for osmid, or NULL.
+        The data is only valid till the next put.
+        """
+        cdef Py_ssize_t lo = 0, hi, mid
+        if self._bulk and osmid > self._bulk_last_id:
+            if osmid > self._bulk_max_id:
+                return NULL
+            # search the newest buffered record (only for updates of
+            # buffered records, e.g. re-evicted DeltaCoordsDB buckets)
+            self._bulk_index()
+            hi = self._bulk_len
+            while lo < hi:
+                mid = (lo + hi) // 2
+                if self._bulk_recs[mid].osmid <= osmid:
+                    lo = mid + 1
+                else:
+                    hi = mid
+            if lo == 0 or self._bulk_recs[lo - 1].osmid != osmid:
+                return NULL
+            size[0] = self._bulk_recs[lo - 1].size
+            return self._bulk_data + self._bulk_recs[lo - 1].offset
+        return tcbdbget3(self.db, <char *>&osmid, sizeof(int64_t), size)
+
+    cdef int _bulk_append(self, int64_t osmid, void *data, int size) except -1:
+        cdef bulk_record *recs
+        cdef char *buf
+        cdef size_t cap
+        if self._bulk_len == self._bulk_cap:
+            cap = self._bulk_cap * 2 if self._bulk_cap else 4096
+            recs = <bulk_record *>realloc(self._bulk_recs, cap * sizeof(bulk_record))
+            if not recs:
+                raise MemoryError()
+            self._bulk_recs = recs
+            recs = <bulk_record *>realloc(self._bulk_tmp, cap * sizeof(bulk_record))
+            if not recs:
+                raise MemoryError()
+            self._bulk_tmp = recs
+            self._bulk_cap = cap
+        if self._bulk_data_len + size > self._bulk_data_cap:
+            cap = self._bulk_data_cap * 2 if self._bulk_data_cap else 1024 * 1024
+            while cap < self._bulk_data_len + size:
+                cap *= 2
+            buf = <char *>realloc(self._bulk_data, cap)
+            if not buf:
+                raise MemoryError()
+            self._bulk_data = buf
+            self._bulk_data_cap = cap
+        self._bulk_recs[self._bulk_len].osmid = osmid
+        self._bulk_recs[self._bulk_len].seq = self._bulk_seq
+        self._bulk_recs[self._bulk_len].offset = self._bulk_data_len
+        self._bulk_recs[self._bulk_len].size = size
+        memmove(self._bulk_data + self._bulk_data_len, data, size)
+        self._bulk_len += 1
+        self._bulk_seq += 1
+        self._bulk_data_len += size
+        if osmid > self._bulk_max_id:
+            self._bulk_max_id = osmid
+        return 0
+
+    cdef void _bulk_index(self) nogil:
+        """
+        Sort the buffered records by id (and insertion order), for the
+        binary search of `_get_raw`. Only the records that were added
+        since the last call are sorted and merged with the others.
+        """
+        cdef Py_ssize_t i, j, k, s = self._bulk_sorted, n = self._bulk_len
+        if s == n:
+            return
+        qsort(self._bulk_recs + s, n - s, sizeof(bulk_record), _cmp_bulk_record)
+        if s and _cmp_bulk_record(&self._bulk_recs[s - 1], &self._bulk_recs[s]) > 0:
+            # merge from the back, the new records are in _bulk_tmp
+            memcpy(self._bulk_tmp, self._bulk_recs + s, (n - s) * sizeof(bulk_record))
+            i = s - 1
+            j = n - s - 1
+            k = n - 1
+            while j >= 0:
+                if i >= 0 and _cmp_bulk_record(&self._bulk_recs[i], &self._bulk_tmp[j]) > 0:
+                    self._bulk_recs[k] = self._bulk_recs[i]
+                    i -= 1
+                else:
+                    self._bulk_recs[k] = self._bulk_tmp[j]
+                    j -= 1
+                k -= 1
+        self._bulk_sorted = n
+
+    cdef int _bulk_flush(self, bint flush_all) except -1:
+        """
+        Write the lower half (or all) of the buffered records in sorted order.
+        """
+        cdef Py_ssize_t i, end, n = self._bulk_len
+        cdef int64_t pivot
+        cdef bulk_record *r
+        cdef size_t data_len
+        cdef bint ok = 1
+        if not n:
+            return 0
+        self._bulk_index()
+        end = n
+        if not flush_all:
+            # keep all records of the pivot id in the buffer
+            pivot = self._bulk_recs[n // 2].osmid
+            end = n // 2
+            while end > 0 and self._bulk_recs[end - 1].osmid == pivot:
+                end -= 1
+            if end == 0:
+                end = n
+
+        with nogil:
+            for i in range(end):
+                r = &self._bulk_recs[i]
+                if i + 1 < end and self._bulk_recs[i + 1].osmid == r.osmid:
+                    continue # overwritten by a later put
+                if not tcbdbput(self.db, <char *>&r.osmid, sizeof(int64_t),
+                    self._bulk_data + r.offset, r.size):
+                    ok = 0
+                    break
+        if not ok:
+            raise IOError(tcbdbecode(self.db))
+        self._bulk_last_id = self._bulk_recs[end - 1].osmid
+
+        # move the remaining records and their data to the front of the
+        # buffer, in insertion order the data only moves to lower offsets
+        n -= end
+        memmove(self._bulk_recs, self._bulk_recs + end, n * sizeof(bulk_record))
+        qsort(self._bulk_recs, n, sizeof(bulk_record), _cmp_bulk_record_seq)
+        data_len = 0
+        for i in range(n):
+            r = &self._bulk_recs[i]
+            memmove(self._bulk_data + data_len, self._bulk_data + r.offset, r.size)
+            r.offset = data_len
+            data_len += r.size
+        self._bulk_data_len = data_len
+        self._bulk_len = n
+        self._bulk_sorted = 0
+        return 0
+
+    cdef int _end_bulk(self) except -1:
+        """
+        Write all buffered records and switch to normal puts.
+        """
+        if not self._bulk:
+            return 0
+        try:
+            self._bulk_flush(1)
+        finally:
+            self._bulk = 0
+            free(self._bulk_recs)
+            free(self._bulk_tmp)
+            free(self._bulk_data)
+            self._bulk_recs = self._bulk_tmp = NULL
+            self._bulk_data = NULL
+            self._bulk_len = self._bulk_cap = self._bulk_sorted = 0
+            self._bulk_data_len = self._bulk_data_cap = 0
+        return 0
+
+    cdef object _decode(self, char *data, int size):
+        """
+        Decode the stored data.
+        Should be overridden by subclasses with their own encoding.
+        """
+        return PyMarshal_ReadObjectFromString(data, size)
 
     cdef object _obj(self, int64_t osmid, data):
         """
@@ -154,6 +823,7 @@ cdef class BDB:
         Return an iterator over the database.
         Resets any existing iterator.
         """
+        self._end_bulk()
         if self._cur:
             tcbdbcurdel(self._cur)
         self._cur = tcbdbcurnew(self.db)
@@ -164,13 +834,14 @@ cdef class BDB:
     def __contains__(self, int64_t osmid):
         cdef void *ret
         cdef int ret_size
-        ret = tcbdbget3(self.db, <char *>&osmid, sizeof(int64_t), &ret_size);
+        ret = self._get_raw(osmid, &ret_size);
         if ret:
             return 1
         else:
             return 0
     
     def __len__(self):
+        self._end_bulk()
         return tcbdbrnum(self.db)
     
     def __next__(self):
@@ -191,6 +862,25 @@ cdef class BDB:
         # return objectified item
         return self._obj(osmid, data)
 
+    def iter_batches(self, Py_ssize_t size=128, bint tagged_only=True):
+        """
+        Return an iterator over lists of up to `size` objects, see
+        `BDBBatchIterator`. Uses its own cursor, independent of any
+        iteration with `__iter__`.
+
+        :param tagged_only: skip all records without tags
+        """
+        cdef BDBBatchIterator batches = BDBBatchIterator()
+        self._end_bulk()
+        batches.db = self
+        batches.size = size
+        batches.tagged_only = tagged_only
+        batches.cur = tcbdbcurnew(self.db)
+        if not tcbdbcurfirst(batches.cur):
+            tcbdbcurdel(batches.cur)
+            batches.cur = NULL
+        return batches
+
     cdef object _get_cur(self):
         """
         Return the current object at the current cursor position
@@ -201,11 +891,74 @@ cdef class BDB:
         ret = tcbdbcurkey3(self._cur, &size)
         osmid = (<int64_t *>ret)[0]
         ret = tcbdbcurval3(self._cur, &size)
-        value = PyMarshal_ReadObjectFromString(<char *>ret, size)
+        value = self._decode(<char *>ret, size)
         return osmid, value
 
+    def scan_stats(self, value_count=None, Py_ssize_t sample_size=0):
+        """
+        Scan all records without decoding them.
+
+        Returns a dict with the number of records, the size of all keys
+        and values (``data_bytes``), the smallest and largest id and a
+        random sample of up to `sample_size` ids.
+
+        :param value_count: function that is called with each raw value,
+            the sum of the results is returned as ``values``
+        """
+        cdef BDBCUR *cur
+        cdef void *ret
+        cdef int size
+        cdef int64_t osmid, records = 0, data_bytes = 0, min_id = 0, max_id = 0
+        sample = []
+        values = 0
+        self._end_bulk()
+        cur = tcbdbcurnew(self.db)
+        try:
+            if tcbdbcurfirst(cur):
+                while True:
+                    ret = tcbdbcurkey3(cur, &size)
+                    osmid = (<int64_t *>ret)[0]
+                    data_bytes += size
+                    ret = tcbdbcurval3(cur, &size)
+                    data_bytes += size
+                    if value_count is not None:
+                        values += value_count(PyString_FromStringAndSize(<char *>ret, size))
+                    if records == 0:
+                        min_id = osmid
+                    max_id = osmid
+                    _sample_add(sample, sample_size, records, osmid)
+                    records += 1
+                    if not tcbdbcurnext(cur):
+                        break
+        finally:
+            tcbdbcurdel(cur)
+        result = _scan_result(records, data_bytes, min_id, max_id, sample)
+        if value_count is not None:
+            result['values'] = values
+        return result
+
+    def optimize(self, lmemb=None, nmemb=None):
+        """
+        Rebuild the database file in key order (e.g. after the out-of-order
+        puts of merged caches). The pages are tuned like in bulk mode and
+        the number of buckets is computed from the number of records.
+        Needs a database that was opened for writing.
+        """
+        cdef bint ok
+        cdef int c_lmemb = (lmemb or 128) * 2
+        cdef int c_nmemb = nmemb * 2 if nmemb and nmemb > 0 else 512
+        cdef int64_t bnum
+        self._end_bulk()
+        bnum = tcbdbrnum(self.db) * 3 // c_lmemb
+        with nogil:
+            ok = tcbdboptimize(self.db, c_lmemb, c_nmemb, bnum or -1, -1, -1,
+                OPTIMIZE_KEEP_OPTS)
+        if not ok:
+            raise IOError(tcbdbecode(self.db))
+
     def close(self):
         if self._opened:
+            self._end_bulk()
             tcbdbclose(self.db)
         self._opened = 0
     
@@ -213,6 +966,56 @@ cdef class BDB:
         if self._opened:
             tcbdbclose(self.db)
         tcbdbdel(self.db)
+        free(self._bulk_recs)
+        free(self._bulk_tmp)
+        free(self._bulk_data)
+
+cdef class BDBBatchIterator:
+    """
+    Iterator over lists of objects of a `BDB` (see `BDB.iter_batches`).
+
+    Advances the cursor in C. Compact records without tags are skipped
+    before they are decoded. ``count`` is the number of all records
+    that were scanned so far, including the skipped records.
+    """
+    cdef BDB db
+    cdef BDBCUR *cur
+    cdef Py_ssize_t size
+    cdef bint tagged_only
+    cdef readonly Py_ssize_t count
+
+    def __cinit__(self):
+        self.cur = NULL
+        self.count = 0
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        cdef void *ret
+        cdef int size, tagged
+        cdef int64_t osmid
+        cdef list batch = []
+        while self.cur and len(batch) < self.size:
+            ret = tcbdbcurkey3(self.cur, &size)
+            osmid = (<int64_t *>ret)[0]
+            ret = tcbdbcurval3(self.cur, &size)
+            self.count += 1
+            tagged = _record_tagged(<char *>ret, size)
+            if not self.tagged_only or tagged != 0:
+                obj = self.db._obj(osmid, self.db._decode(<char *>ret, size))
+                if not self.tagged_only or tagged == 1 or obj.tags:
+                    batch.append(obj)
+            if not tcbdbcurnext(self.cur):
+                tcbdbcurdel(self.cur)
+                self.cur = NULL
+        if not batch:
+            raise StopIteration
+        return batch
+
+    def __dealloc__(self):
+        if self.cur:
+            tcbdbcurdel(self.cur)
 
 cdef class CoordDB(BDB):
     def put(self, osmid, x, y):
@@ -221,14 +1024,46 @@ cdef class CoordDB(BDB):
     def put_marshaled(self, osmid, x, y):
         return self._put(osmid, x, y)
     
-    cdef bint _put(self, int64_t osmid, double x, double y) nogil:
+    cdef int _put(self, int64_t osmid, double x, double y) except -1:
         cdef coord p = coord_struct(x, y)
-        return tcbdbput(self.db, <char *>&osmid, sizeof(int64_t), <char *>&p, sizeof(coord))
+        return self._put_raw(osmid, <char *>&p, sizeof(coord))
+
+    def put_many(self, coords, marshaled=False):
+        """
+        Store a batch of ``(osmid, x, y)`` tuples.
+        Returns the number of stored coords.
+
+        Coords are never marshaled, `marshaled` is ignored (like
+        `put_marshaled` is the same as `put`).
+        """
+        cdef Py_ssize_t i, n = len(coords)
+        cdef int64_t osmid
+        cdef double x, y
+        cdef coord *points
+        cdef put_record *recs
+        if not n:
+            return 0
+        points = <coord *>malloc(n * sizeof(coord))
+        recs = <put_record *>malloc(n * sizeof(put_record))
+        try:
+            if not points or not recs:
+                raise MemoryError()
+            for i in range(n):
+                osmid, x, y = coords[i]
+                points[i] = coord_struct(x, y)
+                recs[i].osmid = osmid
+                recs[i].data = <char *>&points[i]
+                recs[i].size = sizeof(coord)
+            self._put_records(recs, n)
+        finally:
+            free(points)
+            free(recs)
+        return n
 
     def get(self, int64_t osmid):
         cdef coord *value
         cdef int ret_size
-        value = <coord *>tcbdbget3(self.db, <char *>&osmid, sizeof(int64_t), &ret_size)
+        value = <coord *>self._get_raw(osmid, &ret_size)
         if not value: return
         return _uint32_to_coord(value.x), _uint32_to_coord(value.y)
 
@@ -238,12 +1073,38 @@ cdef class CoordDB(BDB):
         cdef int64_t osmid
         coords = list()
         for osmid in refs:
-            value = <coord *>tcbdbget3(self.db, <char *>&osmid, sizeof(int64_t), &ret_size)
+            value = <coord *>self._get_raw(osmid, &ret_size)
             if not value: return
             coords.append((_uint32_to_coord(value.x), _uint32_to_coord(value.y)))
         
         return coords
 
+    cdef inline bint _get(self, int64_t osmid, coord *p) nogil:
+        cdef coord *value
+        cdef int ret_size
+        value = <coord *>self._get_raw(osmid, &ret_size)
+        if not value: return 0
+        p[0] = value[0]
+        return 1
+
+    def get_coords_many(self, refs):
+        """
+        Return a CoordBuffer with the coordinates of all refs.
+        """
+        return _get_coords_many(<void *>self, _coord_db_get, refs)
+
+    cdef CoordBuffer _get_coords_ids(self, int64_t *ids, Py_ssize_t n):
+        """
+        Return a CoordBuffer with the coordinates of n ids.
+        """
+        return _get_coords_ids(<void *>self, _coord_db_get, ids, n)
+
+    def get_coords_batch(self, refs_list):
+        """
+        Return a CoordBuffer for each list of refs.
+        """
+        return _get_coords_batch(<void *>self, _coord_db_get, refs_list)
+
     cdef object _get_cur(self):
         cdef int size
         cdef int64_t osmid
@@ -257,196 +1118,2730 @@ cdef class CoordDB(BDB):
     cdef object _obj(self, int64_t osmid, data):
         return osmid, data
 
-cdef class NodeDB(BDB):
-    def put(self, osmid, tags, pos):
-        return self.put_marshaled(osmid, PyMarshal_WriteObjectToString((tags, pos), 2))
-    
-    def put_marshaled(self, int64_t osmid, data):
-        return tcbdbput(self.db, <char *>&osmid, sizeof(int64_t), <char *>data, len(data))
+cdef bint _coord_db_get(void *db, int64_t osmid, coord *p) nogil:
+    return (<CoordDB>db)._get(osmid, p)
 
-    cdef object _obj(self, int64_t osmid, data):
-        return Node(osmid, data[0], data[1])
+# Page cache helpers for the warm-up of the cache files.
 
-cdef class InsertedWayDB(BDB):
-    def put(self, int64_t osmid):
-        return tcbdbput(self.db, <char *>&osmid, sizeof(int64_t), 'x', 1);
+DEF PREFETCH_CHUNK = 1024 * 1024 # bytes per read
 
-    def __next__(self):
-        """
-        Return next item as object.
-        """
-        cdef int64_t osmid
-        cdef int size
-        cdef void *ret
+cdef int64_t _prefetch_fd(int fd, char *buf, int64_t size, int64_t max_bytes) nogil:
+    cdef int64_t pos = 0, start, end, total = 0
+    cdef bint seek_data = True
+    cdef ssize_t n
+    while pos < size and (max_bytes < 0 or total < max_bytes):
+        start = pos
+        end = size
+        if seek_data:
+            start = lseek(fd, pos, SEEK_DATA)
+            if start < 0:
+                if errno == ENXIO:
+                    # only a hole after pos
+                    break
+                # SEEK_DATA is not supported by the file system
+                seek_data = False
+                start = pos
+            else:
+                end = lseek(fd, start, SEEK_HOLE)
+                if end < 0:
+                    end = size
+        if lseek(fd, start, SEEK_SET) < 0:
+            break
+        pos = start
+        while pos < end and (max_bytes < 0 or total < max_bytes):
+            n = min(PREFETCH_CHUNK, end - pos)
+            if max_bytes >= 0:
+                n = min(n, max_bytes - total)
+            n = c_read(fd, buf, n)
+            if n <= 0:
+                return total
+            pos += n
+            total += n
+    return total
 
-        if not self._cur: raise StopIteration
+def prefetch_file(filename, int64_t max_bytes=-1):
+    """
+    Read the data of the file sequentially, so that it is in the page
+    cache of the OS. Holes of sparse files (e.g. of the flat coords
+    cache) are skipped if the file system supports SEEK_DATA, and only
+    the read data counts for `max_bytes` (-1 for all). Releases the GIL
+    while reading, multiple files can be read by parallel threads.
 
-        ret = tcbdbcurkey3(self._cur, &size)
-        osmid = (<int64_t *>ret)[0]
+    Returns the number of read bytes.
+    """
+    cdef stat st
+    cdef int fd
+    cdef char *buf
+    cdef int64_t total
+    fd = c_open(filename, O_RDONLY, 0)
+    if fd < 0:
+        raise IOError('unable to open %s' % filename)
+    buf = <char *>malloc(PREFETCH_CHUNK)
+    try:
+        if not buf:
+            raise MemoryError()
+        if fstat(fd, &st) != 0:
+            raise IOError('unable to stat %s' % filename)
+        with nogil:
+            total = _prefetch_fd(fd, buf, st.st_size, max_bytes)
+    finally:
+        free(buf)
+        c_close(fd)
+    return total
 
-        # advance cursor, set to NULL if at the end
-        if tcbdbcurnext(self._cur) == 0:
-            tcbdbcurdel(self._cur)
-            self._cur = NULL
+def resident_bytes(filename):
+    """
+    Return the number of bytes of the file that are in the page cache.
+    """
+    cdef stat st
+    cdef int fd
+    cdef void *data
+    cdef unsigned char *vec
+    cdef size_t i, pages, page_size = sysconf(_SC_PAGESIZE)
+    cdef int64_t resident = 0
+    fd = c_open(filename, O_RDONLY, 0)
+    if fd < 0:
+        raise IOError('unable to open %s' % filename)
+    try:
+        if fstat(fd, &st) != 0:
+            raise IOError('unable to stat %s' % filename)
+        if st.st_size == 0:
+            return 0
+        pages = (st.st_size + page_size - 1) // page_size
+        data = mmap(NULL, st.st_size, PROT_READ, MAP_SHARED, fd, 0)
+        if data == MAP_FAILED:
+            raise IOError('unable to mmap %s' % filename)
+        vec = <unsigned char *>malloc(pages)
+        try:
+            if not vec:
+                raise MemoryError()
+            if mincore(data, st.st_size, vec) != 0:
+                raise IOError('unable to check pages of %s' % filename)
+            for i in range(pages):
+                if vec[i] & 1:
+                    resident += page_size
+        finally:
+            free(vec)
+            munmap(data, st.st_size)
+    finally:
+        c_close(fd)
+    return min(resident, st.st_size)
 
-        return osmid
+DEF FLAT_COORDS_GROW = 8 * 1024 * 1024 # coords per resize (64MB)
 
-cdef class RefTagDB(BDB):
+cdef class FlatCoordsDB:
     """
-    Database for items with references and tags (i.e. ways/relations).
+    Coordinates database that stores the coord structs in a sparse,
+    memory-mapped file. The OSM id is the index into the file, so each
+    lookup is a single memory access.
+    Unused slots are zero, which is not a valid coord (latitude of -180).
     """
-    def put(self, osmid, tags, refs):
-        return self.put_marshaled(osmid, PyMarshal_WriteObjectToString((tags, refs), 2))
-    
-    def put_marshaled(self, int64_t osmid, data):
-        return tcbdbput(self.db, <char *>&osmid, sizeof(int64_t), <char *>data, len(data))
+    cdef int fd
+    cdef coord *coords
+    cdef int64_t size
+    cdef int writable
+    cdef object filename
 
-cdef class WayDB(RefTagDB):
-    cdef object _obj(self, int64_t osmid, data):
-        return Way(osmid, data[0], data[1])
+    def __cinit__(self, filename, mode='w', estimated_records=0):
+        self.fd = -1
+        self.coords = NULL
+        self.size = 0
 
-cdef class RelationDB(RefTagDB):
-    cdef object _obj(self, int64_t osmid, data):
-        return Relation(osmid, data[0], data[1])
+    def __init__(self, filename, mode='w', estimated_records=0):
+        cdef stat st
+        self.filename = filename
+        self.writable = mode == 'w'
+        if self.writable:
+            self.fd = c_open(filename, O_RDWR | O_CREAT, 0644)
+        else:
+            self.fd = c_open(filename, O_RDONLY, 0)
+        if self.fd < 0:
+            raise IOError('unable to open %s' % filename)
+        if fstat(self.fd, &st) != 0:
+            raise IOError('unable to stat %s' % filename)
+        self._map(st.st_size // sizeof(coord))
 
-from imposm.cache.internal import DeltaCoords as _DeltaCoords
-from collections import deque
-import bisect
-
-cdef unzip_nodes(list nodes):
-    cdef int64_t last_lon, last_lat, lon, lat
-    cdef double lon_f, lat_f
-    cdef int64_t last_id, id
-    ids, lons, lats = [], [], []
-    last_id = last_lon = last_lat = 0
-    for id, lon_f, lat_f in nodes:
-        lon = _coord_to_uint32(lon_f)
-        lat = _coord_to_uint32(lat_f)
-        
-        ids.append(id - last_id)
-        lons.append(lon - last_lon)
-        lats.append(lat - last_lat)
-        last_id = id
-        last_lon = lon
-        last_lat = lat
-    
-    return ids, lons, lats
+    cdef _map(self, int64_t size):
+        cdef int prot = PROT_READ
+        if self.coords:
+            munmap(self.coords, self.size * sizeof(coord))
+            self.coords = NULL
+            self.size = 0
+        if size == 0:
+            return
+        if self.writable:
+            prot |= PROT_WRITE
+        self.coords = <coord *>mmap(NULL, size * sizeof(coord), prot,
+            MAP_SHARED, self.fd, 0)
+        if self.coords == MAP_FAILED:
+            self.coords = NULL
+            raise IOError('unable to mmap %s' % self.filename)
+        self.size = size
 
-cdef zip_nodes(tuple ids, tuple lons, tuple lats):
-    cdef uint32_t last_lon, last_lat
-    cdef int64_t last_id
-    nodes = []
-    last_id = last_lon = last_lat = 0
+    cdef _grow(self, int64_t osmid):
+        cdef int64_t size = (osmid // FLAT_COORDS_GROW + 1) * FLAT_COORDS_GROW
+        # file is sparse, unwritten slots do not use any disk space
+        if ftruncate(self.fd, size * sizeof(coord)) != 0:
+            raise IOError('unable to resize %s' % self.filename)
+        self._map(size)
 
-    for i in range(len(ids)):
-        last_id += ids[i]
-        last_lon += lons[i]
-        last_lat += lats[i]
-    
-        nodes.append((
-            last_id,
-            _uint32_to_coord(last_lon),
-            _uint32_to_coord(last_lat)
-        ))
-    return nodes
-
-class DeltaNodes(object):
-    def __init__(self, data=None):
-        self.nodes = []
-        self.changed = False
-        if data:
-            self.deserialize(data)
-    
-    def changed(self):
-        return self.changed
-    
-    def get(self, int64_t osmid):
-        i = bisect.bisect(self.nodes, (osmid, ))
-        if i != len(self.nodes) and self.nodes[i][0] == osmid:
-            return self.nodes[i][1:]
-        return None
-    
-    def add(self, int64_t osmid, double lon, double lat):
-        # todo: overwrite
-        self.changed = True
-        if self.nodes and self.nodes[-1][0] < osmid:
-            self.nodes.append((osmid, lon, lat))
-        else:
-            bisect.insort(self.nodes, (osmid, lon, lat))
-    
-    def serialize(self):
-        ids, lons, lats = unzip_nodes(self.nodes)
-        nodes = _DeltaCoords()
-        nodes.ids = ids
-        nodes.lons = lons
-        nodes.lats = lats
-        return nodes.SerializeToString()
-    
-    def deserialize(self, data):
-        nodes = _DeltaCoords()
-        nodes.ParseFromString(data)
-        self.nodes = zip_nodes(
-            nodes.ids, nodes.lons, nodes.lats)
-
-class DeltaCoordsDB(object):
-    def __init__(self, filename, mode='w', estimated_records=0, delta_nodes_cache_size=100, delta_nodes_size=6):
-        self.db = BDB(filename, mode, estimated_records)
-        self.mode = mode
-        self.delta_nodes = {}
-        self.delta_node_ids = deque()
-        self.delta_nodes_cache_size = delta_nodes_cache_size
-        self.delta_nodes_size = delta_nodes_size
-    
-    def put(self, int64_t osmid, double lon, double lat):
-        if self.mode == 'r':
-            return None
-        delta_id = osmid >> self.delta_nodes_size
-        if delta_id not in self.delta_nodes:
-            self.fetch_delta_node(delta_id)
-        delta_node = self.delta_nodes[delta_id]
-        delta_node.add(osmid, lon, lat)
+    def put(self, int64_t osmid, double x, double y):
+        if not self.writable or osmid < 0:
+            return False
+        if osmid >= self.size:
+            self._grow(osmid)
+        self.coords[osmid] = coord_struct(x, y)
         return True
-    
+
     put_marshaled = put
-    
-    def get(self, osmid):
-        delta_id = osmid >> self.delta_nodes_size
-        if delta_id not in self.delta_nodes:
-            self.fetch_delta_node(delta_id)
-        return self.delta_nodes[delta_id].get(osmid)
-    
-    def get_coords(self, osmids):
-        coords = []
-        for osmid in osmids:
-            coord = self.get(osmid)
-            if coord is None:
-                return
-            coords.append(coord)
-        return coords
-    
-    def close(self):
-        for node_id, node in self.delta_nodes.iteritems():
-            self._put(node_id, node)
-        self.delta_nodes = {}
-        self.delta_node_ids = deque()
-        self.db.close()
-    
-    def _put(self, delta_id, delta_node):
-        data = delta_node.serialize()
+
+    cdef inline bint _get(self, int64_t osmid, coord *p) nogil:
+        if osmid < 0 or osmid >= self.size:
+            return 0
+        p[0] = self.coords[osmid]
+        return p.y != 0
+
+    def get(self, int64_t osmid):
+        cdef coord p
+        if not self._get(osmid, &p): return
+        return _uint32_to_coord(p.x), _uint32_to_coord(p.y)
+
+    def get_coords(self, refs):
+        cdef coord p
+        cdef int64_t osmid
+        coords = list()
+        for osmid in refs:
+            if not self._get(osmid, &p): return
+            coords.append((_uint32_to_coord(p.x), _uint32_to_coord(p.y)))
+
+        return coords
+
+    def get_coords_many(self, refs):
+        """
+        Return a CoordBuffer with the coordinates of all refs.
+        """
+        return _get_coords_many(<void *>self, _flat_coords_db_get, refs)
+
+    cdef CoordBuffer _get_coords_ids(self, int64_t *ids, Py_ssize_t n):
+        """
+        Return a CoordBuffer with the coordinates of n ids.
+        """
+        return _get_coords_ids(<void *>self, _flat_coords_db_get, ids, n)
+
+    def get_coords_batch(self, refs_list):
+        """
+        Return a CoordBuffer for each list of refs.
+        """
+        return _get_coords_batch(<void *>self, _flat_coords_db_get, refs_list)
+
+    def scan_stats(self, Py_ssize_t sample_size=0):
+        """
+        Scan all slots of the file, see `BDB.scan_stats`.
+        """
+        cdef int64_t osmid, records = 0, min_id = 0, max_id = 0
+        sample = []
+        for osmid in range(self.size):
+            if self.coords[osmid].y == 0:
+                continue
+            if records == 0:
+                min_id = osmid
+            max_id = osmid
+            _sample_add(sample, sample_size, records, osmid)
+            records += 1
+        return _scan_result(records, records * sizeof(coord), min_id, max_id, sample)
+
+    def close(self):
+        self._map(0)
+        if self.fd >= 0:
+            c_close(self.fd)
+        self.fd = -1
+
+    def __dealloc__(self):
+        if self.coords:
+            munmap(self.coords, self.size * sizeof(coord))
+        if self.fd >= 0:
+            c_close(self.fd)
+
+cdef bint _flat_coords_db_get(void *db, int64_t osmid, coord *p) nogil:
+    return (<FlatCoordsDB>db)._get(osmid, p)
+
+DEF SORTED_COORDS_HEADER = 16 # magic + number of coords
+DEF SORTED_COORDS_COPY = 64 * 1024 # coords per read/write
+
+cdef char *SORTED_COORDS_MAGIC = 'IMPSCRD1'
+
+ctypedef struct sorted_coord:
+    int64_t id
+    int64_t seq
+    coord c
+
+cdef int _cmp_sorted_coord(const void *a, const void *b) nogil:
+    cdef sorted_coord *x = <sorted_coord *>a
+    cdef sorted_coord *y = <sorted_coord *>b
+    if x.id != y.id:
+        return -1 if x.id < y.id else 1
+    if x.seq != y.seq:
+        return -1 if x.seq < y.seq else 1
+    return 0
+
+cdef inline int64_t _interpolation_search(int64_t *ids, int64_t n, int64_t osmid) nogil:
+    """
+    Return the index of osmid in the sorted ids or -1.
+    Falls back to bisection if the ids are not evenly distributed.
+    """
+    cdef int64_t lo = 0, hi = n - 1, mid
+    cdef int steps = 0
+    while lo <= hi and ids[lo] <= osmid and osmid <= ids[hi]:
+        if ids[hi] == ids[lo]:
+            mid = lo
+        elif steps < 8:
+            mid = lo + <int64_t>(
+                (<double>(osmid - ids[lo]) / <double>(ids[hi] - ids[lo])) * (hi - lo))
+        else:
+            mid = lo + (hi - lo) // 2
+        steps += 1
+        if ids[mid] == osmid:
+            return mid
+        if ids[mid] < osmid:
+            lo = mid + 1
+        else:
+            hi = mid - 1
+    return -1
+
+cdef class SortedCoordsDB:
+    """
+    Coordinates database with parallel arrays of sorted node ids and coords.
+
+    Coords are appended in write mode and the file is memory-mapped
+    read-only in read mode. Out-of-order ids (i.e. --merge-cache) are
+    supported, but the whole file is sorted in memory on close.
+
+    File layout: magic, number of coords, ids (int64) and coords
+    (2x uint32).
+    """
+    cdef object filename
+    cdef object tmp_filename
+    cdef int writable
+    # write mode
+    cdef FILE *ids_f
+    cdef FILE *coords_f
+    cdef int64_t last_id
+    cdef bint sorted
+    # read mode
+    cdef int fd
+    cdef char *data
+    cdef size_t data_size
+    cdef int64_t *ids
+    cdef coord *coords
+    cdef int64_t count
+
+    def __cinit__(self, filename, mode='w', estimated_records=0):
+        self.ids_f = NULL
+        self.coords_f = NULL
+        self.fd = -1
+        self.data = NULL
+        self.count = 0
+
+    def __init__(self, filename, mode='w', estimated_records=0):
+        self.filename = filename
+        self.writable = mode == 'w'
+        if self.writable:
+            self._open_writer()
+        else:
+            self._open_reader()
+
+    cdef _open_reader(self):
+        cdef stat st
+        self.fd = c_open(self.filename, O_RDONLY, 0)
+        if self.fd < 0:
+            raise IOError('unable to open %s' % self.filename)
+        if fstat(self.fd, &st) != 0:
+            raise IOError('unable to stat %s' % self.filename)
+        if st.st_size < SORTED_COORDS_HEADER:
+            # empty cache
+            return
+        self.data = <char *>mmap(NULL, st.st_size, PROT_READ, MAP_SHARED, self.fd, 0)
+        if self.data == MAP_FAILED:
+            self.data = NULL
+            raise IOError('unable to mmap %s' % self.filename)
+        self.data_size = st.st_size
+        if memcmp(self.data, SORTED_COORDS_MAGIC, 8) != 0:
+            raise IOError('%s is not a sorted coords cache' % self.filename)
+        self.count = (<int64_t *>(self.data + 8))[0]
+        self.ids = <int64_t *>(self.data + SORTED_COORDS_HEADER)
+        self.coords = <coord *>(self.ids + self.count)
+
+    cdef _open_writer(self):
+        cdef SortedCoordsDB existing = None
+        old_filename = self.filename + '.old'
+        self.tmp_filename = self.filename + '.tmp'
+        if os.path.exists(self.filename):
+            # re-add existing coords for --merge-cache
+            os.rename(self.filename, old_filename)
+            existing = SortedCoordsDB(old_filename, 'r')
+
+        self.ids_f = fopen(self.filename, 'w+b')
+        self.coords_f = fopen(self.tmp_filename, 'w+b')
+        if not self.ids_f or not self.coords_f:
+            raise IOError('unable to open %s' % self.filename)
+        self._write_header()
+        self.sorted = True
+        self.last_id = -1
+
+        if existing is not None:
+            fwrite(existing.ids, sizeof(int64_t), existing.count, self.ids_f)
+            fwrite(existing.coords, sizeof(coord), existing.count, self.coords_f)
+            self.count = existing.count
+            if self.count:
+                self.last_id = existing.ids[self.count - 1]
+            existing.close()
+            os.unlink(old_filename)
+
+    cdef _write_header(self):
+        fseek(self.ids_f, 0, SEEK_SET)
+        fwrite(SORTED_COORDS_MAGIC, 1, 8, self.ids_f)
+        fwrite(&self.count, sizeof(int64_t), 1, self.ids_f)
+
+    def put(self, int64_t osmid, double x, double y):
+        cdef coord p
+        if not self.writable:
+            return False
+        if osmid <= self.last_id:
+            self.sorted = False
+        self.last_id = osmid
+        p = coord_struct(x, y)
+        fwrite(&osmid, sizeof(int64_t), 1, self.ids_f)
+        fwrite(&p, sizeof(coord), 1, self.coords_f)
+        self.count += 1
+        return True
+
+    put_marshaled = put
+
+    cdef inline bint _get(self, int64_t osmid, coord *p) nogil:
+        cdef int64_t idx
+        if not self.count or self.writable:
+            return 0
+        idx = _interpolation_search(self.ids, self.count, osmid)
+        if idx < 0:
+            return 0
+        p[0] = self.coords[idx]
+        return 1
+
+    def get(self, int64_t osmid):
+        cdef coord p
+        if not self._get(osmid, &p): return
+        return _uint32_to_coord(p.x), _uint32_to_coord(p.y)
+
+    def get_coords(self, refs):
+        cdef coord p
+        cdef int64_t osmid
+        coords = list()
+        for osmid in refs:
+            if not self._get(osmid, &p): return
+            coords.append((_uint32_to_coord(p.x), _uint32_to_coord(p.y)))
+
+        return coords
+
+    def get_coords_many(self, refs):
+        """
+        Return a CoordBuffer with the coordinates of all refs.
+        """
+        return _get_coords_many(<void *>self, _sorted_coords_db_get, refs)
+
+    cdef CoordBuffer _get_coords_ids(self, int64_t *ids, Py_ssize_t n):
+        """
+        Return a CoordBuffer with the coordinates of n ids.
+        """
+        return _get_coords_ids(<void *>self, _sorted_coords_db_get, ids, n)
+
+    def get_coords_batch(self, refs_list):
+        """
+        Return a CoordBuffer for each list of refs.
+        """
+        return _get_coords_batch(<void *>self, _sorted_coords_db_get, refs_list)
+
+    def __len__(self):
+        return self.count
+
+    def scan_stats(self, Py_ssize_t sample_size=0):
+        """
+        Return the statistics of the arrays, see `BDB.scan_stats`.
+        """
+        cdef int64_t i
+        if not self.count or self.writable:
+            return _scan_result(0, 0, 0, 0, [])
+        sample = []
+        if sample_size:
+            for i in range(min(sample_size, self.count)):
+                sample.append(self.ids[<int64_t>(drand48() * self.count)])
+        return _scan_result(self.count, self.count * (sizeof(int64_t) + sizeof(coord)),
+            self.ids[0], self.ids[self.count - 1], sample)
+
+    cdef _append_coords(self):
+        cdef coord *buf = <coord *>malloc(SORTED_COORDS_COPY * sizeof(coord))
+        cdef size_t n
+        fseek(self.coords_f, 0, SEEK_SET)
+        try:
+            while True:
+                n = fread(buf, sizeof(coord), SORTED_COORDS_COPY, self.coords_f)
+                if n == 0:
+                    break
+                fwrite(buf, sizeof(coord), n, self.ids_f)
+        finally:
+            free(buf)
+
+    cdef _sort_rewrite(self):
+        """
+        Sort all ids and coords in memory and rewrite the file.
+        Removes duplicate ids, the last put wins.
+        """
+        cdef sorted_coord *entries
+        cdef int64_t i, n
+        entries = <sorted_coord *>malloc(self.count * sizeof(sorted_coord) + 1)
+        if not entries:
+            raise MemoryError()
+        try:
+            fseek(self.ids_f, SORTED_COORDS_HEADER, SEEK_SET)
+            fseek(self.coords_f, 0, SEEK_SET)
+            for i in range(self.count):
+                fread(&entries[i].id, sizeof(int64_t), 1, self.ids_f)
+                fread(&entries[i].c, sizeof(coord), 1, self.coords_f)
+                entries[i].seq = i
+            qsort(entries, self.count, sizeof(sorted_coord), _cmp_sorted_coord)
+
+            n = 0
+            for i in range(self.count):
+                if n and entries[n-1].id == entries[i].id:
+                    n -= 1
+                entries[n] = entries[i]
+                n += 1
+
+            fclose(self.ids_f)
+            self.ids_f = fopen(self.filename, 'wb')
+            if not self.ids_f:
+                raise IOError('unable to open %s' % self.filename)
+            self.count = n
+            self._write_header()
+            for i in range(n):
+                fwrite(&entries[i].id, sizeof(int64_t), 1, self.ids_f)
+            for i in range(n):
+                fwrite(&entries[i].c, sizeof(coord), 1, self.ids_f)
+        finally:
+            free(entries)
+
+    def close(self):
+        if self.ids_f:
+            if self.sorted:
+                self._append_coords()
+                self._write_header()
+            else:
+                self._sort_rewrite()
+            fclose(self.ids_f)
+            self.ids_f = NULL
+        if self.coords_f:
+            fclose(self.coords_f)
+            self.coords_f = NULL
+            os.unlink(self.tmp_filename)
+        if self.data:
+            munmap(self.data, self.data_size)
+            self.data = NULL
+        if self.fd >= 0:
+            c_close(self.fd)
+            self.fd = -1
+        self.count = 0
+
+    def __dealloc__(self):
+        if self.ids_f:
+            fclose(self.ids_f)
+        if self.coords_f:
+            fclose(self.coords_f)
+        if self.data:
+            munmap(self.data, self.data_size)
+        if self.fd >= 0:
+            c_close(self.fd)
+
+cdef bint _sorted_coords_db_get(void *db, int64_t osmid, coord *p) nogil:
+    return (<SortedCoordsDB>db)._get(osmid, p)
+
+# Varint helpers for the record and the delta coords codec.
+
+DEF VARINT_MAX_SIZE = 10
+
+cdef inline uint64_t _zigzag_encode(int64_t v) nogil:
+    return (<uint64_t>v << 1) ^ <uint64_t>(v >> 63)
+
+cdef inline int64_t _zigzag_decode(uint64_t v) nogil:
+    return <int64_t>(v >> 1) ^ -<int64_t>(v & 1)
+
+cdef inline int _varint_size(uint64_t v) nogil:
+    cdef int n = 1
+    while v >= 0x80:
+        v >>= 7
+        n += 1
+    return n
+
+cdef inline unsigned char *_varint_put(unsigned char *p, uint64_t v) nogil:
+    while v >= 0x80:
+        p[0] = (v & 0x7f) | 0x80
+        v >>= 7
+        p += 1
+    p[0] = v
+    return p + 1
+
+cdef inline unsigned char *_varint_get(unsigned char *p, unsigned char *end,
+    uint64_t *v) nogil:
+    """
+    Decode a varint, return position after the varint or NULL on errors.
+    """
+    cdef uint64_t result = 0
+    cdef int shift = 0
+    while p < end and shift < 64:
+        result |= <uint64_t>(p[0] & 0x7f) << shift
+        if not p[0] & 0x80:
+            v[0] = result
+            return p + 1
+        shift += 7
+        p += 1
+    return NULL
+
+cdef class TagDictionary:
+    """
+    Frequent tag strings that are stored as small integer codes in the
+    node, way and relation caches. Decoded records return the strings
+    of the dictionary, so equal tags share the same string object.
+
+    Strings are only appended, the codes of existing caches remain valid.
+    The strings are stored as unicode, ``byte_strings`` are the same
+    strings as UTF-8 str for the codes of str tags.
+    """
+    cdef dict codes
+    cdef list strings
+    cdef list byte_strings
+
+    def __init__(self, strings=()):
+        self.codes = {}
+        self.strings = []
+        self.byte_strings = []
+        for s in strings:
+            self.add(s)
+
+    def add(self, s):
+        """
+        Add string s, returns the code of s.
+        """
+        if type(s) is str:
+            s = s.decode('utf-8')
+        code = self.codes.get(s)
+        if code is None:
+            code = len(self.strings)
+            self.codes[s] = code
+            self.strings.append(s)
+            self.byte_strings.append(s.encode('utf-8'))
+        return code
+
+    def load(self, filename):
+        with open(filename, 'rb') as f:
+            for s in marshal.load(f):
+                self.add(s)
+
+    def save(self, filename):
+        with open(filename, 'wb') as f:
+            marshal.dump(self.strings, f, 2)
+
+    def __getitem__(self, code):
+        return self.strings[code]
+
+    def __len__(self):
+        return len(self.strings)
+
+# Compact encoding of node, way and relation records.
+#
+# A record starts with the version byte, followed by the kind (node,
+# refs or members), the number of tags and the tags as key and value
+# strings. Nodes store the coordinate as two doubles. Ways store the
+# number of refs and the zigzag encoded deltas of the ref ids. Members
+# store the delta of the id, a type code and the role string.
+# Strings are stored with (length << 2 | STRING_*) followed by the
+# string (unicode as UTF-8), or as (code << 2 | STRING_CODE) if they
+# are in the TagDictionary (STRING_BYTES_CODE for str strings).
+#
+# Records that can not be encoded (e.g. partial refs of merged ways) are
+# stored as marshal data. The marshal type codes never collide with the
+# version byte.
+
+DEF RECORD_VERSION = 1
+DEF RECORD_REFS = 0
+DEF RECORD_MEMBERS = 1
+DEF RECORD_NODE = 2
+
+DEF STRING_BYTES = 0
+DEF STRING_UNICODE = 1
+DEF STRING_CODE = 2
+DEF STRING_BYTES_CODE = 3
+
+cdef inline int _record_tagged(char *data, int size) nogil:
+    """
+    Return 1 if the compact record has tags, 0 if not and -1 for
+    other (e.g. marshaled) records.
+    """
+    # the number of tags is a varint after the version and kind,
+    # only zero starts with a zero byte
+    if size > 2 and data[0] == RECORD_VERSION:
+        return data[2] != 0
+    return -1
+
+_member_types = ('node', 'way', 'relation')
+cdef dict _member_type_codes = {'node': 0, 'way': 1, 'relation': 2}
+
+ctypedef struct encode_buffer:
+    unsigned char *data
+    size_t size
+    size_t capacity
+
+cdef int _buffer_reserve(encode_buffer *buf, size_t n) except -1:
+    cdef size_t capacity
+    cdef unsigned char *data
+    if buf.size + n <= buf.capacity:
+        return 0
+    capacity = buf.capacity * 2 if buf.capacity else 256
+    while capacity < buf.size + n:
+        capacity *= 2
+    data = <unsigned char *>realloc(buf.data, capacity)
+    if not data:
+        raise MemoryError()
+    buf.data = data
+    buf.capacity = capacity
+    return 0
+
+cdef int _buffer_put_varint(encode_buffer *buf, uint64_t v) except -1:
+    _buffer_reserve(buf, VARINT_MAX_SIZE)
+    buf.size = _varint_put(buf.data + buf.size, v) - buf.data
+    return 0
+
+cdef int _buffer_put_string(encode_buffer *buf, s, TagDictionary tag_dict) except -1:
+    """
+    Append a dictionary code or a length-prefixed string.
+    Returns 1 if s is neither a str nor a unicode object.
+    """
+    cdef uint64_t flag
+    cdef Py_ssize_t n
+    if type(s) is unicode:
+        flag = STRING_UNICODE
+    elif type(s) is str:
+        flag = STRING_BYTES
+    else:
+        return 1
+    if tag_dict is not None:
+        # str keys only match ASCII strings, which are the same in UTF-8
+        code = tag_dict.codes.get(s)
+        if code is not None:
+            _buffer_put_varint(buf, (<uint64_t>code << 2) |
+                (STRING_CODE if flag == STRING_UNICODE else STRING_BYTES_CODE))
+            return 0
+    if flag == STRING_UNICODE:
+        s = (<unicode>s).encode('utf-8')
+    n = len(s)
+    _buffer_put_varint(buf, (<uint64_t>n << 2) | flag)
+    _buffer_reserve(buf, n)
+    memmove(buf.data + buf.size, <char *>s, n)
+    buf.size += n
+    return 0
+
+cdef int _buffer_put_header(encode_buffer *buf, int kind, tags,
+    TagDictionary tag_dict) except -1:
+    """
+    Append the version, kind and tags of a record.
+    Returns 1 if the tags can not be encoded.
+    """
+    if type(tags) is not dict:
+        return 1
+    _buffer_reserve(buf, 2)
+    buf.data[0] = RECORD_VERSION
+    buf.data[1] = kind
+    buf.size = 2
+    _buffer_put_varint(buf, len(tags))
+    for key, value in tags.iteritems():
+        if (_buffer_put_string(buf, key, tag_dict)
+            or _buffer_put_string(buf, value, tag_dict)):
+            return 1
+    return 0
+
+cdef object _encode_reftag(tags, refs, TagDictionary tag_dict):
+    """
+    Encode tags and refs (or relation members) as a compact record.
+    Returns None if the record can not be encoded.
+    """
+    cdef encode_buffer buf
+    cdef int kind = RECORD_REFS
+    cdef int64_t osmid, last = 0
+
+    if refs and isinstance(refs[0], (tuple, list)) and len(refs[0]) == 3 \
+        and isinstance(refs[0][1], basestring):
+        kind = RECORD_MEMBERS
+
+    buf.data = NULL
+    buf.size = buf.capacity = 0
+    try:
+        if _buffer_put_header(&buf, kind, tags, tag_dict):
+            return None
+        _buffer_put_varint(&buf, len(refs))
+        try:
+            if kind == RECORD_REFS:
+                for osmid in refs:
+                    _buffer_put_varint(&buf, _zigzag_encode(osmid - last))
+                    last = osmid
+            else:
+                for osmid, member_type, role in refs:
+                    type_code = _member_type_codes.get(member_type)
+                    if type_code is None:
+                        return None
+                    _buffer_put_varint(&buf, _zigzag_encode(osmid - last))
+                    _buffer_put_varint(&buf, type_code)
+                    if _buffer_put_string(&buf, role, tag_dict):
+                        return None
+                    last = osmid
+        except (TypeError, ValueError, OverflowError):
+            # partial refs or other unexpected data
+            return None
+        return PyString_FromStringAndSize(<char *>buf.data, buf.size)
+    finally:
+        free(buf.data)
+
+cdef object _encode_node(tags, pos, TagDictionary tag_dict):
+    """
+    Encode tags and the (x, y) float tuple of a node as a compact record.
+    Returns None if the record can not be encoded.
+    """
+    cdef encode_buffer buf
+    cdef double xy[2]
+
+    if type(pos) is not tuple or len(pos) != 2 \
+        or type(pos[0]) is not float or type(pos[1]) is not float:
+        return None
+    xy[0] = pos[0]
+    xy[1] = pos[1]
+
+    buf.data = NULL
+    buf.size = buf.capacity = 0
+    try:
+        if _buffer_put_header(&buf, RECORD_NODE, tags, tag_dict):
+            return None
+        _buffer_reserve(&buf, sizeof(xy))
+        memmove(buf.data + buf.size, xy, sizeof(xy))
+        buf.size += sizeof(xy)
+        return PyString_FromStringAndSize(<char *>buf.data, buf.size)
+    finally:
+        free(buf.data)
+
+cdef object _encode_node_record(tags, pos, TagDictionary tag_dict):
+    """
+    Return the compact record of a node, or marshal data for nodes
+    that can not be encoded.
+    """
+    data = _encode_node(tags, pos, tag_dict)
+    if data is None:
+        data = PyMarshal_WriteObjectToString((tags, pos), 2)
+    return data
+
+cdef object _encode_reftag_record(tags, refs, TagDictionary tag_dict):
+    """
+    Return the compact record of a way or relation, or marshal data for
+    elements that can not be encoded.
+    """
+    data = _encode_reftag(tags, refs, tag_dict)
+    if data is None:
+        data = PyMarshal_WriteObjectToString((tags, refs), 2)
+    return data
+
+cdef class RecordEncoder:
+    """
+    Encodes batches of ``(osmid, tags, data)`` tuples from the parser
+    into ``(osmid, record)`` tuples for `BDB.put_records`.
+
+    Used in the parser processes, so that the cache writer of each
+    cache only needs to store the records.
+
+    :param kind: ``nodes`` or ``reftags`` (ways and relations)
+    :param tag_dict: TagDictionary of the caches
+    """
+    cdef bint nodes
+    cdef TagDictionary tag_dict
+
+    def __init__(self, kind, TagDictionary tag_dict):
+        if kind not in ('nodes', 'reftags'):
+            raise ValueError('unknown record kind %r' % kind)
+        self.nodes = kind == 'nodes'
+        self.tag_dict = tag_dict
+
+    def __call__(self, items):
+        cdef list records = []
+        for osmid, tags, data in items:
+            if self.nodes:
+                records.append((osmid, _encode_node_record(tags, data, self.tag_dict)))
+            else:
+                records.append((osmid, _encode_reftag_record(tags, data, self.tag_dict)))
+        return records
+
+cdef object _decode_string(unsigned char **pp, unsigned char *end,
+    TagDictionary tag_dict):
+    cdef uint64_t v
+    cdef Py_ssize_t n
+    cdef unsigned char *p = _varint_get(pp[0], end, &v)
+    if p == NULL:
+        raise ValueError('invalid compact record')
+    if v & 3 == STRING_CODE or v & 3 == STRING_BYTES_CODE:
+        if tag_dict is None or (v >> 2) >= <uint64_t>len(tag_dict.strings):
+            raise ValueError('unknown tag dictionary code')
+        pp[0] = p
+        if v & 3 == STRING_BYTES_CODE:
+            return tag_dict.byte_strings[v >> 2]
+        return tag_dict.strings[v >> 2]
+    if (v >> 2) > <uint64_t>(end - p):
+        raise ValueError('invalid compact record')
+    n = v >> 2
+    pp[0] = p + n
+    if v & 3 == STRING_UNICODE:
+        return PyUnicode_DecodeUTF8(<char *>p, n, NULL)
+    return PyString_FromStringAndSize(<char *>p, n)
+
+cdef object _decode_record(unsigned char *p, Py_ssize_t size,
+    TagDictionary tag_dict):
+    """
+    Decode a compact record into a (tags, refs) or (tags, pos) tuple.
+    """
+    cdef unsigned char *end = p + size
+    cdef uint64_t i, n, v, type_code
+    cdef int kind
+    cdef int64_t last = 0
+    cdef double xy[2]
+
+    if size < 2 or p[0] != RECORD_VERSION or p[1] > RECORD_NODE:
+        raise ValueError('invalid compact record')
+    kind = p[1]
+    p += 2
+
+    p = _varint_get(p, end, &n)
+    if p == NULL:
+        raise ValueError('invalid compact record')
+    tags = {}
+    for i in range(n):
+        key = _decode_string(&p, end, tag_dict)
+        tags[key] = _decode_string(&p, end, tag_dict)
+
+    if kind == RECORD_NODE:
+        if end - p != sizeof(xy):
+            raise ValueError('invalid compact record')
+        memmove(xy, p, sizeof(xy))
+        return tags, (xy[0], xy[1])
+
+    p = _varint_get(p, end, &n)
+    if p == NULL or n > <uint64_t>(end - p):
+        raise ValueError('invalid compact record')
+    refs = []
+    for i in range(n):
+        p = _varint_get(p, end, &v)
+        if p == NULL:
+            raise ValueError('invalid compact record')
+        last += _zigzag_decode(v)
+        if kind == RECORD_REFS:
+            refs.append(last)
+        else:
+            p = _varint_get(p, end, &type_code)
+            if p == NULL or type_code > 2:
+                raise ValueError('invalid compact record')
+            refs.append((last, _member_types[type_code],
+                _decode_string(&p, end, tag_dict)))
+    if p != end:
+        raise ValueError('invalid compact record')
+    return tags, refs
+
+cdef object _decode_stored_record(char *data, int size, TagDictionary tag_dict):
+    """
+    Decode a stored compact record, or the marshal data of records that
+    could not be encoded (or that were stored by older versions).
+    """
+    if size and data[0] == RECORD_VERSION:
+        return _decode_record(<unsigned char *>data, size, tag_dict)
+    return PyMarshal_ReadObjectFromString(data, size)
+
+cdef object _reftag_record_from_marshaled(data, TagDictionary tag_dict):
+    """
+    Return the record of marshaled ``(tags, refs)`` data.
+    """
+    tags, refs = PyMarshal_ReadObjectFromString(<char *>data, len(data))
+    return _encode_reftag_record(tags, refs, tag_dict)
+
+cdef class NodeDB(BDB):
+    """
+    Database for nodes with tags.
+
+    :param tag_dict: TagDictionary for the tag strings
+    """
+    cdef TagDictionary tag_dict
+
+    def __init__(self, filename, mode='w', estimated_records=0, tag_dict=None, **kw):
+        BDB.__init__(self, filename, mode, estimated_records, **kw)
+        self.tag_dict = tag_dict
+
+    def put(self, int64_t osmid, tags, pos):
+        data = self._encode(tags, pos)
+        return self._put_raw(osmid, <char *>data, len(data))
+    
+    def put_marshaled(self, int64_t osmid, data):
+        data = self._encode_marshaled(data)
+        return self._put_raw(osmid, <char *>data, len(data))
+
+    cdef object _encode(self, tags, pos):
+        return _encode_node_record(tags, pos, self.tag_dict)
+
+    cdef object _encode_marshaled(self, data):
+        tags, pos = PyMarshal_ReadObjectFromString(<char *>data, len(data))
+        return self._encode(tags, pos)
+
+    cdef object _decode(self, char *data, int size):
+        return _decode_stored_record(data, size, self.tag_dict)
+
+    cdef object _obj(self, int64_t osmid, data):
+        return Node(osmid, data[0], data[1])
+
+cdef class RefTagDB(BDB):
+    """
+    Database for items with references and tags (i.e. ways/relations).
+
+    Records are stored in a compact encoding. Records that were stored
+    as marshal data (e.g. by older versions) are still readable.
+
+    :param tag_dict: TagDictionary for the tag strings and roles
+    """
+    cdef TagDictionary tag_dict
+
+    def __init__(self, filename, mode='w', estimated_records=0, tag_dict=None, **kw):
+        BDB.__init__(self, filename, mode, estimated_records, **kw)
+        self.tag_dict = tag_dict
+
+    def put(self, int64_t osmid, tags, refs):
+        data = self._encode(tags, refs)
+        return self._put_raw(osmid, <char *>data, len(data))
+    
+    def put_marshaled(self, int64_t osmid, data):
+        data = self._encode_marshaled(data)
+        return self._put_raw(osmid, <char *>data, len(data))
+
+    cdef object _encode(self, tags, refs):
+        return _encode_reftag_record(tags, refs, self.tag_dict)
+
+    cdef object _encode_marshaled(self, data):
+        return _reftag_record_from_marshaled(data, self.tag_dict)
+
+    cdef object _decode(self, char *data, int size):
+        return _decode_stored_record(data, size, self.tag_dict)
+
+cdef class WayDB(RefTagDB):
+    cdef object _obj(self, int64_t osmid, data):
+        return Way(osmid, data[0], data[1])
+
+cdef class RelationDB(RefTagDB):
+    cdef object _obj(self, int64_t osmid, data):
+        return Relation(osmid, data[0], data[1])
+
+cdef int _cmp_int64(const void *a, const void *b) nogil:
+    cdef int64_t x = (<int64_t *>a)[0]
+    cdef int64_t y = (<int64_t *>b)[0]
+    return (x > y) - (x < y)
+
+cdef class WayCoordsDB(BDB):
+    """
+    Database with the coordinates of the refs of each way as one array
+    of fixed-point coordinates (8 bytes for each ref).
+
+    Filled by `denormalize_way_coords` after the read, so that way
+    geometries can be built without random lookups in the coords cache.
+    ``get`` returns a CoordBuffer.
+    """
+    def put(self, int64_t osmid, coords):
+        """
+        Store the coordinates (list of (x, y) or CoordBuffer) of a way.
+        """
+        cdef Py_ssize_t i, n = len(coords)
+        cdef coord *data
+        if isinstance(coords, CoordBuffer):
+            # already fixed-point coords
+            return self._put_raw(osmid, (<CoordBuffer>coords).points, n * sizeof(coord))
+        data = <coord *>malloc(n * sizeof(coord) + 1)
+        if not data:
+            raise MemoryError()
+        try:
+            for i in range(n):
+                x, y = coords[i]
+                data[i].x = _coord_to_uint32(x)
+                data[i].y = _coord_to_uint32(y)
+            return self._put_raw(osmid, data, n * sizeof(coord))
+        finally:
+            free(data)
+
+    cdef object _decode(self, char *data, int size):
+        cdef Py_ssize_t n = size // sizeof(coord)
+        cdef CoordBuffer buf = _coord_buffer(n)
+        memcpy(buf.points, data, n * sizeof(coord))
+        memset(buf.found, 1, n)
+        return buf
+
+    def get_ways_coords(self, ways, coords_cache):
+        """
+        Return a CoordBuffer with the coordinates of the refs of each way.
+
+        Ways that are not stored (e.g. ways with missing coords) or that
+        have a different number of refs are resolved with `coords_cache`.
+        """
+        result = []
+        fallback = []
+        for i, way in enumerate(ways):
+            coords = self.get(way.osm_id)
+            if coords is None or len(coords) != len(way.refs):
+                fallback.append(i)
+            result.append(coords)
+        if fallback:
+            coords_batch = coords_cache.get_coords_batch(
+                [ways[i].refs for i in fallback])
+            for i, coords in zip(fallback, coords_batch):
+                result[i] = coords
+        return result
+
+DEF DENORMALIZE_CHUNK_REFS = 4 * 1024 * 1024 # refs of each chunk (32MB ids)
+
+def denormalize_way_coords(ways, coords_cache, WayCoordsDB way_coords,
+    Py_ssize_t chunk_refs=DENORMALIZE_CHUNK_REFS):
+    """
+    Store the coordinates of the refs of all `ways` in `way_coords`.
+
+    The ways are resolved in chunks of consecutive ways with up to
+    `chunk_refs` refs. The unique refs of each chunk are sorted and
+    requested at once as C array, so the coords cache is read in node
+    id order and not randomly for each way.
+    Ways with missing coords are not stored.
+
+    Returns the number of stored ways and of ways with missing coords.
+    """
+    cdef Py_ssize_t nrefs = 0
+    cdef int64_t counts[2] # stored, missing
+    counts[0] = counts[1] = 0
+    chunk = []
+    for way in ways:
+        chunk.append(way)
+        nrefs += len(way.refs)
+        if nrefs >= chunk_refs:
+            _denormalize_chunk(chunk, nrefs, coords_cache, way_coords, counts)
+            chunk = []
+            nrefs = 0
+    if chunk:
+        _denormalize_chunk(chunk, nrefs, coords_cache, way_coords, counts)
+    return counts[0], counts[1]
+
+cdef CoordBuffer _coords_of_ids(coords_cache, int64_t *ids, Py_ssize_t n):
+    """
+    Return a CoordBuffer with the coordinates of n ids from
+    `coords_cache`, without a Python list of the ids for the coords
+    caches of this module.
+    """
+    cdef Py_ssize_t i
+    if isinstance(coords_cache, DeltaCoordsDB):
+        return (<DeltaCoordsDB>coords_cache)._get_coords_ids(ids, n)
+    if isinstance(coords_cache, CoordDB):
+        return (<CoordDB>coords_cache)._get_coords_ids(ids, n)
+    if isinstance(coords_cache, FlatCoordsDB):
+        return (<FlatCoordsDB>coords_cache)._get_coords_ids(ids, n)
+    if isinstance(coords_cache, SortedCoordsDB):
+        return (<SortedCoordsDB>coords_cache)._get_coords_ids(ids, n)
+    if isinstance(coords_cache, ShardedCoordsDB):
+        return (<ShardedCoordsDB>coords_cache)._get_coords_ids(ids, n)
+    return coords_cache.get_coords_many([ids[i] for i in range(n)])
+
+cdef int _denormalize_chunk(list ways, Py_ssize_t nrefs, coords_cache,
+    WayCoordsDB way_coords, int64_t *counts) except -1:
+    cdef Py_ssize_t i, j, k, n, m = 0, max_refs = 1
+    cdef int64_t *ids
+    cdef coord *data = NULL
+    cdef CoordBuffer buf
+    cdef bint complete
+
+    ids = <int64_t *>malloc(nrefs * sizeof(int64_t) + 1)
+    if not ids:
+        raise MemoryError()
+    try:
+        for way in ways:
+            refs = way.refs
+            n = len(refs)
+            if n > max_refs:
+                max_refs = n
+            for j in range(n):
+                ids[m] = refs[j]
+                m += 1
+        qsort(ids, m, sizeof(int64_t), _cmp_int64)
+        # remove duplicates (nodes shared by multiple ways)
+        n = 0
+        for i in range(m):
+            if n == 0 or ids[i] != ids[n - 1]:
+                ids[n] = ids[i]
+                n += 1
+        m = n
+
+        buf = _coords_of_ids(coords_cache, ids, m)
+
+        data = <coord *>malloc(max_refs * sizeof(coord))
+        if not data:
+            raise MemoryError()
+        for way in ways:
+            refs = way.refs
+            n = len(refs)
+            complete = n > 0
+            for j in range(n):
+                k = _interpolation_search(ids, m, refs[j])
+                if not buf.found[k]:
+                    complete = 0
+                    break
+                data[j] = buf.points[k]
+            if complete:
+                if not way_coords._put_raw(way.osm_id, data, n * sizeof(coord)):
+                    raise IOError(tcbdbecode(way_coords.db))
+                counts[0] += 1
+            else:
+                counts[1] += 1
+    finally:
+        free(ids)
+        free(data)
+    return 0
+
+_hash_modes = {
+    'w': HDBOWRITER | HDBOCREAT,
+    'r': HDBOREADER | HDBONOLCK,
+}
+
+_hash_compression_codecs = {
+    'none': 0,
+    'deflate': HDBTDEFLATE,
+    'bzip2': HDBTBZIP,
+    'tcbs': HDBTTCBS,
+    'lz4': HDBTEXCODEC,
+}
+
+cdef class HashWayDB:
+    """
+    Ways database in a Tokyo Cabinet hash database. Lookups of single
+    ways (e.g. of the relation members) need no B+ tree descent and only
+    read and decompress the requested record.
+
+    The sorted ids of all ways are written as `IdBitmap` next to the
+    database (``filename + '.ids'``) when a modified database is closed.
+    Iterations follow this file, so the ids are sorted only once and
+    not with each iteration. Each way is still a lookup in the hash
+    database. Databases without an up-to-date ids file (e.g. that are
+    still written) are iterated by collecting all keys first.
+
+    :param compression: record compression (none, deflate, bzip2, tcbs
+        or lz4), each record is compressed separately
+    :param rcnum: number of cached records
+    :param xmsiz: size of the memory mapped part of the file in bytes
+    :param tag_dict: TagDictionary for the tag strings
+
+    Options for B+ tree databases (lmemb, nmemb, bulk, ...) are ignored.
+    """
+    cdef TCHDB *db
+    cdef object filename
+    cdef readonly object ids_filename
+    cdef int _opened
+    cdef bint _modified
+    cdef TagDictionary tag_dict
+    cdef object _ids
+
+    def __cinit__(self, *args, **kw):
+        self.db = tchdbnew()
+        self._opened = 0
+        self._modified = 0
+
+    def __init__(self, filename, mode='w', estimated_records=0,
+        compression='none', rcnum=None, xmsiz=None, tag_dict=None, **kw):
+        self.filename = filename
+        self.ids_filename = filename + '.ids'
+        self.tag_dict = tag_dict
+        if compression not in available_compression_codecs():
+            raise ValueError('unsupported compression %r' % compression)
+        if IMPOSM_HAS_LZ4:
+            tchdbsetcodecfunc(self.db, imposm_lz4_encode, NULL,
+                imposm_lz4_decode, NULL)
+        # 2 buckets for each record, 2^4 record alignment, 2^10 free blocks
+        tchdbtune(self.db, (estimated_records or 0) * 2 or -1, 4, 10,
+            HDBTLARGE | _hash_compression_codecs[compression])
+        if rcnum:
+            tchdbsetcache(self.db, rcnum)
+        if xmsiz:
+            tchdbsetxmsiz(self.db, xmsiz)
+        if not tchdbopen(self.db, filename, _hash_modes[mode]):
+            raise IOError(tchdbecode(self.db))
+        self._opened = 1
+        if tchdbopts(self.db) & HDBTEXCODEC and not IMPOSM_HAS_LZ4:
+            tchdbclose(self.db)
+            self._opened = 0
+            raise IOError(_lz4_missing_message % filename)
+
+    def get(self, int64_t osmid):
+        """
+        Return way with given id.
+        Returns None if id is not stored.
+        """
+        cdef void *ret
+        cdef int ret_size
+        ret = tchdbget(self.db, <char *>&osmid, sizeof(int64_t), &ret_size)
+        if not ret: return None
+        try:
+            return self._obj(osmid, self._decode(<char *>ret, ret_size))
+        finally:
+            free(ret)
+
+    def put(self, int64_t osmid, tags, refs):
+        return self._put_raw(osmid, _encode_reftag_record(tags, refs, self.tag_dict))
+
+    def put_marshaled(self, int64_t osmid, data):
+        return self._put_raw(osmid, _reftag_record_from_marshaled(data, self.tag_dict))
+
+    def put_many(self, items, marshaled=False):
+        """
+        Store a batch of ``(osmid, tags, refs)`` tuples from the parser,
+        or of ``(osmid, marshaled_data)`` tuples if `marshaled` is True,
+        see `BDB.put_many`. Returns the number of stored items.
+        """
+        if marshaled:
+            for osmid, data in items:
+                self.put_marshaled(osmid, data)
+        else:
+            for osmid, tags, refs in items:
+                self.put(osmid, tags, refs)
+        return len(items)
+
+    def put_records(self, items):
+        """
+        Store a batch of ``(osmid, record)`` tuples with encoded records,
+        see `BDB.put_records`.
+        """
+        for osmid, data in items:
+            self._put_raw(osmid, data)
+        return len(items)
+
+    cdef bint _put_raw(self, int64_t osmid, data) except -1:
+        if not self._modified:
+            # the ids file is written again on close
+            self._modified = 1
+            if os.path.exists(self.ids_filename):
+                os.unlink(self.ids_filename)
+        if not tchdbput(self.db, <char *>&osmid, sizeof(int64_t), <char *>data, len(data)):
+            raise IOError(tchdbecode(self.db))
+        return 1
+
+    cdef object _decode(self, char *data, int size):
+        return _decode_stored_record(data, size, self.tag_dict)
+
+    cdef object _obj(self, int64_t osmid, data):
+        return Way(osmid, data[0], data[1])
+
+    def __contains__(self, int64_t osmid):
+        return tchdbvsiz(self.db, <char *>&osmid, sizeof(int64_t)) >= 0
+
+    def __len__(self):
+        return tchdbrnum(self.db)
+
+    cdef object _collect_ids(self):
+        """
+        Return an `IdBitmapBuilder` with all keys of the database.
+        """
+        cdef void *key
+        cdef int key_size
+        builder = IdBitmapBuilder()
+        tchdbiterinit(self.db)
+        while True:
+            key = tchdbiternext(self.db, &key_size)
+            if not key:
+                break
+            try:
+                builder.add((<int64_t *>key)[0])
+            finally:
+                free(key)
+        return builder
+
+    cdef object _sorted_ids(self):
+        """
+        Return the ids of all ways as iterable in sorted order.
+        """
+        if not self._modified:
+            ids = IdBitmap(self.ids_filename)
+            if len(ids) == tchdbrnum(self.db):
+                return ids
+            # missing (empty) or outdated ids file
+            ids.close()
+        return self._collect_ids().tolist()
+
+    def __iter__(self):
+        """
+        Return an iterator over all ways, sorted by id.
+        Resets any existing iterator.
+        """
+        self._ids = iter(self._sorted_ids())
+        return self
+
+    def __next__(self):
+        cdef int64_t osmid
+        while self._ids is not None:
+            try:
+                osmid = next(self._ids)
+            except StopIteration:
+                self._ids = None
+                break
+            way = self.get(osmid)
+            if way is not None:
+                return way
+        raise StopIteration
+
+    def iter_batches(self, Py_ssize_t size=128, bint tagged_only=True):
+        """
+        Return an iterator over lists of up to `size` ways sorted by id,
+        see `HashDBBatchIterator`. Independent of any iteration with
+        `__iter__`.
+
+        :param tagged_only: skip all ways without tags
+        """
+        cdef HashDBBatchIterator batches = HashDBBatchIterator()
+        batches.db = self
+        batches.size = size
+        batches.tagged_only = tagged_only
+        batches.ids = iter(self._sorted_ids())
+        return batches
+
+    def scan_stats(self, Py_ssize_t sample_size=0):
+        """
+        Scan all keys and the size of their values, see `BDB.scan_stats`.
+        """
+        cdef void *key
+        cdef int key_size
+        cdef int64_t osmid, records = 0, data_bytes = 0
+        cdef int64_t min_id = 0, max_id = 0
+        sample = []
+        tchdbiterinit(self.db)
+        while True:
+            key = tchdbiternext(self.db, &key_size)
+            if not key:
+                break
+            osmid = (<int64_t *>key)[0]
+            data_bytes += key_size + tchdbvsiz(self.db, key, key_size)
+            free(key)
+            # hash order, ids are not sorted
+            if records == 0 or osmid < min_id:
+                min_id = osmid
+            if records == 0 or osmid > max_id:
+                max_id = osmid
+            _sample_add(sample, sample_size, records, osmid)
+            records += 1
+        return _scan_result(records, data_bytes, min_id, max_id, sample)
+
+    def optimize(self, **kw):
+        """
+        Rebuild the database file without free blocks, with 2 buckets
+        for each record. Needs a database that was opened for writing.
+        The ids file stays valid.
+        """
+        cdef bint ok
+        cdef int64_t bnum = tchdbrnum(self.db) * 2
+        with nogil:
+            ok = tchdboptimize(self.db, bnum or -1, -1, -1, OPTIMIZE_KEEP_OPTS)
+        if not ok:
+            raise IOError(tchdbecode(self.db))
+
+    def close(self):
+        if self._opened:
+            if self._modified:
+                self._collect_ids().write(self.ids_filename)
+                self._modified = 0
+            tchdbclose(self.db)
+        self._opened = 0
+        self._ids = None
+
+    def __dealloc__(self):
+        if self._opened:
+            tchdbclose(self.db)
+        tchdbdel(self.db)
+
+cdef class HashDBBatchIterator:
+    """
+    Iterator over lists of ways of a `HashWayDB` (see
+    `HashWayDB.iter_batches`).
+
+    Compact records without tags are skipped before they are decoded.
+    ``count`` is the number of all records that were read so far,
+    including the skipped records.
+    """
+    cdef HashWayDB db
+    cdef object ids
+    cdef Py_ssize_t size
+    cdef bint tagged_only
+    cdef readonly Py_ssize_t count
+
+    def __cinit__(self):
+        self.count = 0
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        cdef void *ret
+        cdef int size, tagged
+        cdef int64_t osmid
+        cdef list batch = []
+        if self.ids is None:
+            raise StopIteration
+        while len(batch) < self.size:
+            try:
+                osmid = next(self.ids)
+            except StopIteration:
+                self.ids = None
+                break
+            ret = tchdbget(self.db.db, <char *>&osmid, sizeof(int64_t), &size)
+            if not ret:
+                continue
+            try:
+                self.count += 1
+                tagged = _record_tagged(<char *>ret, size)
+                if not self.tagged_only or tagged != 0:
+                    obj = self.db._obj(osmid, self.db._decode(<char *>ret, size))
+                    if not self.tagged_only or tagged == 1 or obj.tags:
+                        batch.append(obj)
+            finally:
+                free(ret)
+        if not batch:
+            raise StopIteration
+        return batch
+
+# Compressed bitmap of element ids (e.g. of the inserted ways).
+#
+# The ids are split into chunks of 2^16 ids by their high bits (like
+# roaring bitmaps). Sparse chunks store the sorted low 16 bits of their
+# ids, dense chunks a plain bitmap of 8kB.
+#
+# File layout: magic, number of chunks, number of ids, the chunk index
+# (key, offset, cardinality) sorted by key, followed by the containers.
+
+DEF ID_BITMAP_HEADER = 24 # magic + number of chunks + number of ids
+DEF ID_BITMAP_ARRAY_MAX = 4096 # chunks with more ids are stored as bitmap
+DEF ID_BITMAP_WORDS = 1024 # 64bit words of a bitmap container
+
+cdef char *ID_BITMAP_MAGIC = 'IMPBMP01'
+
+ctypedef struct bitmap_chunk:
+    int64_t key
+    uint64_t offset
+    uint64_t cardinality
+
+cdef inline int64_t _bitmap_key(int64_t osmid) nogil:
+    return osmid >> 16
+
+cdef inline uint64_t _bitmap_container_size(uint64_t cardinality) nogil:
+    if cardinality > ID_BITMAP_ARRAY_MAX:
+        return ID_BITMAP_WORDS * sizeof(uint64_t)
+    # arrays are padded to 8 bytes
+    return (cardinality * sizeof(uint16_t) + 7) & ~(<uint64_t>7)
+
+DEF ID_BITMAP_BUFFER = 1024 * 1024 # ids that are buffered before they are added to the containers
+
+ctypedef struct builder_chunk:
+    int64_t key
+    uint64_t cardinality
+    uint16_t *lows # sorted array container, or NULL
+    uint64_t *words # bitmap container, or NULL
+
+cdef int _builder_chunk_add(builder_chunk *chunk, int64_t *ids, Py_ssize_t n) except -1:
+    """
+    Add the sorted `ids` (with duplicates) of the chunk to its container.
+    """
+    cdef Py_ssize_t i = 0, j = 0, k = 0
+    cdef uint16_t low
+    cdef uint16_t *lows
+    cdef uint64_t *words
+    if chunk.words:
+        for i in range(n):
+            low = ids[i] & 0xffff
+            if not chunk.words[low >> 6] & ((<uint64_t>1) << (low & 63)):
+                chunk.words[low >> 6] |= (<uint64_t>1) << (low & 63)
+                chunk.cardinality += 1
+        return 0
+
+    lows = <uint16_t *>malloc((chunk.cardinality + n) * sizeof(uint16_t))
+    if not lows:
+        raise MemoryError()
+    while i < n or j < <Py_ssize_t>chunk.cardinality:
+        if j == <Py_ssize_t>chunk.cardinality or (i < n and <uint16_t>(ids[i] & 0xffff) <= chunk.lows[j]):
+            low = ids[i] & 0xffff
+            i += 1
+        else:
+            low = chunk.lows[j]
+            j += 1
+        if k == 0 or lows[k-1] != low:
+            lows[k] = low
+            k += 1
+    free(chunk.lows)
+    chunk.lows = lows
+    chunk.cardinality = k
+    if k <= ID_BITMAP_ARRAY_MAX:
+        return 0
+
+    words = <uint64_t *>malloc(ID_BITMAP_WORDS * sizeof(uint64_t))
+    if not words:
+        raise MemoryError()
+    memset(words, 0, ID_BITMAP_WORDS * sizeof(uint64_t))
+    for i in range(k):
+        words[lows[i] >> 6] |= (<uint64_t>1) << (lows[i] & 63)
+    free(chunk.lows)
+    chunk.lows = NULL
+    chunk.words = words
+    return 0
+
+cdef class IdBitmapBuilder:
+    """
+    Collects ids and writes them as `IdBitmap` file.
+    Ids can be added in any order and more than once.
+
+    The ids are buffered and then added to the same containers as in
+    the `IdBitmap` file, so the builder only needs about 2 bytes for
+    each id of sparse chunks and 8kB for dense chunks of 2^16 ids
+    (e.g. for all referenced nodes of a planet file).
+    """
+    cdef int64_t *buf
+    cdef Py_ssize_t buf_size
+    cdef Py_ssize_t buf_capacity
+    cdef builder_chunk *chunks
+    cdef Py_ssize_t nchunks
+    cdef Py_ssize_t chunks_capacity
+
+    def __cinit__(self):
+        self.buf = NULL
+        self.buf_size = self.buf_capacity = 0
+        self.chunks = NULL
+        self.nchunks = self.chunks_capacity = 0
+
+    cdef int _add(self, int64_t osmid) except -1:
+        cdef int64_t *buf
+        cdef Py_ssize_t capacity
+        if self.buf_size == self.buf_capacity:
+            if self.buf_capacity < ID_BITMAP_BUFFER:
+                capacity = self.buf_capacity * 2 if self.buf_capacity else 4096
+                buf = <int64_t *>realloc(self.buf, capacity * sizeof(int64_t))
+                if not buf:
+                    raise MemoryError()
+                self.buf = buf
+                self.buf_capacity = capacity
+            else:
+                self._flush()
+        self.buf[self.buf_size] = osmid
+        self.buf_size += 1
+        return 0
+
+    def add(self, int64_t osmid):
+        self._add(osmid)
+
+    def update(self, ids):
+        """
+        Add all ids from the iterable (e.g. from another `IdBitmap`).
+        """
+        cdef int64_t osmid
+        for osmid in ids:
+            self._add(osmid)
+
+    cdef int _flush(self) except -1:
+        """
+        Add the buffered ids to the containers of their chunks.
+        """
+        cdef Py_ssize_t i = 0, j = 0, n, start, new_chunks = 0, capacity
+        cdef int64_t key
+        cdef builder_chunk *chunks
+        if not self.buf_size:
+            return 0
+        qsort(self.buf, self.buf_size, sizeof(int64_t), _cmp_int64)
+
+        # count the chunks of the buffered ids that are not known
+        while i < self.buf_size:
+            key = _bitmap_key(self.buf[i])
+            while j < self.nchunks and self.chunks[j].key < key:
+                j += 1
+            if j == self.nchunks or self.chunks[j].key != key:
+                new_chunks += 1
+            while i < self.buf_size and _bitmap_key(self.buf[i]) == key:
+                i += 1
+
+        if new_chunks:
+            if self.nchunks + new_chunks > self.chunks_capacity:
+                capacity = max(self.chunks_capacity * 2, self.nchunks + new_chunks)
+                chunks = <builder_chunk *>realloc(self.chunks, capacity * sizeof(builder_chunk))
+                if not chunks:
+                    raise MemoryError()
+                self.chunks = chunks
+                self.chunks_capacity = capacity
+            # insert the new chunks in key order, from the back
+            i = self.buf_size - 1
+            j = self.nchunks - 1
+            n = self.nchunks + new_chunks - 1
+            while i >= 0:
+                key = _bitmap_key(self.buf[i])
+                while j >= 0 and self.chunks[j].key > key:
+                    self.chunks[n] = self.chunks[j]
+                    n -= 1
+                    j -= 1
+                if j >= 0 and self.chunks[j].key == key:
+                    self.chunks[n] = self.chunks[j]
+                    j -= 1
+                else:
+                    self.chunks[n].key = key
+                    self.chunks[n].cardinality = 0
+                    self.chunks[n].lows = NULL
+                    self.chunks[n].words = NULL
+                n -= 1
+                while i >= 0 and _bitmap_key(self.buf[i]) == key:
+                    i -= 1
+            self.nchunks += new_chunks
+
+        i = j = 0
+        while i < self.buf_size:
+            key = _bitmap_key(self.buf[i])
+            while self.chunks[j].key != key:
+                j += 1
+            start = i
+            while i < self.buf_size and _bitmap_key(self.buf[i]) == key:
+                i += 1
+            _builder_chunk_add(&self.chunks[j], self.buf + start, i - start)
+        self.buf_size = 0
+        return 0
+
+    def __len__(self):
+        cdef Py_ssize_t n
+        cdef uint64_t count = 0
+        self._flush()
+        for n in range(self.nchunks):
+            count += self.chunks[n].cardinality
+        return count
+
+    def tolist(self):
+        """
+        Return all ids as sorted list without duplicates.
+        """
+        cdef Py_ssize_t n
+        cdef uint64_t i
+        cdef int64_t base
+        cdef builder_chunk *chunk
+        self._flush()
+        ids = []
+        for n in range(self.nchunks):
+            chunk = &self.chunks[n]
+            base = chunk.key << 16
+            if chunk.words:
+                for i in range(ID_BITMAP_WORDS * 64):
+                    if chunk.words[i >> 6] & ((<uint64_t>1) << (i & 63)):
+                        ids.append(base | <int64_t>i)
+            else:
+                for i in range(chunk.cardinality):
+                    ids.append(base | chunk.lows[i])
+        return ids
+
+    def write(self, filename):
+        """
+        Write all ids to filename. Replaces existing files atomically.
+        """
+        cdef FILE *f
+        cdef bitmap_chunk entry
+        cdef uint64_t padding = 0
+        cdef uint64_t nchunks, count = 0, offset, size
+        cdef Py_ssize_t n
+
+        self._flush()
+        nchunks = self.nchunks
+        for n in range(self.nchunks):
+            count += self.chunks[n].cardinality
+
+        tmp_filename = filename + '.tmp'
+        f = fopen(tmp_filename, 'wb')
+        if not f:
+            raise IOError('unable to open %s' % tmp_filename)
+        try:
+            fwrite(ID_BITMAP_MAGIC, 1, 8, f)
+            fwrite(&nchunks, sizeof(uint64_t), 1, f)
+            fwrite(&count, sizeof(uint64_t), 1, f)
+            offset = ID_BITMAP_HEADER + nchunks * sizeof(bitmap_chunk)
+            for n in range(self.nchunks):
+                entry.key = self.chunks[n].key
+                entry.offset = offset
+                entry.cardinality = self.chunks[n].cardinality
+                fwrite(&entry, sizeof(bitmap_chunk), 1, f)
+                offset += _bitmap_container_size(entry.cardinality)
+            for n in range(self.nchunks):
+                if self.chunks[n].words:
+                    fwrite(self.chunks[n].words, sizeof(uint64_t), ID_BITMAP_WORDS, f)
+                else:
+                    size = self.chunks[n].cardinality * sizeof(uint16_t)
+                    fwrite(self.chunks[n].lows, 1, size, f)
+                    # arrays are padded to 8 bytes
+                    fwrite(&padding, 1, _bitmap_container_size(self.chunks[n].cardinality) - size, f)
+        finally:
+            fclose(f)
+        os.rename(tmp_filename, filename)
+
+    def __dealloc__(self):
+        cdef Py_ssize_t n
+        for n in range(self.nchunks):
+            free(self.chunks[n].lows)
+            free(self.chunks[n].words)
+        free(self.chunks)
+        free(self.buf)
+
+cdef class IdBitmap:
+    """
+    Read-only `IdBitmapBuilder` file. The file is memory-mapped and
+    all processes share the same pages. Membership tests need a
+    binary search in the chunk index and a single lookup in the
+    container. A missing file is an empty bitmap.
+
+    Iterates all ids in sorted order.
+    """
+    cdef object filename
+    cdef int fd
+    cdef char *data
+    cdef size_t data_size
+    cdef bitmap_chunk *chunks
+    cdef int64_t nchunks
+    cdef int64_t count
+    cdef int64_t _iter_chunk
+    cdef int64_t _iter_pos
+
+    def __cinit__(self, filename):
+        self.fd = -1
+        self.data = NULL
+        self.nchunks = 0
+        self.count = 0
+
+    def __init__(self, filename):
+        cdef stat st
+        cdef int64_t n
+        self.filename = filename
+        if not os.path.exists(filename):
+            return
+        self.fd = c_open(filename, O_RDONLY, 0)
+        if self.fd < 0:
+            raise IOError('unable to open %s' % filename)
+        if fstat(self.fd, &st) != 0:
+            raise IOError('unable to stat %s' % filename)
+        if st.st_size < ID_BITMAP_HEADER:
+            return
+        self.data = <char *>mmap(NULL, st.st_size, PROT_READ, MAP_SHARED, self.fd, 0)
+        if self.data == MAP_FAILED:
+            self.data = NULL
+            raise IOError('unable to mmap %s' % filename)
+        self.data_size = st.st_size
+        if memcmp(self.data, ID_BITMAP_MAGIC, 8) != 0:
+            raise IOError('%s is not an id bitmap' % filename)
+        self.chunks = <bitmap_chunk *>(self.data + ID_BITMAP_HEADER)
+        n = (<int64_t *>(self.data + 8))[0]
+        if ID_BITMAP_HEADER + n * sizeof(bitmap_chunk) > self.data_size or (n and
+            self.chunks[n-1].offset + _bitmap_container_size(
+                self.chunks[n-1].cardinality) > self.data_size):
+            raise IOError('%s is truncated' % filename)
+        self.nchunks = n
+        self.count = (<int64_t *>(self.data + 16))[0]
+
+    cdef bint _contains(self, int64_t osmid) nogil:
+        cdef int64_t key = _bitmap_key(osmid), lo = 0, hi = self.nchunks - 1, mid
+        cdef uint16_t low = osmid & 0xffff
+        cdef bitmap_chunk *chunk = NULL
+        cdef uint16_t *lows
+        cdef uint64_t *words
+        while lo <= hi:
+            mid = lo + (hi - lo) // 2
+            if self.chunks[mid].key == key:
+                chunk = &self.chunks[mid]
+                break
+            if self.chunks[mid].key < key:
+                lo = mid + 1
+            else:
+                hi = mid - 1
+        if chunk == NULL:
+            return 0
+        if chunk.cardinality > ID_BITMAP_ARRAY_MAX:
+            words = <uint64_t *>(self.data + chunk.offset)
+            return (words[low >> 6] >> (low & 63)) & 1
+        lows = <uint16_t *>(self.data + chunk.offset)
+        lo = 0
+        hi = chunk.cardinality - 1
+        while lo <= hi:
+            mid = lo + (hi - lo) // 2
+            if lows[mid] == low:
+                return 1
+            if lows[mid] < low:
+                lo = mid + 1
+            else:
+                hi = mid - 1
+        return 0
+
+    def __contains__(self, int64_t osmid):
+        return self._contains(osmid)
+
+    def filter(self, items):
+        """
+        Return a list of all items (e.g. coords tuples) with an id
+        (the first element) in this bitmap.
+        """
+        cdef int64_t osmid
+        result = []
+        for item in items:
+            osmid = item[0]
+            if self._contains(osmid):
+                result.append(item)
+        return result
+
+    def __len__(self):
+        return self.count
+
+    def __iter__(self):
+        """
+        Return an iterator over all ids. Resets any existing iterator.
+        """
+        self._iter_chunk = 0
+        self._iter_pos = 0
+        return self
+
+    def __next__(self):
+        cdef bitmap_chunk *chunk
+        cdef uint64_t *words
+        cdef int64_t pos
+        while self._iter_chunk < self.nchunks:
+            chunk = &self.chunks[self._iter_chunk]
+            if chunk.cardinality > ID_BITMAP_ARRAY_MAX:
+                words = <uint64_t *>(self.data + chunk.offset)
+                while self._iter_pos < ID_BITMAP_WORDS * 64:
+                    pos = self._iter_pos
+                    self._iter_pos += 1
+                    if (words[pos >> 6] >> (pos & 63)) & 1:
+                        return (chunk.key << 16) | pos
+            elif self._iter_pos < <int64_t>chunk.cardinality:
+                pos = (<uint16_t *>(self.data + chunk.offset))[self._iter_pos]
+                self._iter_pos += 1
+                return (chunk.key << 16) | pos
+            self._iter_chunk += 1
+            self._iter_pos = 0
+        raise StopIteration
+
+    def close(self):
+        if self.data:
+            munmap(self.data, self.data_size)
+            self.data = NULL
+        if self.fd >= 0:
+            c_close(self.fd)
+            self.fd = -1
+        self.nchunks = 0
+        self.count = 0
+
+    def __dealloc__(self):
+        if self.data:
+            munmap(self.data, self.data_size)
+        if self.fd >= 0:
+            c_close(self.fd)
+
+# Native codec for delta encoded coordinates.
+#
+# The encoding is the protobuf wire format of the DeltaCoords message of
+# older versions (imposm.cache.internal): packed, zigzag encoded varints of
+# the deltas of ids (1), lats (2) and lons (3). Caches that were written with
+# the protobuf module can be read, so existing caches do not need a migration.
+
+DEF DELTA_IDS_FIELD = 1
+DEF DELTA_LATS_FIELD = 2
+DEF DELTA_LONS_FIELD = 3
+
+cdef inline int64_t _delta_value(int field, int64_t *ids, uint32_t *lons,
+    uint32_t *lats, Py_ssize_t i) nogil:
+    if field == DELTA_IDS_FIELD:
+        return ids[i]
+    elif field == DELTA_LATS_FIELD:
+        return lats[i]
+    return lons[i]
+
+cdef unsigned char *_encode_delta_field(unsigned char *p, int field,
+    int64_t *ids, uint32_t *lons, uint32_t *lats, Py_ssize_t n) nogil:
+    cdef Py_ssize_t i
+    cdef uint64_t size = 0
+    cdef int64_t value, last = 0
+    for i in range(n):
+        value = _delta_value(field, ids, lons, lats, i)
+        size += _varint_size(_zigzag_encode(value - last))
+        last = value
+    p = _varint_put(p, (field << 3) | 2)
+    p = _varint_put(p, size)
+    last = 0
+    for i in range(n):
+        value = _delta_value(field, ids, lons, lats, i)
+        p = _varint_put(p, _zigzag_encode(value - last))
+        last = value
+    return p
+
+cdef object _encode_delta_coords(int64_t *ids, uint32_t *lons, uint32_t *lats,
+    Py_ssize_t n):
+    """
+    Encode ids and coords as serialized DeltaCoords message.
+    """
+    cdef unsigned char *buf
+    cdef unsigned char *p
+    if n == 0:
+        return ''
+    buf = <unsigned char *>malloc(3 * (n + 2) * VARINT_MAX_SIZE)
+    if not buf:
+        raise MemoryError()
+    try:
+        p = _encode_delta_field(buf, DELTA_IDS_FIELD, ids, lons, lats, n)
+        p = _encode_delta_field(p, DELTA_LATS_FIELD, ids, lons, lats, n)
+        p = _encode_delta_field(p, DELTA_LONS_FIELD, ids, lons, lats, n)
+        return PyString_FromStringAndSize(<char *>buf, p - buf)
+    finally:
+        free(buf)
+
+cdef inline bint _decode_delta_value(int field, uint64_t raw, int64_t *last,
+    Py_ssize_t *counts, Py_ssize_t capacity, int64_t *ids, uint32_t *lons,
+    uint32_t *lats) nogil:
+    cdef int i = field - 1
+    if counts[i] >= capacity:
+        return 0
+    last[i] += _zigzag_decode(raw)
+    if field == DELTA_IDS_FIELD:
+        ids[counts[i]] = last[i]
+    elif field == DELTA_LATS_FIELD:
+        lats[counts[i]] = <uint32_t>last[i]
+    else:
+        lons[counts[i]] = <uint32_t>last[i]
+    counts[i] += 1
+    return 1
+
+cdef Py_ssize_t _decode_delta_coords(unsigned char *p, Py_ssize_t size,
+    int64_t *ids, uint32_t *lons, uint32_t *lats, Py_ssize_t capacity) nogil:
+    """
+    Decode a serialized DeltaCoords message into ids, lons and lats.
+    The arrays need room for ``capacity`` values.
+
+    Returns the number of decoded coords or -1 for invalid data.
+    """
+    cdef unsigned char *end = p + size
+    cdef unsigned char *field_end
+    cdef uint64_t key, value
+    cdef int field, wire_type
+    cdef int64_t last[3]
+    cdef Py_ssize_t counts[3]
+    last[0] = last[1] = last[2] = 0
+    counts[0] = counts[1] = counts[2] = 0
+
+    while p < end:
+        p = _varint_get(p, end, &key)
+        if p == NULL:
+            return -1
+        field = key >> 3
+        wire_type = key & 0x7
+        if wire_type == 2:
+            p = _varint_get(p, end, &value)
+            if p == NULL or value > <uint64_t>(end - p):
+                return -1
+            field_end = p + value
+            if field < DELTA_IDS_FIELD or field > DELTA_LONS_FIELD:
+                # skip unknown field
+                p = field_end
+                continue
+            while p < field_end:
+                p = _varint_get(p, field_end, &value)
+                if p == NULL:
+                    return -1
+                if not _decode_delta_value(field, value, last, counts,
+                    capacity, ids, lons, lats):
+                    return -1
+        elif wire_type == 0:
+            # unpacked value
+            p = _varint_get(p, end, &value)
+            if p == NULL:
+                return -1
+            if DELTA_IDS_FIELD <= field <= DELTA_LONS_FIELD:
+                if not _decode_delta_value(field, value, last, counts,
+                    capacity, ids, lons, lats):
+                    return -1
+        elif wire_type == 1:
+            p += 8
+        elif wire_type == 5:
+            p += 4
+        else:
+            return -1
+
+    if p != end or counts[0] != counts[1] or counts[0] != counts[2]:
+        return -1
+    return counts[0]
+
+DEF DELTA_NODES_BASE_BYTES = 96 # object and array headers
+DEF DELTA_NODES_MIN_CAPACITY = 8
+
+cdef class DeltaNodes:
+    """
+    Bucket with the fixed-point coordinates of nodes with nearby ids.
+    Stores the sorted ids, lons and lats in three arrays.
+    """
+    cdef int64_t *ids
+    cdef uint32_t *lons
+    cdef uint32_t *lats
+    cdef Py_ssize_t size
+    cdef Py_ssize_t capacity
+    cdef public bint changed
+
+    def __cinit__(self, data=None):
+        self.ids = NULL
+        self.lons = NULL
+        self.lats = NULL
+        self.size = 0
+        self.capacity = 0
+        self.changed = False
+
+    def __init__(self, data=None):
+        if data:
+            self.deserialize(data)
+
+    def __dealloc__(self):
+        free(self.ids)
+        free(self.lons)
+        free(self.lats)
+
+    def __len__(self):
+        return self.size
+
+    cdef _reserve(self, Py_ssize_t capacity):
+        cdef int64_t *ids
+        cdef uint32_t *lons
+        cdef uint32_t *lats
+        if capacity <= self.capacity:
+            return
+        ids = <int64_t *>realloc(self.ids, capacity * sizeof(int64_t))
+        if ids: self.ids = ids
+        lons = <uint32_t *>realloc(self.lons, capacity * sizeof(uint32_t))
+        if lons: self.lons = lons
+        lats = <uint32_t *>realloc(self.lats, capacity * sizeof(uint32_t))
+        if lats: self.lats = lats
+        if not ids or not lons or not lats:
+            raise MemoryError()
+        self.capacity = capacity
+
+    cdef inline Py_ssize_t _search(self, int64_t osmid) nogil:
+        """
+        Return the index of osmid, or the negative insert position - 1
+        if osmid is not stored.
+        """
+        cdef Py_ssize_t lo = 0, hi = self.size, mid
+        if self.size == 0:
+            return -1
+        # direct offset for (nearly) complete buckets
+        mid = osmid - self.ids[0]
+        if 0 <= mid < self.size and self.ids[mid] == osmid:
+            return mid
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self.ids[mid] < osmid:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo < self.size and self.ids[lo] == osmid:
+            return lo
+        return -lo - 1
+
+    cdef inline bint _get(self, int64_t osmid, coord *p) nogil:
+        cdef Py_ssize_t i = self._search(osmid)
+        if i < 0:
+            return 0
+        p.x = self.lons[i]
+        p.y = self.lats[i]
+        return 1
+
+    def get(self, int64_t osmid):
+        cdef coord p
+        if not self._get(osmid, &p):
+            return None
+        return _uint32_to_coord(p.x), _uint32_to_coord(p.y)
+
+    def add(self, int64_t osmid, double lon, double lat):
+        self._add(osmid, _coord_to_uint32(lon), _coord_to_uint32(lat))
+
+    cdef int _add(self, int64_t osmid, uint32_t lon, uint32_t lat) except -1:
+        cdef Py_ssize_t i
+        self.changed = True
+        if self.size == 0 or self.ids[self.size-1] < osmid:
+            i = self.size
+        else:
+            i = self._search(osmid)
+            if i >= 0:
+                # overwrite existing node
+                self.lons[i] = lon
+                self.lats[i] = lat
+                return 0
+            i = -i - 1
+        if self.size == self.capacity:
+            self._reserve(max(DELTA_NODES_MIN_CAPACITY, self.capacity * 2))
+        if i < self.size:
+            memmove(&self.ids[i+1], &self.ids[i], (self.size - i) * sizeof(int64_t))
+            memmove(&self.lons[i+1], &self.lons[i], (self.size - i) * sizeof(uint32_t))
+            memmove(&self.lats[i+1], &self.lats[i], (self.size - i) * sizeof(uint32_t))
+        self.ids[i] = osmid
+        self.lons[i] = lon
+        self.lats[i] = lat
+        self.size += 1
+        return 0
+
+    def nbytes(self):
+        """
+        Return the memory usage in bytes.
+        """
+        return DELTA_NODES_BASE_BYTES + self.capacity * (
+            sizeof(int64_t) + 2 * sizeof(uint32_t))
+
+    def serialize(self):
+        return _encode_delta_coords(self.ids, self.lons, self.lats, self.size)
+
+    def deserialize(self, data):
+        cdef Py_ssize_t n, size = len(data)
+        # each coord needs at least three bytes
+        self._reserve(size // 3 + 1)
+        n = _decode_delta_coords(<unsigned char *><char *>data, size,
+            self.ids, self.lons, self.lats, self.capacity)
+        if n < 0:
+            self.size = 0
+            raise ValueError('invalid delta coords data')
+        self.size = n
+
+DEF DELTA_NODES_CACHE_SIZE = 32 * 1024 * 1024 # bytes
+
+def _delta_nodes_len(data):
+    return len(DeltaNodes(data=data))
+
+ctypedef struct batch_ref:
+    int64_t osmid
+    Py_ssize_t idx # index of the refs list
+    Py_ssize_t pos # position in the refs list
+
+cdef int _cmp_batch_ref(const void *a, const void *b) nogil:
+    cdef int64_t x = (<batch_ref *>a).osmid
+    cdef int64_t y = (<batch_ref *>b).osmid
+    return (x > y) - (x < y)
+
+cdef class _DeltaNodesEntry:
+    """
+    Cached DeltaNodes bucket, linked into the LRU list of DeltaCoordsDB.
+    """
+    cdef int64_t delta_id
+    cdef DeltaNodes node
+    cdef Py_ssize_t nbytes
+    cdef _DeltaNodesEntry prev
+    cdef _DeltaNodesEntry next
+
+cdef class DeltaCoordsDB:
+    """
+    Coordinates database that stores the coordinates of 2^delta_nodes_size
+    nodes in a delta encoded bucket.
+
+    Recently used buckets are kept in a LRU cache that is limited to
+    ``cache_size`` bytes.
+    """
+    cdef BDB db
+    cdef object mode
+    cdef dict delta_nodes
+    cdef _DeltaNodesEntry head # most recently used
+    cdef _DeltaNodesEntry tail # least recently used
+    cdef Py_ssize_t cache_bytes
+    cdef readonly Py_ssize_t cache_size
+    cdef readonly int delta_nodes_size
+    cdef readonly long hits
+    cdef readonly long misses
+    cdef readonly long evictions
+
+    def __init__(self, filename, mode='w', estimated_records=0,
+        cache_size=DELTA_NODES_CACHE_SIZE, delta_nodes_size=6, **tuning):
+        self.db = BDB(filename, mode, estimated_records, **tuning)
+        self.mode = mode
+        self.delta_nodes = {}
+        self.head = self.tail = None
+        self.cache_bytes = 0
+        self.cache_size = cache_size or DELTA_NODES_CACHE_SIZE
+        self.delta_nodes_size = delta_nodes_size
+        self.hits = self.misses = self.evictions = 0
+
+    def put(self, int64_t osmid, double lon, double lat):
+        cdef _DeltaNodesEntry entry
+        if self.mode == 'r':
+            return None
+        entry = self._fetch(osmid >> self.delta_nodes_size)
+        entry.node._add(osmid, _coord_to_uint32(lon), _coord_to_uint32(lat))
+        self._update_nbytes(entry)
+        return True
+
+    put_marshaled = put
+
+    def put_many(self, coords, marshaled=False):
+        """
+        Store a batch of ``(osmid, lon, lat)`` tuples.
+        Returns the number of stored coords. `marshaled` is ignored,
+        see `CoordDB.put_many`.
+
+        The coords of the parser are sorted, so the bucket is only
+        looked up when the next coord belongs to another bucket.
+        """
+        cdef _DeltaNodesEntry entry = None
+        cdef int64_t osmid, delta_id
+        cdef double lon, lat
+        cdef Py_ssize_t n = 0
+        if self.mode == 'r':
+            return 0
+        for osmid, lon, lat in coords:
+            delta_id = osmid >> self.delta_nodes_size
+            if entry is None or entry.delta_id != delta_id:
+                if entry is not None:
+                    # update the cache size before _fetch evicts any bucket
+                    self._update_nbytes(entry)
+                entry = self._fetch(delta_id)
+            entry.node._add(osmid, _coord_to_uint32(lon), _coord_to_uint32(lat))
+            n += 1
+        if entry is not None:
+            self._update_nbytes(entry)
+        return n
+
+    cdef _update_nbytes(self, _DeltaNodesEntry entry):
+        cdef Py_ssize_t nbytes = entry.node.nbytes()
+        self.cache_bytes += nbytes - entry.nbytes
+        entry.nbytes = nbytes
+
+    def get(self, int64_t osmid):
+        return self._fetch(osmid >> self.delta_nodes_size).node.get(osmid)
+
+    def get_coords(self, osmids):
+        coords = []
+        for osmid in osmids:
+            coord = self.get(osmid)
+            if coord is None:
+                return
+            coords.append(coord)
+        return coords
+
+    def get_coords_many(self, osmids):
+        """
+        Return a CoordBuffer with the coordinates of all refs.
+        """
+        return self.get_coords_batch([osmids])[0]
+
+    cdef CoordBuffer _get_coords_ids(self, int64_t *ids, Py_ssize_t n):
+        """
+        Return a CoordBuffer with the coordinates of n ids. Each bucket
+        is fetched once for consecutive ids of the bucket, so sorted ids
+        fetch each bucket only once.
+        """
+        cdef Py_ssize_t i
+        cdef _DeltaNodesEntry entry = None
+        cdef int64_t delta_id, last_delta_id = -1
+        cdef coord p
+        cdef CoordBuffer buf = _coord_buffer(n)
+        for i in range(n):
+            delta_id = ids[i] >> self.delta_nodes_size
+            if entry is None or delta_id != last_delta_id:
+                entry = self._fetch(delta_id)
+                last_delta_id = delta_id
+            if entry.node._get(ids[i], &p):
+                buf._set(i, p)
+            else:
+                buf._unset(i)
+        return buf
+
+    def get_coords_batch(self, refs_list):
+        """
+        Return a CoordBuffer for each list of refs.
+
+        Resolves the refs of all lists grouped by their bucket, so each
+        bucket is fetched only once for the whole batch.
+        """
+        cdef Py_ssize_t i, j, n = 0
+        cdef batch_ref *refs
+        cdef batch_ref *r
+        cdef CoordBuffer buf, prev_buf = None
+        cdef _DeltaNodesEntry entry = None
+        cdef int64_t delta_id, last_delta_id = -1
+        cdef coord p
+
+        bufs = []
+        for way_refs in refs_list:
+            bufs.append(_coord_buffer(len(way_refs)))
+            n += len(way_refs)
+
+        refs = <batch_ref *>malloc(n * sizeof(batch_ref) + 1)
+        if not refs:
+            raise MemoryError()
+        try:
+            n = 0
+            for i, way_refs in enumerate(refs_list):
+                for j, osmid in enumerate(way_refs):
+                    refs[n].osmid = osmid
+                    refs[n].idx = i
+                    refs[n].pos = j
+                    n += 1
+            qsort(refs, n, sizeof(batch_ref), _cmp_batch_ref)
+
+            for i in range(n):
+                r = &refs[i]
+                buf = bufs[r.idx]
+                if i and refs[i-1].osmid == r.osmid:
+                    # duplicate ref, copy previous result
+                    if prev_buf.found[refs[i-1].pos]:
+                        buf._copy(r.pos, prev_buf, refs[i-1].pos)
+                    else:
+                        buf._unset(r.pos)
+                    prev_buf = buf
+                    continue
+                delta_id = r.osmid >> self.delta_nodes_size
+                if entry is None or delta_id != last_delta_id:
+                    entry = self._fetch(delta_id)
+                    last_delta_id = delta_id
+                if entry.node._get(r.osmid, &p):
+                    buf._set(r.pos, p)
+                else:
+                    buf._unset(r.pos)
+                prev_buf = buf
+        finally:
+            free(refs)
+        return bufs
+
+    def stats(self):
+        """
+        Return the hits, misses and evictions of the bucket cache.
+        """
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'cache_bytes': self.cache_bytes,
+            'cache_size': self.cache_size,
+        }
+
+    def scan_stats(self, Py_ssize_t sample_size=0):
+        """
+        Scan all buckets, see `BDB.scan_stats`. ``records`` is the number
+        of nodes, ``buckets`` the number of stored buckets and
+        ``bucket_fill`` the average share of used ids in each bucket.
+        """
+        cdef DeltaNodes nodes
+        cdef int64_t bucket_size = 1 << self.delta_nodes_size
+        result = self.db.scan_stats(_delta_nodes_len, sample_size)
+        buckets = result['records']
+        result['buckets'] = buckets
+        result['records'] = result.pop('values')
+        result['bucket_fill'] = 0.0
+        if buckets:
+            result['bucket_fill'] = float(result['records']) / buckets / bucket_size
+            nodes = self._get(result['min_id'])
+            if nodes.size:
+                result['min_id'] = nodes.ids[0]
+            nodes = self._get(result['max_id'])
+            if nodes.size:
+                result['max_id'] = nodes.ids[nodes.size - 1]
+        # random node of each sampled bucket
+        sample = []
+        for delta_id in result['sample']:
+            nodes = self._get(delta_id)
+            if nodes.size:
+                sample.append(nodes.ids[<Py_ssize_t>(drand48() * nodes.size)])
+        result['sample'] = sample
+        return result
+
+    def optimize(self, **kw):
+        """
+        Rebuild the database of the buckets in key order, see `BDB.optimize`.
+        """
+        self.db.optimize(**kw)
+
+    def close(self):
+        # least recently used first, continues the order of the evictions
+        cdef _DeltaNodesEntry entry = self.tail
+        if self.mode != 'r':
+            while entry is not None:
+                if entry.node.changed:
+                    self._put(entry.delta_id, entry.node)
+                entry = entry.prev
+        self.delta_nodes = {}
+        self.head = self.tail = None
+        self.cache_bytes = 0
+        self.db.close()
+
+    def _put(self, delta_id, delta_node):
+        data = delta_node.serialize()
         self.db.put_marshaled(delta_id, data)
-    
+
     def _get(self, delta_id):
         return DeltaNodes(data=self.db.get_raw(delta_id))
-    
-    def fetch_delta_node(self, delta_id):
-        if len(self.delta_node_ids) >= self.delta_nodes_cache_size:
-            rm_id = self.delta_node_ids.popleft()
-            rm_node = self.delta_nodes.pop(rm_id)
-            if rm_node.changed:
-                self._put(rm_id, rm_node)
-        new_node = self._get(delta_id)
-        if new_node is None:
-            new_node = DeltaNodes()
-        self.delta_nodes[delta_id] = new_node
-        self.delta_node_ids.append(delta_id)
 
+    cdef _DeltaNodesEntry _fetch(self, int64_t delta_id):
+        """
+        Return the cache entry for delta_id, load it on a cache miss.
+        """
+        cdef _DeltaNodesEntry entry = self.delta_nodes.get(delta_id)
+        if entry is not None:
+            self.hits += 1
+            if entry is not self.head:
+                self._unlink(entry)
+                self._push(entry)
+            return entry
+
+        self.misses += 1
+        entry = _DeltaNodesEntry()
+        entry.delta_id = delta_id
+        entry.node = self._get(delta_id)
+        entry.nbytes = entry.node.nbytes()
+        self.delta_nodes[delta_id] = entry
+        self._push(entry)
+        self.cache_bytes += entry.nbytes
+
+        while self.cache_bytes > self.cache_size and self.tail is not entry:
+            self._evict(self.tail)
+        return entry
+
+    cdef _evict(self, _DeltaNodesEntry entry):
+        self.evictions += 1
+        self._unlink(entry)
+        del self.delta_nodes[entry.delta_id]
+        self.cache_bytes -= entry.nbytes
+        if entry.node.changed and self.mode != 'r':
+            self._put(entry.delta_id, entry.node)
+
+    cdef _push(self, _DeltaNodesEntry entry):
+        entry.prev = None
+        entry.next = self.head
+        if self.head is not None:
+            self.head.prev = entry
+        self.head = entry
+        if self.tail is None:
+            self.tail = entry
+
+    cdef _unlink(self, _DeltaNodesEntry entry):
+        if entry.prev is not None:
+            entry.prev.next = entry.next
+        else:
+            self.head = entry.next
+        if entry.next is not None:
+            entry.next.prev = entry.prev
+        else:
+            self.tail = entry.prev
+        entry.prev = entry.next = None
+
+# Sharded caches.
+#
+# The ids are split into ranges of 2^SHARD_BITS ids and the ranges are
+# assigned round-robin to the shards. Sorted input is spread evenly
+# across all shards, so each shard can be written by its own process,
+# and each shard still receives sorted input. The ranges are larger than
+# the buckets of the DeltaCoordsDB.
+
+DEF SHARD_BITS = 16
+
+cdef inline Py_ssize_t _shard_of(int64_t osmid, Py_ssize_t shards) nogil:
+    return <uint64_t>(osmid >> SHARD_BITS) % <uint64_t>shards
+
+def shard_of(int64_t osmid, Py_ssize_t shards):
+    """
+    Return the shard (0 to shards-1) for osmid.
+    """
+    return _shard_of(osmid, shards)
+
+def split_shards(data, Py_ssize_t shards):
+    """
+    Split a batch of elements (tuples with the id as first item) into
+    one list for each shard.
+    """
+    cdef int64_t osmid
+    parts = [[] for _ in range(shards)]
+    for d in data:
+        osmid = d[0]
+        (<list>parts[_shard_of(osmid, shards)]).append(d)
+    return parts
+
+cdef class _SortedMerge:
+    """
+    Iterator over the elements of multiple sorted iterators, sorted by
+    their ``osm_id``.
+    """
+    cdef list heap
+
+    def __init__(self, iters):
+        self.heap = []
+        for it in iters:
+            self._push(it)
+
+    cdef _push(self, it):
+        try:
+            elem = next(it)
+        except StopIteration:
+            return
+        # ids are unique across all shards, elems are never compared
+        heapq.heappush(self.heap, (elem.osm_id, elem, it))
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        if not self.heap:
+            raise StopIteration
+        osmid_, elem, it = heapq.heappop(self.heap)
+        self._push(it)
+        return elem
+
+cdef class ShardedDB:
+    """
+    Database that is split into multiple files by id ranges and
+    routes all operations to the database of the right shard.
+
+    Iterates the elements of all shards sorted by id.
+
+    :param dbs: the opened database for each shard
+    """
+    cdef readonly list dbs
+    cdef Py_ssize_t shards
+
+    def __init__(self, dbs):
+        self.dbs = list(dbs)
+        self.shards = len(self.dbs)
+
+    cdef inline object _db(self, int64_t osmid):
+        return self.dbs[_shard_of(osmid, self.shards)]
+
+    def put(self, int64_t osmid, *args):
+        return self._db(osmid).put(osmid, *args)
+
+    def put_marshaled(self, int64_t osmid, data):
+        return self._db(osmid).put_marshaled(osmid, data)
+
+    def get(self, int64_t osmid):
+        return self._db(osmid).get(osmid)
+
+    def __contains__(self, int64_t osmid):
+        return osmid in self._db(osmid)
+
+    def __len__(self):
+        return sum([len(db) for db in self.dbs])
+
+    def __iter__(self):
+        return _SortedMerge([iter(db) for db in self.dbs])
+
+    def close(self):
+        for db in self.dbs:
+            db.close()
+
+cdef class ShardedCoordsDB(ShardedDB):
+    """
+    Sharded coordinates database for all coords caches.
+    """
+    def put(self, int64_t osmid, double lon, double lat):
+        return self._db(osmid).put(osmid, lon, lat)
+
+    put_marshaled = put
+
+    def get_coords(self, refs):
+        cdef int64_t osmid
+        coords = list()
+        for osmid in refs:
+            coord = self._db(osmid).get(osmid)
+            if coord is None:
+                return
+            coords.append(coord)
+        return coords
+
+    def get_coords_many(self, refs):
+        """
+        Return a CoordBuffer with the coordinates of all refs.
+        """
+        return self.get_coords_batch([refs])[0]
+
+    cdef CoordBuffer _get_coords_ids(self, int64_t *ids, Py_ssize_t n):
+        """
+        Return a CoordBuffer with the coordinates of n ids. The ids of
+        each shard are requested at once, in the same order.
+        """
+        cdef Py_ssize_t i, k, m, s
+        cdef int64_t *shard_ids
+        cdef Py_ssize_t *positions
+        cdef CoordBuffer part, buf = _coord_buffer(n)
+        shard_ids = <int64_t *>malloc(n * sizeof(int64_t) + 1)
+        positions = <Py_ssize_t *>malloc(n * sizeof(Py_ssize_t) + 1)
+        try:
+            if not shard_ids or not positions:
+                raise MemoryError()
+            for s in range(self.shards):
+                m = 0
+                for i in range(n):
+                    if _shard_of(ids[i], self.shards) == s:
+                        shard_ids[m] = ids[i]
+                        positions[m] = i
+                        m += 1
+                if not m:
+                    continue
+                part = _coords_of_ids(self.dbs[s], shard_ids, m)
+                for k in range(m):
+                    buf._copy(positions[k], part, k)
+                buf.missing += part.missing
+        finally:
+            free(shard_ids)
+            free(positions)
+        return buf
+
+    def get_coords_batch(self, refs_list):
+        """
+        Return a CoordBuffer for each list of refs.
+
+        Sends a single batch to each shard. Refs of a list with refs
+        from multiple shards are split and the results are merged.
+        """
+        cdef Py_ssize_t i, j, k, s, n
+        cdef int64_t osmid
+        cdef CoordBuffer buf, part
+
+        requests = [[] for _ in range(self.shards)]
+        targets = [[] for _ in range(self.shards)]
+        bufs = []
+        for i, refs in enumerate(refs_list):
+            n = len(refs)
+            bufs.append(_coord_buffer(n))
+            if n == 0:
+                continue
+            s = _shard_of(refs[0], self.shards)
+            for osmid in refs:
+                if _shard_of(osmid, self.shards) != s:
+                    break
+            else:
+                # all refs in one shard (most ways)
+                requests[s].append(refs)
+                targets[s].append((i, None))
+                continue
+            parts = [None] * self.shards
+            for j in range(n):
+                s = _shard_of(refs[j], self.shards)
+                if parts[s] is None:
+                    parts[s] = ([], [])
+                parts[s][0].append(refs[j])
+                parts[s][1].append(j)
+            for s in range(self.shards):
+                if parts[s] is not None:
+                    requests[s].append(parts[s][0])
+                    targets[s].append((i, parts[s][1]))
+
+        for s in range(self.shards):
+            if not requests[s]:
+                continue
+            results = self.dbs[s].get_coords_batch(requests[s])
+            for part, (i, positions) in zip(results, targets[s]):
+                buf = bufs[i]
+                if positions is None:
+                    memcpy(buf.points, part.points, part.size * sizeof(coord))
+                    memcpy(buf.found, part.found, part.size)
+                else:
+                    for k, j in enumerate(positions):
+                        buf._copy(j, part, k)
+                buf.missing += part.missing
+        return bufs
@@ -12,6 +12,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import os
+
 from collections import defaultdict
 from multiprocessing import Process
 
@@ -19,6 +21,7 @@ import threading
 from Queue import Queue 
 
 from imposm.base import OSMElem
+from imposm.cache.tc import IdBitmapBuilder
 from imposm.geom import IncompletePolygonError
 from imposm.mapping import DropElem
 from imposm.multipolygon import RelationBuilder
@@ -57,6 +60,8 @@ class ImporterProcess(Process):
         pass
 
     def teardown(self):
+        for fname, stats in self.osm_cache.stats():
+            log_cache_stats(self.name, fname, stats)
         self.osm_cache.close_all()
         self.db_queue.put(None)
         self.db_importer.join()
@@ -77,6 +82,14 @@ class ImporterProcess(Process):
                     pass
         return inserted
 
+def log_cache_stats(name, fname, stats):
+    lookups = (stats['hits'] + stats['misses']) or 1
+    log.info('%s process %s: %d hits, %d misses (%.1f%% hit rate), '
+        '%d evictions, %dMB/%dMB cached', name, os.path.basename(fname),
+        stats['hits'], stats['misses'], 100.0 * stats['hits'] / lookups,
+        stats['evictions'], stats['cache_bytes'] // 1024 // 1024,
+        stats['cache_size'] // 1024 // 1024)
+
 class NodeProcess(ImporterProcess):
     name = 'node'
 
@@ -98,35 +111,36 @@ class WayProcess(ImporterProcess):
 
     def doit(self):
         coords_cache = self.osm_cache.coords_cache(mode='r')
-        inserted_ways_cache = self.osm_cache.inserted_ways_cache(mode='r')
-        inserted_ways = iter(inserted_ways_cache)
-
-        try:
-            skip_id = inserted_ways.next()
-        except StopIteration:
-            skip_id = 2**64
+        # None if the ways were not denormalized after the read
+        way_coords_cache = self.osm_cache.way_coords_cache(mode='r')
+        # memory-mapped and shared with all other way processes
+        inserted_ways = self.osm_cache.inserted_ways_bitmap()
 
         while True:
             ways = self.in_queue.get()
             if ways is None:
                 break
 
+            mapped_ways = []
             for way in ways:
-                while skip_id < way.osm_id:
-                    try:
-                        skip_id = inserted_ways.next()
-                    except StopIteration:
-                        skip_id = 2**64
-                if skip_id == way.osm_id:
+                if way.osm_id in inserted_ways:
                     continue
 
                 mappings = self.mapper.for_ways(way.tags)
                 if not mappings:
                     continue
-
-                coords = coords_cache.get_coords(way.refs)
-
-                if not coords:
+                mapped_ways.append((way, mappings))
+
+            # resolve coords of all ways at once
+            if way_coords_cache is not None:
+                coords_batch = way_coords_cache.get_ways_coords(
+                    [way for way, mappings in mapped_ways], coords_cache)
+            else:
+                coords_batch = coords_cache.get_coords_batch(
+                    [way.refs for way, mappings in mapped_ways])
+
+            for (way, mappings), coords in zip(mapped_ways, coords_batch):
+                if coords.missing or not coords:
                     print 'missing coords for way %s' % (way.osm_id, )
                     continue
 
@@ -136,32 +150,36 @@ class WayProcess(ImporterProcess):
 class RelationProcess(ImporterProcess):
     name = 'relation'
 
-    def __init__(self, in_queue, db, mapper, osm_cache, dry_run, inserted_way_queue):
-        ImporterProcess.__init__(self, in_queue, db, mapper, osm_cache, dry_run)
-        self.inserted_way_queue = inserted_way_queue
-
     def doit(self):
         coords_cache = self.osm_cache.coords_cache(mode='r')
         ways_cache = self.osm_cache.ways_cache(mode='r')
+        way_coords_cache = self.osm_cache.way_coords_cache(mode='r')
+        inserted_ways = IdBitmapBuilder()
 
-        while True:
-            relations = self.in_queue.get()
-            if relations is None:
-                break
+        # merge_inserted_ways expects the file of each process, also
+        # with the ways of the relations before an error
+        try:
+            while True:
+                relations = self.in_queue.get()
+                if relations is None:
+                    break
             
-            for relation in relations:
-                builder = RelationBuilder(relation, ways_cache, coords_cache)
-                try:
-                    builder.build()
-                except IncompletePolygonError, ex:
-                    if str(ex):
-                        log.debug(ex)
-                    continue
-                mappings = self.mapper.for_relations(relation.tags)
-                if mappings:
-                    inserted = self.insert(mappings, relation.osm_id, relation.geom, relation.tags)
-                    if inserted:
-                        builder.mark_inserted_ways(self.inserted_way_queue)
+                for relation in relations:
+                    builder = RelationBuilder(relation, ways_cache, coords_cache,
+                        way_coords_cache)
+                    try:
+                        builder.build()
+                    except IncompletePolygonError, ex:
+                        if str(ex):
+                            log.debug(ex)
+                        continue
+                    mappings = self.mapper.for_relations(relation.tags)
+                    if mappings:
+                        inserted = self.insert(mappings, relation.osm_id, relation.geom, relation.tags)
+                        if inserted:
+                            builder.mark_inserted_ways(inserted_ways)
+        finally:
+            self.osm_cache.write_inserted_ways(inserted_ways)
 
 
 class DBImporter(threading.Thread):
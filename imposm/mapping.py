@@ -13,6 +13,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import hashlib
+
 import imposm.geom
 
 ANY = '__any__'
@@ -133,6 +135,28 @@ class TagMapper(object):
     def for_relations(self, tags):
         return self._mapping_for_tags(self.polygon_mappings, tags)
 
+    def tag_strings(self):
+        """
+        Return a set with all tag keys and values of the mappings.
+        These are the most frequent strings of the filtered tags.
+        """
+        strings = set(['name', 'type', 'multipolygon', 'boundary'])
+        for tags in (self.point_tags, self.line_tags, self.polygon_tags):
+            for key, values in tags.iteritems():
+                strings.add(key)
+                strings.update(v for v in values if v != ANY)
+        return strings
+
+    def tag_filter_signature(self):
+        """
+        Return a hash of the tags of all mappings. Caches that were read
+        with another signature contain other tags.
+        """
+        data = []
+        for tags in (self.point_tags, self.line_tags, self.polygon_tags):
+            data.append(sorted((key, sorted(values)) for key, values in tags.iteritems()))
+        return hashlib.sha1(repr(data)).hexdigest()
+
     def _tag_filter(self, filter_tags):
         filter_tags['name'] = set(['__any__'])
         def filter(tags):
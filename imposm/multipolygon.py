@@ -45,15 +45,16 @@ def RelationBuilder(*args, **kw):
 
 class RelationBuilderBase(object):
     validate_rings = True
-    def __init__(self, relation, ways_cache, coords_cache):
+    def __init__(self, relation, ways_cache, coords_cache, way_coords_cache=None):
         self.relation = relation
         self.polygon_builder = PolygonBuilder()
         self.linestring_builder = LineStringBuilder()
         self.ways_cache = ways_cache
         self.coords_cache = coords_cache
+        self.way_coords_cache = way_coords_cache
     
     def fetch_ways(self):
-        ways = []
+        member_ways = []
         for member in self.relation.members:
             # skip label nodes, relations of relations, etc
             if member[1] != 'way': continue
@@ -68,8 +69,11 @@ class RelationBuilderBase(object):
                 log.warn('multiple linestrings in way %s (relation %s)',
                        member[0], self.relation.osm_id)
                 raise IncompletePolygonError()
-            
-            way.coords = self.fetch_way_coords(way)
+            member_ways.append(way)
+
+        ways = []
+        for way, coords in zip(member_ways, self.fetch_ways_coords(member_ways)):
+            way.coords = coords
             if way.coords is None:
                 if not imposm.config.import_partial_relations:
                     raise IncompletePolygonError()
@@ -113,12 +117,32 @@ class RelationBuilderBase(object):
         """
         Fetch all coordinates of way.refs.
         """
-        coords = self.coords_cache.get_coords(way.refs)
-        if coords is None:
-            log.debug('missing coord from way %s in relation %s',
-                way.osm_id, self.relation.osm_id)
-            return None
-        return coords
+        return self.fetch_ways_coords([way])[0]
+
+    def fetch_ways_coords(self, ways):
+        """
+        Fetch all coordinates of the refs of all ways in one batch.
+        Returns a list with the coordinates of each way (a `CoordBuffer`
+        of the coords cache), or None if a coordinate of the way is
+        missing. The coords are only converted when the geometries of
+        the rings are built.
+
+        Uses the denormalized coordinates of the `way_coords_cache`,
+        if available.
+        """
+        result = []
+        if self.way_coords_cache is not None:
+            coords_batch = self.way_coords_cache.get_ways_coords(ways, self.coords_cache)
+        else:
+            coords_batch = self.coords_cache.get_coords_batch([w.refs for w in ways])
+        for way, coords in zip(ways, coords_batch):
+            if coords.missing:
+                log.debug('missing coord from way %s in relation %s',
+                    way.osm_id, self.relation.osm_id)
+                result.append(None)
+            else:
+                result.append(coords)
+        return result
     
     def build_relation_geometry(self, rings):
         """
@@ -127,10 +151,14 @@ class RelationBuilderBase(object):
         raise NotImplementedError()
         
     
-    def mark_inserted_ways(self, inserted_ways_queue):
+    def mark_inserted_ways(self, inserted_ways):
+        """
+        Add the ids of all inserted ways of the relation to
+        ``inserted_ways`` (e.g. a set or a `IdBitmapBuilder`).
+        """
         for w in self.relation.ways:
             if w.inserted:
-                inserted_ways_queue.put(w.osm_id)
+                inserted_ways.add(w.osm_id)
     
     def build(self):
         try:
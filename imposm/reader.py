@@ -12,74 +12,187 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import os
+import threading
 from functools import partial
-from multiprocessing import Process, JoinableQueue
+from multiprocessing import Process, JoinableQueue, Value
 
+from imposm.cache.osm import cache_names
+from imposm.cache.tc import split_shards, IdBitmap, IdBitmapBuilder, RecordEncoder
 from imposm.parser import OSMParser
 from imposm.util import ParserProgress, setproctitle
 
 class ImposmReader(object):
-    def __init__(self, mapping, cache, pool_size=2, merge=False, logger=None):
+    """
+    Reads OSM files into the caches.
+
+    With `two_pass` each file is parsed twice and only the coords that
+    are needed for the import are cached. The first pass stores the
+    relations and the tagged ways. The untagged ways are stored in a
+    temporary cache and only the ways of relations are kept. The second
+    pass stores the nodes and the coords of all refs of these ways
+    (see `_referenced_nodes`).
+    """
+    def __init__(self, mapping, cache, pool_size=2, merge=False, logger=None,
+        two_pass=False):
         self.pool_size = pool_size
         self.mapper = mapping
         self.merge = merge
         self.cache = cache
         self.reader = None
         self.logger = logger
+        self.two_pass = two_pass
         self.estimated_coords = 0
+        # estimates for each cache, e.g. from the manifest of older caches
+        self.estimated_records = None
+        # number of written records of each cache for all read files
+        self.records = {'coords': 0, 'nodes': 0, 'ways': 0, 'relations': 0}
 
     def read(self, filename):
-        nodes_queue = JoinableQueue(128)
-        coords_queue = JoinableQueue(512)
-        ways_queue = JoinableQueue(128)
-        relations_queue = JoinableQueue(128)
-        
+        if not self.two_pass:
+            self._read(filename, cache_names)
+            return
+
+        self._read(filename, ('ways', 'relations'), untagged_ways=True)
+        referenced_nodes = self._referenced_nodes()
+        referenced_nodes.write(self.cache.referenced_nodes_fname)
+        try:
+            self._read(filename, ('coords', 'nodes'),
+                coords_filter=self.cache.referenced_nodes_fname,
+                estimates={'coords': len(referenced_nodes)})
+        finally:
+            os.unlink(self.cache.referenced_nodes_fname)
+
+    def _referenced_nodes(self):
+        """
+        Return an `IdBitmapBuilder` with the refs of all tagged ways and
+        of all ways of the relations. Moves the untagged ways of the
+        relations into the ways cache and removes all other untagged ways.
+        """
+        member_ways = IdBitmapBuilder()
+        for relation in self.cache.relations_cache(mode='r'):
+            for member in relation.members:
+                if member[1] == 'way':
+                    member_ways.add(member[0])
+
+        nodes = IdBitmapBuilder()
+        for way in self.cache.ways_cache(mode='r'):
+            nodes.update(way.refs)
+
+        untagged_ways = self.cache.untagged_ways_cache(mode='r')
+        ways_cache = self.cache.ways_cache(mode='w')
+        for osmid in member_ways.tolist():
+            way = untagged_ways.get(osmid)
+            if way is None:
+                continue
+            ways_cache.put(osmid, way.tags, way.refs)
+            nodes.update(way.refs)
+            self.records['ways'] += 1
+        self.cache.close_all()
+        self.cache.remove_untagged_ways()
+        return nodes
+
+    def _read(self, filename, elements, untagged_ways=False, coords_filter=None,
+        estimates=None):
+        """
+        Parse `filename` and store the `elements` (coords, nodes, ways
+        and/or relations) in the caches.
+
+        :param untagged_ways: store untagged ways in the untagged ways cache
+        :param coords_filter: only store coords in this `IdBitmap` file
+        :param estimates: estimated records of each cache that override
+            all other estimates
+        """
         log_proc = ParserProgress()
         log_proc.start()
         
         marshal = True
-        if self.merge:
-            # merging needs access to unmarshaled data
+        if self.merge or untagged_ways:
+            # merging and splitting needs access to unmarshaled data
+            marshal = False
+        # the parser processes encode the records of the cache files,
+        # so the cache writers only need to store them
+        encode = marshal and not self.cache.in_memory
+        if encode:
             marshal = False
         
-        estimates = {
+        cache_estimates = {
             'coords': self.estimated_coords,
             'nodes': self.estimated_coords//50,
             'ways': self.estimated_coords//7,
             'relations': self.estimated_coords//1000,
         }
+        if self.estimated_records:
+            cache_estimates.update(self.estimated_records)
+        if estimates:
+            cache_estimates.update(estimates)
         
-        coords_writer = CacheWriterProcess(coords_queue, self.cache.coords_cache,
-            estimates['coords'], log=partial(log_proc.log, 'coords'),
-            marshaled_data=marshal)
-        coords_writer.start()
+        # before the writer processes are forked, they all need the same codes
+        self.cache.update_tag_dictionary(self.mapper.tag_strings())
 
-        nodes_writer = CacheWriterProcess(nodes_queue, self.cache.nodes_cache,
-            estimates['nodes'], log=partial(log_proc.log, 'nodes'),
-            marshaled_data=marshal)
-        nodes_writer.start()
+        if self.cache.in_memory:
+            # in-memory caches need to be filled in this process
+            CacheWriter = CacheWriterThread
+        else:
+            CacheWriter = CacheWriterProcess
 
+        queues = {}
+        writers = {}
+        if 'coords' in elements:
+            queues['coords'] = ShardedQueue(self.cache.shards['coords'], 512)
+            # one writer for each shard
+            writers['coords'] = [CacheWriter(queue,
+                partial(self.cache.coords_cache, shard=shard),
+                cache_estimates['coords'], log=partial(log_proc.log, 'coords'),
+                marshaled_data=marshal, id_filter=coords_filter)
+                for shard, queue in enumerate(queues['coords'].queues)]
 
-        ways_writer = CacheWriterProcess(ways_queue, self.cache.ways_cache,
-            estimates['ways'], merge=self.merge, log=partial(log_proc.log, 'ways'),
-            marshaled_data=marshal)
-        ways_writer.start()
-        
-        relations_writer = CacheWriterProcess(relations_queue, self.cache.relations_cache,
-            estimates['relations'], merge=self.merge, log=partial(log_proc.log, 'relations'),
-            marshaled_data=marshal)
-        relations_writer.start()
+        if 'nodes' in elements:
+            queues['nodes'] = JoinableQueue(128)
+            writers['nodes'] = [CacheWriter(queues['nodes'], self.cache.nodes_cache,
+                cache_estimates['nodes'], log=partial(log_proc.log, 'nodes'),
+                marshaled_data=marshal, encoded_data=encode)]
+
+        if 'ways' in elements:
+            queues['ways'] = ShardedQueue(self.cache.shards['ways'], 128)
+            writers['ways'] = []
+            for shard, queue in enumerate(queues['ways'].queues):
+                untagged_cache = None
+                if untagged_ways:
+                    untagged_cache = partial(self.cache.untagged_ways_cache, shard=shard)
+                writers['ways'].append(CacheWriter(queue,
+                    partial(self.cache.ways_cache, shard=shard),
+                    cache_estimates['ways'], merge=self.merge, log=partial(log_proc.log, 'ways'),
+                    marshaled_data=marshal, encoded_data=encode,
+                    untagged_cache=untagged_cache))
+
+        if 'relations' in elements:
+            queues['relations'] = JoinableQueue(128)
+            writers['relations'] = [CacheWriter(queues['relations'], self.cache.relations_cache,
+                cache_estimates['relations'], merge=self.merge,
+                log=partial(log_proc.log, 'relations'), marshaled_data=marshal,
+                encoded_data=encode)]
+
+        for name in cache_names:
+            for writer in writers.get(name, []):
+                writer.start()
         
-        log_proc.message('coords: %dk nodes: %dk ways: %dk relations: %dk (estimated)' % (
-            estimates['coords']/1000, estimates['nodes']/1000, estimates['ways']/1000,
-            estimates['relations']/1000)
-        )
+        log_proc.message(' '.join('%s: %dk' % (name, cache_estimates[name]/1000)
+            for name in cache_names if name in elements) + ' (estimated)')
         
         # keep one CPU free for writer proc on hosts with 4 or more CPUs
         pool_size = self.pool_size if self.pool_size < 4 else self.pool_size - 1
         
-        parser = OSMParser(pool_size, nodes_callback=nodes_queue.put, coords_callback=coords_queue.put,
-            ways_callback=ways_queue.put, relations_callback=relations_queue.put, marshal_elem_data=marshal)
+        if encode:
+            tag_dict = self.cache.tag_dictionary()
+            for name, kind in (('nodes', 'nodes'), ('ways', 'reftags'),
+                ('relations', 'reftags')):
+                if name in queues:
+                    queues[name] = EncodingQueue(queues[name],
+                        RecordEncoder(kind, tag_dict))
+
+        callbacks = dict((name + '_callback', queue.put) for name, queue in queues.iteritems())
+        parser = OSMParser(pool_size, marshal_elem_data=marshal, **callbacks)
 
         parser.nodes_tag_filter = self.mapper.tag_filter_for_nodes()
         parser.ways_tag_filter = self.mapper.tag_filter_for_ways()
@@ -87,43 +200,105 @@ class ImposmReader(object):
         
         parser.parse(filename)
 
-        coords_queue.put(None)
-        nodes_queue.put(None)
-        ways_queue.put(None)
-        relations_queue.put(None)
-        coords_writer.join()
-        nodes_writer.join()
-        ways_writer.join()
-        relations_writer.join()
+        for name in cache_names:
+            if name in queues:
+                queues[name].put(None)
+        for name in cache_names:
+            for writer in writers.get(name, []):
+                writer.join()
+                self.records[name] += writer.records.value
         log_proc.stop()
         log_proc.join()
 
 
-class CacheWriterProcess(Process):
+class EncodingQueue(object):
+    """
+    Queue that encodes each batch of elements with `encoder` before it
+    is put into `queue`. The parser calls `put` in its processes, so the
+    elements are encoded in parallel.
+    """
+    def __init__(self, queue, encoder):
+        self.queue = queue
+        self.encoder = encoder
+
+    def put(self, data):
+        if data is not None:
+            data = self.encoder(data)
+        self.queue.put(data)
+
+
+class ShardedQueue(object):
+    """
+    Queue for each shard of a cache. `put` splits each batch of elements
+    and puts the part of each shard into its queue.
+    """
+    def __init__(self, shards, maxsize):
+        self.queues = [JoinableQueue(maxsize) for _ in range(shards)]
+
+    def put(self, data):
+        if data is None:
+            for queue in self.queues:
+                queue.put(None)
+        elif len(self.queues) == 1:
+            self.queues[0].put(data)
+        else:
+            for queue, part in zip(self.queues, split_shards(data, len(self.queues))):
+                if part:
+                    queue.put(part)
+
+
+class CacheWriterMixin(object):
+    """
+    Writes all elements from the queue into the cache.
+
+    :param untagged_cache: cache for all elements without tags (requires
+        unmarshaled data)
+    :param id_filter: `IdBitmap` file, only elements with these ids
+        are stored
+    :param encoded_data: elements are already encoded records of the
+        cache (see `EncodingQueue`)
+    """
     def __init__(self, queue, cache, estimated_records=None, merge=False, log=None,
-        marshaled_data=False):
-        Process.__init__(self)
-        self.daemon = True
-        setproctitle('imposm writer')
+        marshaled_data=False, untagged_cache=None, id_filter=None,
+        encoded_data=False):
         self.queue = queue
         self.cache = cache
         self.merge = merge
         self.log = log
         self.marshaled_data = marshaled_data
+        self.encoded_data = encoded_data
         self.estimated_records = estimated_records
+        self.untagged_cache = untagged_cache
+        self.id_filter = id_filter
+        # shared with the main process
+        self.records = Value('l', 0)
     
     def run(self):
         # print 'creating %s (%d)' % (self.filename, self.estimated_records or 0)
-        cache = self.cache(mode='w', estimated_records=self.estimated_records)
+        # merging reads existing records, bulk mode is for new caches only
+        cache = self.cache(mode='w', estimated_records=self.estimated_records,
+            bulk=not self.merge)
         if self.marshaled_data:
             cache_put = cache.put_marshaled
         else:
             cache_put = cache.put
+        # stores the whole batch with one call, if the cache supports it
+        put_many = getattr(cache, 'put_many', None)
+        untagged = id_filter = None
+        if self.untagged_cache is not None:
+            untagged = self.untagged_cache(mode='w',
+                estimated_records=self.estimated_records, bulk=True)
+        if self.id_filter is not None:
+            # memory-mapped and shared with all other writers
+            id_filter = IdBitmap(self.id_filter)
+        records = 0
         while True:
             data = self.queue.get()
             if data is None: 
                 self.queue.task_done()
                 break
+            if id_filter is not None:
+                data = id_filter.filter(data)
             if self.merge:
                 for d in data:
                     if d[0] in cache:
@@ -131,12 +306,45 @@ class CacheWriterProcess(Process):
                         elem.merge(*d[1:])
                         d = elem.to_tuple()
                     cache_put(*d)
+                records += len(data)
+            elif untagged is not None:
+                for d in data:
+                    if d[1]:
+                        cache_put(*d)
+                        records += 1
+                    else:
+                        untagged.put(*d)
+            elif self.encoded_data:
+                cache.put_records(data)
+                records += len(data)
+            elif put_many is not None:
+                put_many(data, marshaled=self.marshaled_data)
+                records += len(data)
             else:
                 for d in data:
                     cache_put(*d)
+                records += len(data)
             if self.log:
                 self.log(len(data))
             self.queue.task_done()
         cache.close()
+        if untagged is not None:
+            untagged.close()
+        if id_filter is not None:
+            id_filter.close()
+        self.records.value = records
+
+
+class CacheWriterProcess(CacheWriterMixin, Process):
+    def __init__(self, *args, **kw):
+        Process.__init__(self)
+        self.daemon = True
+        setproctitle('imposm writer')
+        CacheWriterMixin.__init__(self, *args, **kw)
 
 
+class CacheWriterThread(CacheWriterMixin, threading.Thread):
+    def __init__(self, *args, **kw):
+        threading.Thread.__init__(self)
+        self.daemon = True
+        CacheWriterMixin.__init__(self, *args, **kw)
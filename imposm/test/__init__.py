@@ -0,0 +1,13 @@
+import shutil
+import tempfile
+
+class TempDirTestBase(object):
+    """
+    Base for tests with a temporary directory ``self.dir`` that is
+    removed after each test.
+    """
+    def setup(self):
+        self.dir = tempfile.mkdtemp()
+
+    def teardown(self):
+        shutil.rmtree(self.dir)
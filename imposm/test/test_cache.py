@@ -13,10 +13,22 @@
 # limitations under the License.
 
 import os
+import ctypes
+import marshal
 import tempfile
-from imposm.cache.tc import NodeDB, DeltaCoordsDB
+from imposm.cache.osm import OSMCache
+from imposm.cache.benchmark import way_cache_benchmark, format_benchmark_results
+from imposm.cache.tc import BDB, CoordDB, NodeDB, WayDB, HashWayDB, RelationDB, TagDictionary, DeltaCoordsDB, DeltaNodes, FlatCoordsDB, SortedCoordsDB
+from imposm.cache.tc import IdBitmap, IdBitmapBuilder, ShardedDB, ShardedCoordsDB, shard_of
+from imposm.cache.tc import prefetch_file, resident_bytes
+from imposm.cache.tc import WayCoordsDB, denormalize_way_coords
+from imposm.cache.tc import available_compression_codecs, RecordEncoder
 
-from nose.tools import eq_, assert_almost_equal
+from imposm.util import file_fingerprint
+from imposm.test import TempDirTestBase
+
+from nose.tools import eq_, assert_almost_equal, assert_raises
+from nose.plugins import skip
 
 
 class TestNodeDB(object):
@@ -57,6 +69,17 @@ class TestNodeDB(object):
         assert not self.db.put(1001, {'foo': 2}, (123, 456))
         assert not self.db.get(1001)
 
+    def test_compression(self):
+        # lz4 caches are also readable without the lz4 option
+        for compression in sorted(available_compression_codecs()):
+            self.db.close()
+            os.unlink(self.fname)
+            self.db = NodeDB(self.fname, compression=compression, lmemb=256)
+            assert self.db.put(1000, {'foo': 2}, (123, 456))
+            self.db.close()
+            self.db = NodeDB(self.fname, 'r')
+            eq_(self.db.get(1000).tags, {'foo': 2})
+
     def test_iter(self):
         assert self.db.put(1000, {'foo': 2}, (123, 456))
         
@@ -68,6 +91,326 @@ class TestNodeDB(object):
         eq_(nd.tags, {'foo': 2})
         eq_(nd.coord, (123, 456))
         
+    def test_tag_dictionary(self):
+        self.db.close()
+        tag_dict = TagDictionary(['highway', 'bus_stop'])
+        self.db = NodeDB(self.fname, tag_dict=tag_dict)
+        assert self.db.put(1000, {u'highway': u'bus_stop', u'name': u'foo'}, (8.5, 53.1))
+        self.db.close()
+        self.db = NodeDB(self.fname, 'r', tag_dict=tag_dict)
+        nd = self.db.get(1000)
+        eq_(nd.tags, {u'highway': u'bus_stop', u'name': u'foo'})
+        eq_(nd.coord, (8.5, 53.1))
+        # decoded strings are the strings of the dictionary
+        assert [k for k in nd.tags if k == 'highway'][0] is tag_dict[0]
+
+    def test_tag_dictionary_str(self):
+        self.db.close()
+        tag_dict = TagDictionary([u'highway', 'bus_stop'])
+        self.db = NodeDB(self.fname, tag_dict=tag_dict)
+        assert self.db.put(1000, {'highway': u'bus_stop'}, (8.5, 53.1))
+        self.db.close()
+        self.db = NodeDB(self.fname, 'r', tag_dict=tag_dict)
+        # codes keep the str/unicode type of the tags
+        eq_([(type(k), type(v)) for k, v in self.db.get(1000).tags.items()],
+            [(str, unicode)])
+
+    def test_scan_stats(self):
+        for osmid in [5, 1000, 2**40]:
+            assert self.db.put(osmid, {'foo': 2}, (123, 456))
+        self.db.close()
+        self.db = NodeDB(self.fname, 'r')
+        stats = self.db.scan_stats(sample_size=2)
+        eq_(stats['records'], 3)
+        eq_(stats['min_id'], 5)
+        eq_(stats['max_id'], 2**40)
+        assert stats['data_bytes'] > 3 * 8
+        eq_(len(stats['sample']), 2)
+        assert set(stats['sample']) <= set([5, 1000, 2**40])
+
+class TestTagDictionary(object):
+    def test_add(self):
+        tag_dict = TagDictionary(['highway', u'primary'])
+        eq_(tag_dict.add(u'highway'), 0)
+        eq_(tag_dict.add('landuse'), 2)
+        eq_(len(tag_dict), 3)
+        eq_(tag_dict[1], u'primary')
+
+    def test_load_save(self):
+        fd_, fname = tempfile.mkstemp('.cache')
+        try:
+            TagDictionary(['highway', u'M\xfcnchen']).save(fname)
+            tag_dict = TagDictionary()
+            tag_dict.load(fname)
+            eq_(len(tag_dict), 2)
+            eq_(tag_dict[1], u'M\xfcnchen')
+        finally:
+            os.unlink(fname)
+
+class TestBulkNodeDB(object):
+    def setup(self):
+        fd_, self.fname = tempfile.mkstemp('.db')
+        self.db = NodeDB(self.fname, bulk=True)
+
+    def teardown(self):
+        os.unlink(self.fname)
+
+    def test_sorted(self):
+        for i in xrange(1000):
+            assert self.db.put(i, {'foo': i}, (i, i))
+        # buffered records
+        eq_(self.db.get(999).tags, {'foo': 999})
+        assert 1000 not in self.db
+        self.db.close()
+        self.db = NodeDB(self.fname, 'r')
+        eq_(len(self.db), 1000)
+        eq_([nd.osm_id for nd in self.db], range(1000))
+        eq_(self.db.get(500).coord, (500, 500))
+
+    def test_interleaved(self):
+        # out of order within the buffer
+        for i in [5, 3, 4, 1, 3, 2]:
+            assert self.db.put(i, {'foo': i}, (i, i))
+        eq_(self.db.get(3).tags, {'foo': 3})
+        self.db.close()
+        self.db = NodeDB(self.fname, 'r')
+        eq_([nd.osm_id for nd in self.db], [1, 2, 3, 4, 5])
+
+    def test_buffered_updates(self):
+        for i in [5, 3, 4, 1]:
+            assert self.db.put(i, {'foo': i}, (i, i))
+        eq_(self.db.get(3).tags, {'foo': 3})
+        # records after the lookup are merged into the sorted buffer
+        assert self.db.put(3, {'bar': 3}, (3, 3))
+        assert self.db.put(2, {'foo': 2}, (2, 2))
+        eq_(self.db.get(3).tags, {'bar': 3})
+        eq_(self.db.get(2).tags, {'foo': 2})
+        assert self.db.get(6) is None
+        self.db.close()
+        self.db = NodeDB(self.fname, 'r')
+        eq_(self.db.get(3).tags, {'bar': 3})
+        eq_([nd.osm_id for nd in self.db], [1, 2, 3, 4, 5])
+
+    def test_fallback(self):
+        for i in xrange(10, 20):
+            assert self.db.put(i, {'foo': i}, (i, i))
+        eq_(len(self.db), 10) # writes buffered records
+        assert self.db.put(5, {'foo': 5}, (5, 5))
+        assert self.db.put(15, {'bar': 15}, (15, 15))
+        self.db.close()
+        self.db = NodeDB(self.fname, 'r')
+        eq_([nd.osm_id for nd in self.db], [5] + range(10, 20))
+        eq_(self.db.get(15).tags, {'bar': 15})
+
+    def test_put_many(self):
+        eq_(self.db.put_many([(i, {'foo': i}, (i, i)) for i in xrange(10, 20)]), 10)
+        eq_(self.db.put_many([(20, marshal.dumps(({'bar': 20}, (20, 20)), 2))], marshaled=True), 1)
+        eq_(self.db.put_many([]), 0)
+        # buffered records, len() would write them
+        eq_(self.db.get(20).tags, {'bar': 20})
+        eq_(self.db.get(15).tags, {'foo': 15})
+        # falls back to normal puts for the rest of the batch
+        eq_(self.db.put_many([(21, {}, (21, 21)), (5, {}, (5, 5)), (15, {'bar': 15}, (15, 15))]), 3)
+        self.db.close()
+        self.db = NodeDB(self.fname, 'r')
+        eq_([nd.osm_id for nd in self.db], [5] + range(10, 22))
+        eq_(self.db.get(15).tags, {'bar': 15})
+        eq_(self.db.get(20).tags, {'bar': 20})
+        eq_(self.db.get(20).coord, (20, 20))
+
+class TestWayDB(object):
+    def setup(self):
+        fd_, self.fname = tempfile.mkstemp('.db')
+        self.db = WayDB(self.fname)
+
+    def teardown(self):
+        os.unlink(self.fname)
+
+    def test_insert(self):
+        assert self.db.put(1000, {u'highway': u'primary', 'name': u'M\xfcnchen'},
+            [2**40, 12, 13, -5])
+        assert self.db.put_marshaled(1001, marshal.dumps(({u'oneway': u'yes'}, [1, 2]), 2))
+        # partial refs of merged ways are stored as marshal data
+        assert self.db.put(1002, {}, [[1, 2], [4, 5]])
+        self.db.close()
+        self.db = WayDB(self.fname, 'r')
+
+        way = self.db.get(1000)
+        eq_(way.tags, {u'highway': u'primary', 'name': u'M\xfcnchen'})
+        eq_(way.refs, [2**40, 12, 13, -5])
+        eq_(self.db.get(1001).refs, [1, 2])
+        eq_(self.db.get(1002).partial_refs, [[1, 2], [4, 5]])
+        eq_([w.osm_id for w in self.db], [1000, 1001, 1002])
+
+    def test_put_many(self):
+        eq_(self.db.put_many([(1000, {u'highway': u'primary'}, [2**40, 12])]), 1)
+        eq_(self.db.put_many([(1001, marshal.dumps(({u'oneway': u'yes'}, [1, 2]), 2))],
+            marshaled=True), 1)
+        self.db.close()
+        self.db = WayDB(self.fname, 'r')
+        eq_(self.db.get(1000).tags, {u'highway': u'primary'})
+        eq_(self.db.get(1000).refs, [2**40, 12])
+        eq_(self.db.get(1001).refs, [1, 2])
+
+    def test_put_records(self):
+        tag_dict = TagDictionary()
+        tag_dict.add('highway')
+        self.db.close()
+        self.db = WayDB(self.fname, tag_dict=tag_dict)
+        encoder = RecordEncoder('reftags', tag_dict)
+        records = encoder([(1000, {'highway': u'primary'}, [2**40, 12]),
+            (1001, {}, [[1, 2], [4, 5]])])
+        eq_(self.db.put_records(records), 2)
+        self.db.close()
+        self.db = WayDB(self.fname, 'r', tag_dict=tag_dict)
+        eq_(self.db.get(1000).tags, {'highway': u'primary'})
+        eq_(self.db.get(1000).refs, [2**40, 12])
+        # stored as marshal data
+        eq_(self.db.get(1001).partial_refs, [[1, 2], [4, 5]])
+
+    def test_marshaled_records(self):
+        self.db.close()
+        db = BDB(self.fname)
+        db.put(1000, ({'building': 'yes'}, [4, 5, 6]))
+        db.close()
+        self.db = WayDB(self.fname, 'r')
+        way = self.db.get(1000)
+        eq_(way.tags, {'building': 'yes'})
+        eq_(way.refs, [4, 5, 6])
+
+    def test_iter_batches(self):
+        for osmid in range(1, 11):
+            tags = {u'highway': u'primary'} if osmid % 2 else {}
+            assert self.db.put(osmid, tags, [osmid, 1])
+        # marshaled records with and without tags
+        assert self.db.put(11, {}, [[1, 2], [4, 5]])
+        assert self.db.put(12, {'name': 'x'}, [[1, 2], [4, 5]])
+        self.db.close()
+        self.db = WayDB(self.fname, 'r')
+
+        batches = self.db.iter_batches(2)
+        eq_([[w.osm_id for w in batch] for batch in batches],
+            [[1, 3], [5, 7], [9, 12]])
+        eq_(batches.count, 12)
+
+        eq_([len(batch) for batch in self.db.iter_batches(5, tagged_only=False)],
+            [5, 5, 2])
+        # independent of the cursor of __iter__
+        it = iter(self.db)
+        eq_(it.next().osm_id, 1)
+        eq_(len(list(self.db.iter_batches(100))), 1)
+        eq_(it.next().osm_id, 2)
+
+    def test_iter_batches_empty(self):
+        eq_(list(self.db.iter_batches(10)), [])
+
+class TestHashWayDB(object):
+    def setup(self):
+        fd_, self.fname = tempfile.mkstemp('.db')
+        self.db = HashWayDB(self.fname, estimated_records=100)
+
+    def teardown(self):
+        os.unlink(self.fname)
+        if os.path.exists(self.fname + '.ids'):
+            os.unlink(self.fname + '.ids')
+
+    def test_insert(self):
+        for osmid in [30, 2**40, 10, 20]:
+            assert self.db.put(osmid, {u'highway': u'primary'}, [osmid, 1, 2])
+        self.db.close()
+        self.db = HashWayDB(self.fname, 'r')
+        eq_(len(self.db), 4)
+        eq_(self.db.get(20).refs, [20, 1, 2])
+        eq_(self.db.get(20).tags, {u'highway': u'primary'})
+        assert self.db.get(21) is None
+        assert 30 in self.db
+        assert 31 not in self.db
+        # sorted iteration
+        eq_([way.osm_id for way in self.db], [10, 20, 30, 2**40])
+
+    def test_ids_file(self):
+        eq_(self.db.put_many([(30, {}, [1, 2]), (10, {'highway': 'primary'}, [3, 4])]), 2)
+        eq_(self.db.put_many([(20, marshal.dumps(({}, [5, 6]), 2))], marshaled=True), 1)
+        # iterates without ids file while the database is written
+        eq_([way.osm_id for way in self.db], [10, 20, 30])
+        assert not os.path.exists(self.db.ids_filename)
+        self.db.close()
+        eq_(list(IdBitmap(self.fname + '.ids')), [10, 20, 30])
+
+        self.db = HashWayDB(self.fname, 'r')
+        eq_([way.osm_id for way in self.db], [10, 20, 30])
+        eq_(self.db.get(20).refs, [5, 6])
+        self.db.close()
+
+        # outdated by the first put
+        self.db = HashWayDB(self.fname)
+        self.db.put(15, {}, [7])
+        assert not os.path.exists(self.db.ids_filename)
+        self.db.close()
+        eq_(list(IdBitmap(self.fname + '.ids')), [10, 15, 20, 30])
+
+    def test_iter_batches(self):
+        for osmid in range(1, 12):
+            self.db.put(osmid, {'highway': 'primary'} if osmid % 2 else {}, [osmid, 1])
+        self.db.close()
+        self.db = HashWayDB(self.fname, 'r')
+        batches = self.db.iter_batches(3)
+        eq_([[way.osm_id for way in batch] for batch in batches],
+            [[1, 3, 5], [7, 9, 11]])
+        eq_(batches.count, 11)
+        eq_(sum(len(batch) for batch in self.db.iter_batches(4, tagged_only=False)), 11)
+
+    def test_put_read_only(self):
+        self.db.close()
+        self.db = HashWayDB(self.fname, 'r')
+        assert_raises(IOError, self.db.put, 1, {}, [1, 2])
+
+    def test_lz4_detection(self):
+        if 'lz4' not in available_compression_codecs():
+            raise skip.SkipTest('built without lz4')
+        self.db.close()
+        os.unlink(self.fname)
+        self.db = HashWayDB(self.fname, compression='lz4')
+        assert self.db.put(10, {u'highway': u'primary'}, [1, 2])
+        self.db.close()
+        self.db = HashWayDB(self.fname, 'r')
+        eq_(self.db.get(10).refs, [1, 2])
+
+    def test_scan_stats(self):
+        for osmid in [30, 2**40, 10]:
+            assert self.db.put(osmid, {}, [1, 2])
+        stats = self.db.scan_stats(sample_size=10)
+        eq_(stats['records'], 3)
+        eq_((stats['min_id'], stats['max_id']), (10, 2**40))
+        eq_(sorted(stats['sample']), [10, 30, 2**40])
+
+    def test_benchmark(self):
+        results = way_cache_benchmark(num_ways=100, num_gets=100)
+        eq_(sorted(results.keys()), ['btree', 'hash'])
+        for result in results.values():
+            assert result['get_usec'] > 0
+            assert result['disk_bytes'] > 0
+        lines = format_benchmark_results(100, 100, results)
+        eq_(lines[0], '100 ways, 100 random gets')
+        eq_([line.split()[0] for line in lines[1:]], ['btree', 'hash'])
+
+class TestRelationDB(object):
+    def setup(self):
+        fd_, self.fname = tempfile.mkstemp('.db')
+        self.db = RelationDB(self.fname)
+
+    def teardown(self):
+        os.unlink(self.fname)
+
+    def test_insert(self):
+        members = [(12, 'way', u'outer'), (5, 'way', u'inner'), (2**40, 'node', u'')]
+        assert self.db.put(1000, {u'type': u'multipolygon'}, members)
+        self.db.close()
+        self.db = RelationDB(self.fname, 'r')
+        rel = self.db.get(1000)
+        eq_(rel.tags, {u'type': u'multipolygon'})
+        eq_(rel.members, members)
+
 class TestCoordDB(object):
     def setup(self):
         fd_, self.fname = tempfile.mkstemp('.db')
@@ -109,6 +452,688 @@ class TestCoordDB(object):
         
         assert self.db.get(2**40)
         assert self.db.get(2**40+1)
+
+        coords = self.db.get_coords_many([1000, 1001, 2001])
+        eq_(coords.missing, 1)
+        eq_(coords.mask, '\x01\x01\x00')
+        eq_(len(coords.tolist()), 3)
         
         assert not self.db.put(2001, 123, 456)
         assert not self.db.get(2001)
+
+    def test_get_coords_batch(self):
+        for i in xrange(64 * 10):
+            assert self.db.put(i, 1, i / 100.0)
+        self.db.close()
+        self.db = DeltaCoordsDB(self.fname, 'r')
+
+        batch = self.db.get_coords_batch([[1, 600, 2], [600, 1000], [], [1]])
+        eq_(len(batch), 4)
+        eq_(batch[0].missing, 0)
+        assert_almost_equal(batch[0][1][1], 6.0, 6)
+        eq_(batch[1].mask, '\x01\x00')
+        eq_(len(batch[2]), 0)
+        assert_almost_equal(batch[3][0][1], 0.01, 6)
+        # one lookup for each bucket (0, 9 and 15)
+        eq_(self.db.stats()['misses'], 3)
+
+    def test_coord_buffer(self):
+        assert self.db.put(1000, 8.5, 53.5)
+        assert self.db.put(1001, -180.0, -90)
+        coords = self.db.get_coords_many([1001, 2000, 1000])
+        eq_(coords.missing, 1)
+        assert_almost_equal(coords[2][0], 8.5, 6)
+        eq_(coords[1], (0.0, 0.0))
+        # doubles for the array interface are converted once
+        array = coords.__array_interface__
+        eq_(array['shape'], (3, 2))
+        eq_(coords.__array_interface__['data'], array['data'])
+        values = (ctypes.c_double * 6).from_address(array['data'][0])
+        eq_(list(values), [x for coord in coords.tolist() for x in coord])
+
+        # slices and concatenations are CoordBuffers
+        eq_(coords[::-1].tolist(), coords.tolist()[::-1])
+        eq_(coords[2:].missing, 0)
+        merged = coords[:2] + coords[::2]
+        eq_(merged.tolist(), coords.tolist()[:2] + coords.tolist()[::2])
+        eq_(merged.missing, 1)
+        eq_(merged.__array_interface__['shape'], (4, 2))
+
+    def test_put_many(self):
+        self.db.close()
+        # a full bucket needs 1120 bytes
+        self.db = DeltaCoordsDB(self.fname, cache_size=1200)
+        eq_(self.db.put_many([(i, 1, i / 100.0) for i in xrange(64 * 10)]), 64 * 10)
+        # one lookup for each bucket
+        eq_(self.db.stats()['misses'], 10)
+        eq_(self.db.stats()['hits'], 0)
+        self.db.close()
+        self.db = DeltaCoordsDB(self.fname, 'r')
+        assert_almost_equal(self.db.get(600)[1], 6.0, 6)
+        eq_(self.db.get_coords_many(range(64 * 10)).missing, 0)
+        eq_(self.db.put_many([(2001, 1, 1)]), 0)
+
+    def test_put_many_coord_db(self):
+        self.db.close()
+        self.db = CoordDB(self.fname, bulk=True)
+        eq_(self.db.put_many([(1000, 123, 0), (1001, -180.0, -90), (5, 180, 90)]), 3)
+        self.db.close()
+        self.db = CoordDB(self.fname, 'r')
+        eq_(len(self.db), 3)
+        pos = self.db.get(1001)
+        assert_almost_equal(pos[0], -180.0, 6)
+        assert_almost_equal(pos[1], -90.0, 6)
+        assert_almost_equal(self.db.get(5)[1], 90.0, 6)
+
+    def test_cache_stats(self):
+        self.db.close()
+        # a full bucket needs 1120 bytes
+        self.db = DeltaCoordsDB(self.fname, cache_size=1200)
+        for i in xrange(64 * 10):
+            assert self.db.put(i, 1, 1)
+
+        # only the current bucket fits in the cache
+        stats = self.db.stats()
+        eq_(stats['misses'], 10)
+        eq_(stats['evictions'], 9)
+
+        self.db.close()
+        self.db = DeltaCoordsDB(self.fname, 'r')
+        for i in xrange(64 * 10):
+            assert self.db.get(i)
+        eq_(self.db.stats()['misses'], 10)
+        eq_(self.db.stats()['hits'], 64 * 10 - 10)
+        eq_(self.db.stats()['evictions'], 0)
+
+    def test_scan_stats(self):
+        # 32 nodes in bucket 0, 1 node in bucket 2
+        for i in xrange(0, 64, 2):
+            assert self.db.put(i, 1, 1)
+        assert self.db.put(130, 1, 1)
+        self.db.close()
+        self.db = DeltaCoordsDB(self.fname, 'r')
+
+        stats = self.db.scan_stats(sample_size=5)
+        eq_(stats['records'], 33)
+        eq_(stats['buckets'], 2)
+        assert_almost_equal(stats['bucket_fill'], 33 / 128.0, 6)
+        eq_((stats['min_id'], stats['max_id']), (0, 130))
+        eq_(len(stats['sample']), 2)
+        for osmid in stats['sample']:
+            assert self.db.get(osmid)
+
+class TestDeltaNodes(object):
+    def test_serialize(self):
+        nodes = DeltaNodes()
+        nodes.add(2**40 + 5, 10.0, 53.5)
+        nodes.add(2**40 + 1, -180.0, -90.0)
+        nodes.add(2**40 + 63, 180.0, 90.0)
+
+        # serialized as protobuf DeltaCoords message
+        data = nodes.serialize()
+        eq_(data[0], '\x0a')
+
+        nodes = DeltaNodes(data)
+        pos = nodes.get(2**40 + 1)
+        assert_almost_equal(pos[0], -180.0, 6)
+        assert_almost_equal(pos[1], -90.0, 6)
+        pos = nodes.get(2**40 + 63)
+        assert_almost_equal(pos[0], 180.0, 6)
+        assert_almost_equal(pos[1], 90.0, 6)
+        assert nodes.get(2**40 + 2) is None
+
+    def test_add_unsorted(self):
+        nodes = DeltaNodes()
+        for i in [10, 5, 20, 7, 5]:
+            nodes.add(i, i, i)
+        eq_(len(nodes), 4)
+        for i in [5, 7, 10, 20]:
+            assert_almost_equal(nodes.get(i)[0], i, 6)
+        assert nodes.get(6) is None
+
+        nodes = DeltaNodes(nodes.serialize())
+        eq_(len(nodes), 4)
+        assert_almost_equal(nodes.get(7)[1], 7, 6)
+
+    def test_invalid(self):
+        try:
+            DeltaNodes('\x0a\xff')
+        except ValueError:
+            pass
+        else:
+            assert False, 'expected ValueError'
+
+class TestFlatCoordsDB(object):
+    def setup(self):
+        fd_, self.fname = tempfile.mkstemp('.db')
+        self.db = FlatCoordsDB(self.fname)
+
+    def teardown(self):
+        self.db.close()
+        os.unlink(self.fname)
+
+    def test_insert(self):
+        assert self.db.put(1000, 123, 79.123456789)
+        assert self.db.put(2**30, 123, 79.123456789)
+
+        pos = self.db.get(1000)
+        assert_almost_equal(pos[0], 123.0, 6)
+        assert_almost_equal(pos[1], 79.123456789, 6)
+
+        assert self.db.get(2**30)
+        assert not self.db.get(999)
+        assert not self.db.get(2**40)
+
+    def test_read_only(self):
+        assert self.db.put(1000, 123, 0)
+        assert self.db.put(1001, -180.0, -90)
+        assert self.db.put(1010, 180, 90)
+
+        self.db.close()
+        self.db = FlatCoordsDB(self.fname, 'r')
+
+        pos = self.db.get(1001)
+        assert_almost_equal(pos[0], -180.0, 6)
+        assert_almost_equal(pos[1], -90.0, 6)
+
+        eq_(len(self.db.get_coords([1000, 1001, 1010])), 3)
+        assert self.db.get_coords([1000, 1002]) is None
+
+        coords = self.db.get_coords_many([1000, 1002, 1010])
+        eq_(len(coords), 3)
+        eq_(coords.missing, 1)
+        eq_(coords.mask, '\x01\x00\x01')
+        assert_almost_equal(coords[-1][0], 180.0, 6)
+        eq_(coords.__array_interface__['shape'], (3, 2))
+
+        assert not self.db.put(2001, 123, 45)
+        assert not self.db.get(2001)
+
+    def test_scan_stats(self):
+        for osmid in [1000, 5, 2**20]:
+            assert self.db.put(osmid, 1, 1)
+        stats = self.db.scan_stats(sample_size=5)
+        eq_(stats['records'], 3)
+        eq_((stats['min_id'], stats['max_id']), (5, 2**20))
+        eq_(sorted(stats['sample']), [5, 1000, 2**20])
+
+class TestSortedCoordsDB(object):
+    def setup(self):
+        fd_, self.fname = tempfile.mkstemp('.db')
+        self.db = SortedCoordsDB(self.fname)
+
+    def teardown(self):
+        self.db.close()
+        os.unlink(self.fname)
+
+    def test_read_only(self):
+        for i in xrange(1000):
+            assert self.db.put(i * 7, i / 10.0, -i / 20.0)
+        assert self.db.put(2**40, 123, 79.123456789)
+        self.db.close()
+        self.db = SortedCoordsDB(self.fname, 'r')
+
+        eq_(len(self.db), 1001)
+        pos = self.db.get(7 * 999)
+        assert_almost_equal(pos[0], 99.9, 6)
+        assert_almost_equal(pos[1], -49.95, 6)
+        assert self.db.get(2**40)
+        assert not self.db.get(8)
+        assert not self.db.get(2**41)
+
+        eq_(len(self.db.get_coords([0, 7, 14])), 3)
+        assert self.db.get_coords([0, 8]) is None
+
+        assert not self.db.put(2001, 123, 45)
+
+    def test_unsorted(self):
+        assert self.db.put(1000, 1, 1)
+        assert self.db.put(10, 2, 2)
+        assert self.db.put(1000, 3, 3)
+        self.db.close()
+        self.db = SortedCoordsDB(self.fname, 'r')
+
+        eq_(len(self.db), 2)
+        assert_almost_equal(self.db.get(10)[0], 2.0, 6)
+        assert_almost_equal(self.db.get(1000)[0], 3.0, 6)
+
+    def test_merge(self):
+        assert self.db.put(10, 1, 1)
+        assert self.db.put(20, 2, 2)
+        self.db.close()
+        self.db = SortedCoordsDB(self.fname)
+        assert self.db.put(15, 3, 3)
+        self.db.close()
+        self.db = SortedCoordsDB(self.fname, 'r')
+
+        eq_(len(self.db), 3)
+        assert_almost_equal(self.db.get(15)[0], 3.0, 6)
+        assert_almost_equal(self.db.get(20)[0], 2.0, 6)
+
+    def test_scan_stats(self):
+        for osmid in [1000, 5, 2**20]:
+            assert self.db.put(osmid, 1, 1)
+        self.db.close()
+        self.db = SortedCoordsDB(self.fname, 'r')
+        stats = self.db.scan_stats(sample_size=2)
+        eq_(stats['records'], 3)
+        eq_(stats['data_bytes'], 3 * 16)
+        eq_((stats['min_id'], stats['max_id']), (5, 2**20))
+        eq_(len(stats['sample']), 2)
+
+class TestIdBitmap(object):
+    def setup(self):
+        fd_, self.fname = tempfile.mkstemp('.cache')
+        os.unlink(self.fname)
+
+    def teardown(self):
+        if os.path.exists(self.fname):
+            os.unlink(self.fname)
+
+    def test_sparse_and_dense(self):
+        ids = [2**40, 5, -3, 70000, 5] + range(200000, 210000, 2)
+        builder = IdBitmapBuilder()
+        builder.update(ids)
+        eq_(len(builder), len(set(ids)))
+        builder.write(self.fname)
+
+        bitmap = IdBitmap(self.fname)
+        eq_(len(bitmap), len(set(ids)))
+        eq_(list(bitmap), sorted(set(ids)))
+        for osmid in ids:
+            assert osmid in bitmap
+        for osmid in [4, 6, -2, 2**40 + 1, 200001, 210000]:
+            assert osmid not in bitmap
+        bitmap.close()
+
+    def test_missing_file(self):
+        bitmap = IdBitmap(self.fname)
+        eq_(len(bitmap), 0)
+        assert 1 not in bitmap
+        eq_(list(bitmap), [])
+
+    def test_duplicates(self):
+        builder = IdBitmapBuilder()
+        for i in range(100000):
+            builder.add(i % 1000)
+        eq_(builder.tolist(), range(1000))
+
+    def test_many_ids(self):
+        builder = IdBitmapBuilder()
+        # more ids than the buffer of the builder, in dense and sparse chunks
+        builder.update(xrange(3000000, 0, -2))
+        builder.update(xrange(2**40, 2**40 + 10**8, 10**5))
+        eq_(len(builder), 1500000 + 1000)
+        builder.write(self.fname)
+        bitmap = IdBitmap(self.fname)
+        eq_(len(bitmap), 1500000 + 1000)
+        assert 2 in bitmap and 3 not in bitmap
+        assert 2**40 + 10**5 in bitmap and 2**40 + 1 not in bitmap
+        bitmap.close()
+
+    def test_filter(self):
+        builder = IdBitmapBuilder()
+        builder.update([1, 3, 2**40])
+        builder.write(self.fname)
+        bitmap = IdBitmap(self.fname)
+        eq_(bitmap.filter([(1, 8.0, 53.0), (2, 8.0, 53.0), (2**40, 9.0, 54.0)]),
+            [(1, 8.0, 53.0), (2**40, 9.0, 54.0)])
+        bitmap.close()
+
+class TestOSMCacheInsertedWays(TempDirTestBase):
+
+    def test_merge(self):
+        cache = OSMCache(self.dir)
+        for ids in [[1, 3], [2, 3]]:
+            builder = IdBitmapBuilder()
+            builder.update(ids)
+            builder.write(cache.inserted_ways_fname + '.%d' % ids[0])
+
+        eq_(list(cache.inserted_ways_bitmap()), [])
+        # file of a process is missing
+        assert_raises(IOError, cache.merge_inserted_ways, processes=3)
+        cache.merge_inserted_ways(processes=2)
+        eq_(list(cache.inserted_ways_bitmap()), [1, 2, 3])
+        eq_(os.listdir(self.dir), [os.path.basename(cache.inserted_ways_fname)])
+
+        cache.remove_inserted_way_cache()
+        eq_(os.listdir(self.dir), [])
+
+class TestShardedCache(TempDirTestBase):
+
+    def test_shard_of(self):
+        eq_([shard_of(osmid, 3) for osmid in [0, 2**16 - 1, 2**16, 2**17, 2**17 + 2**16]],
+            [0, 0, 1, 2, 0])
+        assert 0 <= shard_of(-1, 3) < 3
+
+    def test_coords(self):
+        cache = OSMCache(self.dir, coords_type='sorted', coords_shards=3)
+        ids = [1, 2**16 + 1, 2**17 + 1, 2**17 + 2]
+        for shard in range(3):
+            coords = cache.coords_cache(mode='w', shard=shard)
+            for osmid in ids:
+                if shard_of(osmid, 3) == shard:
+                    coords.put(osmid, osmid % 100, 50)
+        cache.close_all()
+        eq_(len(os.listdir(self.dir)), 3)
+
+        coords = cache.coords_cache(mode='r')
+        assert isinstance(coords, ShardedCoordsDB)
+        eq_(len(coords), 4)
+        assert_almost_equal(coords.get(2**17 + 2)[0], 74, 6)
+
+        buf1, buf2 = coords.get_coords_batch([[1, 2**16 + 1, 2**17 + 2, 5], [2**17 + 1]])
+        eq_(buf1.missing, 1)
+        eq_(buf1.mask, '\x01\x01\x01\x00')
+        assert_almost_equal(buf1[1][0], 37, 6)
+        assert_almost_equal(buf1[2][0], 74, 6)
+        eq_(buf2.missing, 0)
+        assert coords.get_coords([1, 5]) is None
+        cache.close_all()
+
+    def test_ways(self):
+        cache = OSMCache(self.dir, ways_shards=2)
+        for shard in range(2):
+            ways = cache.ways_cache(mode='w', shard=shard)
+            for osmid in [2**16 + 5, 3, 2**16]:
+                if shard_of(osmid, 2) == shard:
+                    ways.put(osmid, {'highway': 'primary'}, [1, 2])
+        cache.close_all()
+
+        ways = cache.ways_cache(mode='r')
+        assert isinstance(ways, ShardedDB)
+        eq_([way.osm_id for way in ways], [3, 2**16, 2**16 + 5])
+        eq_(ways.get(2**16).refs, [1, 2])
+        assert 3 in ways
+        assert 4 not in ways
+        cache.close_all()
+
+class TestWayCoordsDB(TempDirTestBase):
+    def setup(self):
+        TempDirTestBase.setup(self)
+        self.coords = SortedCoordsDB(os.path.join(self.dir, 'coords.cache'))
+        for osmid in range(1, 20):
+            if osmid != 13:
+                self.coords.put(osmid, osmid * 0.123456789, 53 + osmid / 7.0)
+        self.coords.close()
+        self.coords = SortedCoordsDB(os.path.join(self.dir, 'coords.cache'), 'r')
+        self.ways = WayDB(os.path.join(self.dir, 'ways.cache'))
+        self.ways.put(1, {}, [5, 3, 7, 5])
+        self.ways.put(2, {'highway': 'primary'}, [7, 8])
+        self.ways.put(3, {}, [12, 13]) # missing coord
+        self.ways.put(5, {}, [9, 2, 19, 1])
+        self.db = WayCoordsDB(os.path.join(self.dir, 'way_coords.cache'))
+
+    def test_put_get(self):
+        coords = self.coords.get_coords_many([1, 2, 3])
+        assert self.db.put(10, coords)
+        assert self.db.put(11, [])
+        # stored as fixed-point values without loss
+        eq_(self.db.get(10).tolist(), coords.tolist())
+        assert self.db.put(12, coords.tolist())
+        eq_(self.db.get(12).tolist(), coords.tolist())
+        eq_(len(self.db.get(11)), 0)
+        assert self.db.get(13) is None
+
+    def test_denormalize(self):
+        # small chunks to resolve the ways in multiple chunks
+        eq_(denormalize_way_coords(self.ways, self.coords, self.db, chunk_refs=5),
+            (3, 1))
+        for osmid in (1, 2, 5):
+            eq_(self.db.get(osmid).tolist(),
+                self.coords.get_coords_many(self.ways.get(osmid).refs).tolist())
+        assert self.db.get(3) is None
+
+        ways = [self.ways.get(osmid) for osmid in (5, 3, 1)]
+        coords_batch = self.db.get_ways_coords(ways, self.coords)
+        eq_([len(coords) for coords in coords_batch], [4, 2, 4])
+        # resolved with the coords cache
+        eq_(coords_batch[1].missing, 1)
+
+    def test_denormalize_coords_caches(self):
+        delta = DeltaCoordsDB(os.path.join(self.dir, 'delta.cache'))
+        flat = FlatCoordsDB(os.path.join(self.dir, 'flat.cache'))
+        shards = [CoordDB(os.path.join(self.dir, 'coords-%d.cache' % s)) for s in range(2)]
+        for osmid in range(1, 20):
+            coord = self.coords.get(osmid)
+            if coord is not None:
+                for coords in (delta, flat, shards[shard_of(osmid, 2)]):
+                    coords.put(osmid, *coord)
+        for name, coords in [('delta', delta), ('flat', flat), ('sharded', ShardedCoordsDB(shards))]:
+            db = WayCoordsDB(os.path.join(self.dir, 'way_coords_%s.cache' % name))
+            eq_(denormalize_way_coords(self.ways, coords, db, chunk_refs=5), (3, 1))
+            for osmid in (1, 2, 5):
+                eq_(db.get(osmid).tolist(),
+                    coords.get_coords_many(self.ways.get(osmid).refs).tolist())
+            db.close()
+
+    def test_osm_cache(self):
+        cache = OSMCache(self.dir, coords_type='sorted')
+        assert cache.way_coords_cache() is None
+        coords = cache.coords_cache(mode='w')
+        coords.put(1, 8.0, 53.0)
+        coords.put(2, 9.0, 54.0)
+        cache.ways_cache(mode='w').put(100, {}, [1, 2])
+        cache.close_all()
+
+        eq_(cache.denormalize_way_coords(), (1, 0))
+        eq_(cache.way_coords_cache().get(100).tolist(),
+            cache.coords_cache().get_coords_many([1, 2]).tolist())
+        cache.remove_way_coords()
+        assert cache.way_coords_cache() is None
+        cache.close_all()
+
+class TestPrefetch(TempDirTestBase):
+    def setup(self):
+        TempDirTestBase.setup(self)
+        self.fname = os.path.join(self.dir, 'prefetch.cache')
+        open(self.fname, 'wb').write('x' * 100000)
+
+    def test_prefetch(self):
+        eq_(prefetch_file(self.fname, 4096), 4096)
+        eq_(prefetch_file(self.fname), 100000)
+        # just read, pages are cached by the OS
+        eq_(resident_bytes(self.fname), 100000)
+
+    def test_prefetch_sparse(self):
+        f = open(self.fname, 'r+b')
+        f.seek(64 * 1024 * 1024)
+        f.write('x' * 100000)
+        f.close()
+        # the hole is only skipped if the file system supports SEEK_DATA
+        assert 200000 <= prefetch_file(self.fname) <= 64 * 1024 * 1024 + 100000
+        eq_(prefetch_file(self.fname, 4096), 4096)
+
+    def test_warmup_fnames(self):
+        cache = OSMCache(self.dir, suffix='imposm_warmup_', coords_shards=2)
+        eq_(cache.warmup_fnames(), [])
+        fname = cache.shard_fnames(cache.coords_fname, 2)[1]
+        open(fname, 'w').close()
+        eq_(cache.warmup_fnames(), [fname])
+        open(cache.way_coords_fname, 'w').close()
+        eq_(cache.warmup_fnames(), [cache.way_coords_fname, fname])
+
+class TestOSMCacheManifest(TempDirTestBase):
+    def setup(self):
+        TempDirTestBase.setup(self)
+        self.input = os.path.join(self.dir, 'input.osm.pbf')
+        open(self.input, 'wb').write('x' * 1000)
+        self.cache = OSMCache(self.dir)
+        for fname in [self.cache.coords_fname, self.cache.ways_fname]:
+            open(fname, 'wb').write('data')
+
+    def test_matches(self):
+        inputs = [file_fingerprint(self.input)]
+        assert not self.cache.manifest_matches(inputs, 'sig')
+        self.cache.write_manifest(inputs, 'sig', {'coords': 100, 'ways': 10})
+        assert self.cache.manifest_matches(inputs, 'sig')
+        assert not self.cache.manifest_matches(inputs, 'other mapping')
+        assert not OSMCache(self.dir, coords_type='sorted').manifest_matches(inputs, 'sig')
+        assert not OSMCache(self.dir, tuning={'ways': {'compression': 'tcbs'}}
+            ).manifest_matches(inputs, 'sig')
+
+        open(self.input, 'ab').write('x')
+        assert not self.cache.manifest_matches([file_fingerprint(self.input)], 'sig')
+
+    def test_modified_cache(self):
+        inputs = [file_fingerprint(self.input)]
+        self.cache.write_manifest(inputs, 'sig', {'coords': 100})
+        os.unlink(self.cache.ways_fname)
+        assert not self.cache.manifest_matches(inputs, 'sig')
+
+    def test_estimates(self):
+        eq_(self.cache.manifest_estimates([file_fingerprint(self.input)]), None)
+        self.cache.write_manifest([file_fingerprint(self.input)], 'sig',
+            {'coords': 100, 'ways': 10})
+        inputs = [{'size': 2000}]
+        eq_(self.cache.manifest_estimates(inputs), {'coords': 200, 'ways': 20})
+
+    def test_merge(self):
+        first = [file_fingerprint(self.input)]
+        self.cache.write_manifest(first, 'sig', {'coords': 100})
+        previous = self.cache.read_manifest()
+        second = [dict(first[0], filename='second.osm.pbf')]
+        self.cache.write_manifest(second, 'sig', {'coords': 50}, merge=True, previous=previous)
+        manifest = self.cache.read_manifest()
+        eq_(manifest['records'], {'coords': 150})
+        assert self.cache.manifest_matches(first + second, 'sig')
+        # the merged records were not written in key order
+        assert_almost_equal(self.cache.fragmentation()['coords'], 1 / 3.0)
+
+        # merged caches with another mapping get no manifest
+        self.cache.remove_manifest()
+        self.cache.write_manifest(second, 'other', {'coords': 50}, merge=True, previous=previous)
+        eq_(self.cache.read_manifest(), None)
+
+    def test_merge_without_manifest(self):
+        # the existing caches have unknown contents
+        inputs = [file_fingerprint(self.input)]
+        self.cache.write_manifest(inputs, 'sig', {'coords': 50}, merge=True, previous=None)
+        eq_(self.cache.read_manifest(), None)
+        assert not self.cache.manifest_matches(inputs, 'sig')
+
+class TestCompactCache(TempDirTestBase):
+
+    def test_compact(self):
+        cache = OSMCache(self.dir, ways_shards=2)
+        ways = cache.ways_cache(mode='w')
+        for osmid in range(20000, 0, -3):
+            ways.put(osmid, {'highway': 'primary'}, [osmid, osmid + 1])
+        cache.close_all()
+        cache.write_manifest([], 'sig', {'ways': 1000})
+        cache.write_manifest([], 'sig', {'ways': 6000}, merge=True,
+            previous=cache.read_manifest())
+        assert cache.fragmentation()['ways'] > 0.8
+
+        results = cache.compact(['ways', 'relations'])
+        eq_([os.path.basename(fname) for fname, before, after in results],
+            ['imposm_ways-1of2.cache', 'imposm_ways-2of2.cache'])
+        eq_(cache.fragmentation(), {'ways': 0.0})
+        ways = cache.ways_cache(mode='r')
+        eq_(len(ways), 6667)
+        eq_(ways.get(20000).refs, [20000, 20001])
+        eq_([way.osm_id for way in ways][:2], [2, 5])
+        cache.close_all()
+
+    def test_skip_flat_coords(self):
+        cache = OSMCache(self.dir, coords_type='flat')
+        cache.coords_cache(mode='w').put(1, 8.0, 53.0)
+        cache.close_all()
+        eq_(cache.compact(), [])
+
+class TestOSMCacheMemory(TempDirTestBase):
+    def test_no_budget(self):
+        cache = OSMCache(self.dir)
+        eq_(cache.memory_options('ways', 'r'), {})
+
+    def test_split(self):
+        mb = 1024 * 1024
+        cache = OSMCache(self.dir, cache_memory=1000 * mb, processes=4)
+        coords = cache.memory_options('coords', 'r')
+        eq_(coords['xmsiz'], 275 * mb)
+        # split across the importer processes and the main process
+        eq_(coords['cache_size'], 275 * mb // 5)
+        # the writer is the only process of the cache
+        eq_(cache.memory_options('coords', 'w')['cache_size'], 275 * mb)
+
+        ways = cache.memory_options('ways', 'r')
+        eq_(ways['xmsiz'], 150 * mb)
+        assert ways['lcnum'] > 1024, ways
+        nodes = cache.memory_options('nodes', 'r')
+        assert nodes['lcnum'] > ways['lcnum'] // 5, nodes
+
+    def test_shards(self):
+        mb = 1024 * 1024
+        cache = OSMCache(self.dir, cache_memory=1000 * mb, coords_shards=2)
+        # each shard gets its part of the budget
+        eq_(cache.memory_options('coords', 'r')['xmsiz'], 275 * mb // 2)
+
+    def test_other_coords_caches(self):
+        mb = 1024 * 1024
+        cache = OSMCache(self.dir, coords_type='flat', cache_memory=1000 * mb)
+        eq_(cache.memory_options('coords', 'r'), {})
+        # the other caches get the share of the coords cache
+        eq_(cache.memory_options('ways', 'r')['xmsiz'], int(1000 * mb * 0.3 / 0.45) // 2)
+        eq_(cache.memory_options('relations', 'r')['xmsiz'], int(1000 * mb * 0.05 / 0.45) // 2)
+
+class CacheBackendTestBase(TempDirTestBase):
+    """
+    Same assertions for the caches of all backends.
+    """
+    backend = None
+
+    def test_coords(self):
+        cache = OSMCache(self.dir, backend=self.backend)
+        coords = cache.coords_cache(mode='w')
+        for osmid in [3, 1, 2**40]:
+            coords.put(osmid, osmid % 100, 50)
+        cache.close_all()
+
+        coords = cache.coords_cache(mode='r')
+        assert_almost_equal(coords.get(3)[0], 3, 6)
+        assert coords.get(2) is None
+        assert coords.get_coords([1, 2]) is None
+        eq_(len(coords.get_coords([3, 1])), 2)
+
+        buf = coords.get_coords_many([1, 2, 2**40])
+        eq_(len(buf), 3)
+        eq_(buf.missing, 1)
+        eq_(buf.mask, '\x01\x00\x01')
+        eq_(buf[1], (0.0, 0.0))
+        eq_(buf.tolist()[1], (0.0, 0.0))
+        assert_almost_equal(buf[2][0], 2**40 % 100, 6)
+        eq_(buf[1:].missing, 1)
+        eq_(buf[::-1].mask, '\x01\x00\x01')
+        joined = buf[:1] + buf[2:]
+        eq_(joined.missing, 0)
+        eq_(len(joined), 2)
+
+        buf1, buf2 = coords.get_coords_batch([[3, 1], [4]])
+        eq_((buf1.missing, buf2.missing), (0, 1))
+        cache.close_all()
+
+    def test_ways(self):
+        cache = OSMCache(self.dir, backend=self.backend)
+        ways = cache.ways_cache(mode='w')
+        ways.put(20, {'highway': 'primary'}, [1, 2, 3])
+        ways.put(2**40, {}, [4, 5])
+        ways.put(10, {}, [6])
+        ways.put(20, {'highway': 'secondary'}, [1, 2])
+        cache.close_all()
+
+        ways = cache.ways_cache(mode='r')
+        eq_(ways.get(20).tags, {'highway': 'secondary'})
+        eq_(ways.get(20).refs, [1, 2])
+        eq_(ways.get(2**40).refs, [4, 5])
+        assert ways.get(30) is None
+        assert 10 in ways
+        assert 30 not in ways
+        eq_(len(ways), 3)
+        eq_([way.osm_id for way in ways], [10, 20, 2**40])
+        cache.close_all()
+
+class TestTCCacheBackend(CacheBackendTestBase):
+    backend = 'tc'
+
+class TestMemoryCacheBackend(CacheBackendTestBase):
+    backend = 'memory'
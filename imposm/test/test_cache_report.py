@@ -0,0 +1,56 @@
+# Copyright 2011 Omniscale (http://omniscale.com)
+# 
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+# 
+#     http://www.apache.org/licenses/LICENSE-2.0
+# 
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import shutil
+import tempfile
+
+from imposm.cache import OSMCache
+from imposm.cache.report import cache_file_stats, format_file_stats
+
+from nose.tools import eq_
+
+class TestCacheFileStats(object):
+    def setup(self):
+        self.dir = tempfile.mkdtemp()
+
+    def teardown(self):
+        shutil.rmtree(self.dir)
+
+    def test_stats(self):
+        cache = OSMCache(self.dir, coords_shards=2)
+        for shard in range(2):
+            coords = cache.coords_cache(mode='w', shard=shard)
+            for i in xrange(shard * 2**16, shard * 2**16 + 100):
+                coords.put(i, 10, 50)
+        ways = cache.ways_cache(mode='w')
+        ways.put(1, {'highway': 'primary'}, [1, 2])
+        cache.close_all()
+
+        result = cache_file_stats(cache, sample_size=10)
+        eq_([os.path.basename(fname) for fname, stats in result],
+            ['imposm_coords-1of2.cache', 'imposm_coords-2of2.cache',
+             'imposm_ways.cache'])
+
+        fname, stats = result[1]
+        eq_(stats['records'], 100)
+        eq_((stats['min_id'], stats['max_id']), (2**16, 2**16 + 99))
+        eq_(stats['buckets'], 2)
+        assert stats['disk_bytes'] > 0
+        assert stats['read_usec'] >= 0
+        eq_(len(format_file_stats(fname, stats)), 4)
+
+        fname, stats = result[2]
+        eq_(stats['records'], 1)
+        eq_(len(format_file_stats(fname, stats)), 3)
@@ -0,0 +1,94 @@
+# Copyright 2011 Omniscale (http://omniscale.com)
+# 
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+# 
+#     http://www.apache.org/licenses/LICENSE-2.0
+# 
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import marshal
+
+from imposm.cache import OSMCache
+from imposm.cache.memory import CoordsCache, WaysCache
+from imposm.reader import ImposmReader
+from imposm.test import TempDirTestBase
+
+from nose.tools import eq_, assert_almost_equal
+
+
+class TestCoordsCache(object):
+    def setup(self):
+        self.cache = CoordsCache()
+
+    def test_unsorted(self):
+        for osmid in [5, 1, 3, 1]:
+            assert self.cache.put(osmid, osmid, 50)
+        self.cache.close()
+        eq_(len(self.cache), 3)
+        eq_([osmid for osmid, coord in self.cache], [1, 3, 5])
+        assert_almost_equal(self.cache.get(3)[0], 3, 6)
+        assert self.cache.get(2) is None
+        assert 5 in self.cache
+
+    def test_get_coords(self):
+        for osmid in range(10):
+            self.cache.put(osmid, osmid, osmid)
+        eq_(len(self.cache.get_coords([1, 2, 3])), 3)
+        assert self.cache.get_coords([1, 20]) is None
+
+        coords1, coords2 = self.cache.get_coords_batch([[1, 2], [3, 20, 4]])
+        eq_(coords1.missing, 0)
+        eq_(coords2.missing, 1)
+        eq_(coords2.tolist()[1], (0.0, 0.0))
+        assert_almost_equal(coords2.tolist()[2][1], 4, 6)
+
+class TestWaysCache(object):
+    def test_put(self):
+        cache = WaysCache()
+        assert cache.put(20, {'highway': 'primary'}, [1, 2, 3])
+        assert cache.put_marshaled(10, marshal.dumps(({}, [4, 5]), 2))
+        eq_(cache.get(20).refs, [1, 2, 3])
+        eq_(cache.get(20).tags, {'highway': 'primary'})
+        assert cache.get(30) is None
+        eq_([way.osm_id for way in cache], [10, 20])
+        eq_(len(cache), 2)
+
+    def test_put_many(self):
+        cache = WaysCache()
+        eq_(cache.put_many([(20, {'highway': 'primary'}, [1, 2, 3])]), 1)
+        eq_(cache.put_many([(10, marshal.dumps(({}, [4, 5]), 2))], marshaled=True), 1)
+        eq_(cache.get(20).refs, [1, 2, 3])
+        eq_(cache.get(10).refs, [4, 5])
+
+class TestOSMCacheMemoryBackend(TempDirTestBase):
+    def test_reopen(self):
+        cache = OSMCache(self.dir, backend='memory')
+        coords = cache.coords_cache(mode='w')
+        coords.put(1, 8, 53)
+        cache.close_all()
+        assert cache.coords_cache(mode='r').get(1)
+
+
+class TestTwoPassRead(TempDirTestBase):
+    def test_referenced_nodes(self):
+        cache = OSMCache(self.dir, backend='memory')
+        cache.ways_cache(mode='w').put(1, {'highway': 'primary'}, [1, 2])
+        untagged = cache.untagged_ways_cache(mode='w')
+        untagged.put(2, {}, [2, 3, 4])
+        untagged.put(3, {}, [5, 6])
+        cache.relations_cache(mode='w').put(10, {'type': 'multipolygon'},
+            [(2, 'way', 'outer'), (7, 'node', ''), (3, 'relation', '')])
+        cache.close_all()
+
+        reader = ImposmReader(None, cache, two_pass=True)
+        eq_(reader._referenced_nodes().tolist(), [1, 2, 3, 4])
+        # untagged way of the relation was moved
+        eq_([way.osm_id for way in cache.ways_cache()], [1, 2])
+        eq_(reader.records['ways'], 1)
+        eq_(len(cache.untagged_ways_cache()), 0)
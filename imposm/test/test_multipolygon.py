@@ -12,7 +12,11 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import os
+import tempfile
+
 from imposm.base import Relation, Way
+from imposm.cache.tc import CoordDB, CoordBuffer
 from imposm.multipolygon import UnionRelationBuilder, ContainsRelationBuilder, Ring, merge_rings
 
 from nose.tools import eq_, assert_almost_equal
@@ -257,7 +261,31 @@ class RelationBuilderTestBase(object):
         
         eq_(w1.inserted, False) # also highway=secondary
         eq_(w2.inserted, False)
-    
+
+    def test_coords_cache(self):
+        fd_, fname = tempfile.mkstemp('.db')
+        os.close(fd_)
+        coords_cache = CoordDB(fname)
+        try:
+            for ref, x, y in [(1, 0, 0), (2, 10, 0), (3, 10, 10), (4, 0, 10)]:
+                coords_cache.put(ref, x, y)
+            w1 = Way(1, {}, [1, 2, 3])
+            w2 = Way(2, {}, [3, 4, 1])
+            r = Relation(1, {}, [(1, 'way', 'outer'), (2, 'way', 'outer')])
+            builder = self.relation_builder(r, None, coords_cache)
+            w1.coords, w2.coords = builder.fetch_ways_coords([w1, w2])
+            rings = builder.build_rings([w1, w2])
+            eq_(len(rings), 1)
+            # merged without converting the coords
+            assert isinstance(rings[0].coords, CoordBuffer)
+            eq_(len(rings[0].coords), 5)
+
+            builder.build_relation_geometry(rings)
+            assert_almost_equal(r.geom.area, 100, 4)
+        finally:
+            coords_cache.close()
+            os.unlink(fname)
+
 class TestUnionRelationBuilder(RelationBuilderTestBase):
     relation_builder = UnionRelationBuilder
 
@@ -129,6 +129,17 @@ class TestTagMapper(object):
         eq_mapping(for_relations({'boundary': 'administrative', 'admin_level': '8'}),
             [(('boundary', 'administrative'), ('admin',))])
 
+    def test_tag_strings(self):
+        strings = self.tag_mapping.tag_strings()
+        for s in ['name', 'highway', 'bus_stop', 'landuse', 'park', 'multipolygon']:
+            assert s in strings, s
+        assert '__any__' not in strings
+
+    def test_tag_filter_signature(self):
+        signature = self.tag_mapping.tag_filter_signature()
+        eq_(TagMapper(self.tag_mapping.mappings).tag_filter_signature(), signature)
+        assert TagMapper(self.tag_mapping.mappings[1:]).tag_filter_signature() != signature
+
 
 
 
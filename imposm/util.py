@@ -15,6 +15,7 @@
 import os
 import sys
 import time
+import hashlib
 import datetime
 import mmap
 import multiprocessing
@@ -234,4 +235,38 @@ def estimate_records(files):
         records += fsize/200
     
     return int(records)
+
+def available_memory():
+    """
+    Return the available memory in bytes, including the reclaimable
+    page cache. Returns None if it is unknown.
+    """
+    try:
+        for line in open('/proc/meminfo'):
+            if line.startswith('MemAvailable:'):
+                return int(line.split()[1]) * 1024
+    except IOError:
+        pass
+    try:
+        return os.sysconf('SC_AVPHYS_PAGES') * os.sysconf('SC_PAGE_SIZE')
+    except (ValueError, OSError, AttributeError):
+        return None
+
+def file_fingerprint(filename, header_size=1024*1024):
+    """
+    Return a dict with the name, size, mtime and the SHA1 hash of the
+    first `header_size` bytes (the header blocks) of `filename`.
+    """
+    st = os.stat(filename)
+    f = open(filename, 'rb')
+    try:
+        header_hash = hashlib.sha1(f.read(header_size)).hexdigest()
+    finally:
+        f.close()
+    return {
+        'filename': os.path.abspath(filename),
+        'size': st.st_size,
+        'mtime': int(st.st_mtime),
+        'header_sha1': header_hash,
+    }
     
\ No newline at end of file
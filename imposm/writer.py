@@ -12,10 +12,48 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from multiprocessing import Process, JoinableQueue
+import os
+import threading
+from multiprocessing import JoinableQueue
 
+from imposm.cache.tc import prefetch_file, resident_bytes
+from imposm.cache.report import disk_usage
 from imposm.dbimporter import NodeProcess, WayProcess, RelationProcess
-from imposm.util import create_pool, shutdown_pool
+from imposm.util import create_pool, shutdown_pool, available_memory
+
+class TaggedBatches(object):
+    """
+    Iterator over lists of up to `size` tagged elements of `elems`.
+    ``count`` is the number of all elements that were read so far.
+    """
+    def __init__(self, elems, size):
+        self.elems = iter(elems)
+        self.size = size
+        self.count = 0
+
+    def __iter__(self):
+        return self
+
+    def next(self):
+        batch = []
+        for elem in self.elems:
+            self.count += 1
+            if elem.tags:
+                batch.append(elem)
+                if len(batch) >= self.size:
+                    break
+        if not batch:
+            raise StopIteration
+        return batch
+
+def elem_batches(elem_cache, size):
+    """
+    Return an iterator over lists of tagged elements of `elem_cache`.
+    Uses the batch iteration of the cache (``iter_batches``), if available.
+    """
+    if hasattr(elem_cache, 'iter_batches'):
+        return elem_cache.iter_batches(size)
+    return TaggedBatches(elem_cache, size)
 
 class ImposmWriter(object):
     def __init__(self, mapping, db, cache, pool_size=2, logger=None, dry_run=False):
@@ -33,32 +71,62 @@ class ImposmWriter(object):
         importer = lambda: proc(queue, self.db, self.mapper, self.cache, self.dry_run, *proc_args)
         pool = create_pool(importer, pool_size)
 
-        data = []
-        for i, elem in enumerate(elem_cache):
-            if elem.tags:
-                data.append(elem)
-            if len(data) >= 128:
-                queue.put(data)
-                log.log(i)
-                data = []
-        queue.put(data)
+        batches = elem_batches(elem_cache, 128)
+        for data in batches:
+            queue.put(data)
+            log.log(batches.count)
 
         shutdown_pool(pool, queue)
         log.stop()
         self.cache.close_all()
 
+    def warmup(self, max_bytes=None):
+        """
+        Read the coords and ways caches into the page cache of the OS,
+        before the importer processes start with their random lookups.
+        All files are read in parallel, but only up to `max_bytes`
+        (default: half of the available memory), coords first. Only the
+        allocated blocks of sparse files (i.e. the flat coords cache)
+        are read and count for `max_bytes`.
+        """
+        if self.cache.in_memory:
+            return
+        if max_bytes is None:
+            max_bytes = available_memory()
+            if max_bytes is None:
+                self.logger.message('unknown available memory, skipping cache warm-up')
+                return
+            max_bytes //= 2
+
+        files = []
+        for fname in self.cache.warmup_fnames():
+            prefetch = min(disk_usage(fname), max_bytes)
+            max_bytes -= prefetch
+            if prefetch:
+                files.append((fname, prefetch))
+
+        resident = dict((fname, resident_bytes(fname)) for fname, _ in files)
+        readers = [threading.Thread(target=prefetch_file, args=(fname, prefetch))
+            for fname, prefetch in files]
+        for reader in readers:
+            reader.start()
+        for reader in readers:
+            reader.join()
+
+        mb = 1024 * 1024
+        for fname, prefetch in files:
+            before = resident[fname]
+            after = resident_bytes(fname)
+            self.logger.message('warm-up %s: %dMB of %dMB resident (+%dMB)' % (
+                os.path.basename(fname), after // mb, disk_usage(fname) // mb,
+                max(0, after - before) // mb))
+
     def relations(self):
         self.cache.remove_inserted_way_cache()
         cache = self.cache.relations_cache()
         log = self.logger('relations', len(cache))
-        inserted_way_queue = JoinableQueue()
-        way_marker = WayMarkerProcess(inserted_way_queue, self.cache, self.logger)
-        way_marker.start()
-
-        self._write_elem(RelationProcess, cache, log, self.pool_size, [inserted_way_queue])
-
-        inserted_way_queue.put(None)
-        way_marker.join()
+        self._write_elem(RelationProcess, cache, log, self.pool_size)
+        self.cache.merge_inserted_ways(processes=self.pool_size)
 
     def ways(self):
         cache = self.cache.ways_cache()
@@ -70,23 +138,3 @@ class ImposmWriter(object):
         cache = self.cache.nodes_cache()
         log = self.logger('nodes', len(cache))
         self._write_elem(NodeProcess, cache, log, self.pool_size)
-
-
-class WayMarkerProcess(Process):
-    def __init__(self, queue, cache, logger):
-        Process.__init__(self)
-        self.daemon = True
-        self.queue = queue
-        self.cache = cache
-        self.logger = logger
-
-    def run(self):
-        inserted_ways = self.cache.inserted_ways_cache('w')
-        while True:
-            osmid = self.queue.get()
-            if osmid is None:
-                break
-            inserted_ways.put(osmid)
-
-        inserted_ways.close()
-
@@ -41,40 +41,25 @@ class build_ext_with_cython(build_ext):
             print out
             raise DistutilsPlatformError("Failed to generate "
                 "C files with cython.")
-    def generate_protoc(self):
-        try:
-            if (os.path.exists('imposm/cache/internal.pb.cc') and 
-                os.path.getmtime('internal.proto') < os.path.getmtime('imposm/cache/internal.pb.cc')):
-                print 'imposm/cache/internal.pb.cc up to date'
-                return
-            print 'creating protofiles'
-            proc = subprocess.Popen(
-                ['protoc', '--cpp_out', 'imposm/cache/', 'internal.proto'],
-                stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
-        except OSError, ex:
-            if ex.errno == errno.ENOENT:
-                print ("Could not find protoc command. Make sure protobuf is "
-                    "installed and your PATH environment is set.")
-                raise DistutilsPlatformError("Failed to generate protbuf "
-                    "CPP files with protoc.")
-            else:
-                raise
-        out = proc.communicate()[0]
-        result = proc.wait()
-        if result != 0:
-            print "Error during protbuf files generation with protoc:"
-            print out
-            raise DistutilsPlatformError("Failed to generate protbuf "
-                "CPP files with protoc.")
+    def detect_lz4(self):
+        from distutils.ccompiler import new_compiler
+        from distutils.sysconfig import customize_compiler
+        compiler = new_compiler()
+        customize_compiler(compiler)
+        if not compiler.has_function('LZ4_compress_default',
+            includes=['lz4.h'], libraries=['lz4']):
+            print 'lz4 not found, building without lz4 cache compression'
+            return
+        print 'building with lz4 cache compression'
+        for ext in self.extensions:
+            if ext.name == 'imposm.cache.tc':
+                ext.define_macros.append(('IMPOSM_WITH_LZ4', None))
+                ext.libraries.append('lz4')
     def run(self):
-        self.generate_protoc()
-        try:
-            self.generate_c_file()
-        except DistutilsPlatformError:
-            if os.path.exists('imposm/cache/tc.c'):
-                print 'Found existing C file. Ignoring previous error.'
-            else:
-                raise
+        self.detect_lz4()
+        # tc.c is generated and not shipped, a stale copy would miss
+        # all newer classes of tc.pyx
+        self.generate_c_file()
         build_ext.run(self)
 
 import imposm.version
@@ -99,15 +84,14 @@ setup(
         "License :: OSI Approved :: Apache Software License",
         "Operating System :: OS Independent",
         "Programming Language :: C",
-        "Programming Language :: C++",
         "Programming Language :: Python :: 2.5",
         "Programming Language :: Python :: 2.6",
         "Programming Language :: Python :: 2.7",
         "Topic :: Scientific/Engineering :: GIS",
     ],
     ext_modules=[
-        Extension("imposm.cache.tc", ["imposm/cache/tc.c"], libraries = ["tokyocabinet"]),
-        Extension("imposm.cache.internal", ["imposm/cache/internal.cc", "imposm/cache/internal.pb.cc"], libraries = ["protobuf"]),
+        Extension("imposm.cache.tc", ["imposm/cache/tc.c"], libraries = ["tokyocabinet"],
+            depends=["imposm/cache/codec.h"]),
     ],
     entry_points = {
         'console_scripts': [